@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Cohort analytics for Treatment Tracker.
+
+    python -m analytics export --unlocks DIR --events DIR --nodes DIR --edges DIR --out cohort.npz
+    python -m analytics report cohort.npz [--csv out/] [--inactive-days 14]
+
+`export` streams table exports into a columnar .npz file; `report` prints per-node reach,
+time-to-unlock from root, inactivity stall points and per-edge drop-off from that file.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+
+from analytics import columnar, reports
+
+HOUR = 3600
+
+
+def _hours(seconds):
+    return '' if seconds != seconds else f'{seconds / HOUR:.1f}'  # NaN -> blank
+
+
+def _write_csv(path, header, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _print_table(header, rows, limit):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows[:limit])) if rows else len(str(h)) for i, h in enumerate(header)]
+    print('  '.join(str(h).ljust(w) for h, w in zip(header, widths)))
+    for row in rows[:limit]:
+        print('  '.join(str(v).ljust(w) for v, w in zip(row, widths)))
+    if len(rows) > limit:
+        print(f'... {len(rows) - limit} more rows')
+
+
+def cmd_export(args):
+    started = time.perf_counter()
+    counts = columnar.export(args.unlocks, args.events, args.nodes, args.edges, args.out)
+    print(f"Wrote {args.out} in {time.perf_counter() - started:.1f}s: "
+          + ', '.join(f'{v} {k}' for k, v in counts.items()))
+    return True
+
+
+def cmd_report(args):
+    started = time.perf_counter()
+    data = columnar.load(args.file)
+    keys = data['node_key']
+    titles = data['node_title']
+
+    reach = reports.reach_counts(data)
+    ttu = reports.time_to_unlock(data)
+    stalled = reports.stalled_at(data, now=args.now or int(time.time()), inactive_days=args.inactive_days)
+    drop = reports.edge_dropoff(data)
+
+    node_header = ['node_key', 'title', 'reached', 'p25_h', 'median_h', 'p75_h', 'p90_h', 'stalled_here']
+    node_rows = [
+        [keys[i], titles[i], int(reach[i]), *(_hours(ttu[q][i]) for q in reports.DEFAULT_QUANTILES), int(stalled[i])]
+        for i in sorted(range(len(reach)), key=lambda i: -reach[i])
+    ]
+    edge_header = ['parent_key', 'child_key', 'unlock_type', 'parent_reached', 'reached_both', 'dropoff_pct']
+    edge_rows = [
+        [keys[p], keys[c], columnar.UNLOCK_TYPES[t], int(drop['parent_reach'][i]), int(drop['both'][i]),
+         '' if drop['dropoff'][i] != drop['dropoff'][i] else f"{100 * drop['dropoff'][i]:.1f}"]
+        for i, (p, c, t) in enumerate(zip(data['edge_parent'], data['edge_child'], data['edge_type']))
+    ]
+    edge_rows.sort(key=lambda r: -(float(r[5]) if r[5] else -1))
+    elapsed = time.perf_counter() - started
+
+    if args.csv:
+        os.makedirs(args.csv, exist_ok=True)
+        _write_csv(os.path.join(args.csv, 'nodes.csv'), node_header, node_rows)
+        _write_csv(os.path.join(args.csv, 'edges.csv'), edge_header, edge_rows)
+        print(f'Wrote {args.csv}/nodes.csv and {args.csv}/edges.csv')
+    else:
+        print('PER-NODE REACH AND TIME FROM ROOT')
+        _print_table(node_header, node_rows, args.limit)
+        print()
+        print('EDGE DROP-OFF')
+        _print_table(edge_header, edge_rows, args.limit)
+    print(f"\n{len(data['unlock_user'])} unlocks, {len(data['user_ids'])} users, computed in {elapsed:.2f}s")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Treatment Tracker cohort analytics')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    export = sub.add_parser('export', help='Stream table exports into a columnar file')
+    export.add_argument('--unlocks', required=True, help='user_unlocked_nodes export (file or directory)')
+    export.add_argument('--events', required=True, help='user_events export (file or directory)')
+    export.add_argument('--nodes', required=True, help='nodes export (file or directory)')
+    export.add_argument('--edges', required=True, help='edges export (file or directory)')
+    export.add_argument('--out', default='cohort.npz', help='Output file (default: cohort.npz)')
+
+    report = sub.add_parser('report', help='Print cohort reports from a columnar file')
+    report.add_argument('file', help='File written by export')
+    report.add_argument('--csv', help='Write nodes.csv and edges.csv to this directory instead of printing')
+    report.add_argument('--inactive-days', type=int, default=14, help='Inactivity window for stall counts')
+    report.add_argument('--now', type=int, help='Reference time (epoch seconds) for stall counts')
+    report.add_argument('--limit', type=int, default=50, help='Rows to print per table')
+
+    args = parser.parse_args()
+    success = cmd_export(args) if args.command == 'export' else cmd_report(args)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+Stream exported DynamoDB items into a compact columnar file.
+
+Inputs are table exports, never the live tables: either DynamoDB point-in-time exports
+(DYNAMODB_JSON, one ``{"Item": {...}}`` per line, optionally gzipped) or plain JSON lines with one
+item per line. A path may be a single file or a directory, which is searched recursively.
+
+Node and user ids are dictionary-encoded to int32 while streaming, so the output holds integer
+columns plus one string table per id space.
+"""
+import gzip
+import io
+import json
+import os
+from array import array
+from datetime import datetime
+
+import numpy as np
+
+UNLOCK_TYPES = ('always', 'manual', 'symptom_match')
+UNLOCKED_BY = ('user', 'admin', 'system')
+
+
+def _iter_files(path):
+    if os.path.isfile(path):
+        yield path
+        return
+    for root, _dirs, files in os.walk(path):
+        for name in sorted(files):
+            if name.endswith(('.json', '.json.gz', '.jsonl', '.jsonl.gz')):
+                yield os.path.join(root, name)
+
+
+def _from_dynamodb_json(value):
+    """Decode one attribute value in DynamoDB JSON ({"S": "..."}, {"N": "1"}, ...)."""
+    (kind, raw), = value.items()
+    if kind == 'S':
+        return raw
+    if kind == 'N':
+        return float(raw) if any(c in raw for c in '.eE') else int(raw)
+    if kind == 'BOOL':
+        return raw
+    if kind == 'NULL':
+        return None
+    if kind == 'M':
+        return {k: _from_dynamodb_json(v) for k, v in raw.items()}
+    if kind == 'L':
+        return [_from_dynamodb_json(v) for v in raw]
+    if kind in ('SS', 'NS'):
+        return [_from_dynamodb_json({kind[0]: v}) for v in raw]
+    return raw
+
+
+def iter_items(path):
+    """Yield items one by one from every export file under path."""
+    for file_path in _iter_files(path):
+        opener = gzip.open if file_path.endswith('.gz') else open
+        with opener(file_path, 'rb') as raw:
+            for line in io.TextIOWrapper(raw, encoding='utf-8'):
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if 'Item' in record and isinstance(record['Item'], dict):
+                    yield {k: _from_dynamodb_json(v) for k, v in record['Item'].items()}
+                else:
+                    yield record
+
+
+def _epoch_seconds(iso):
+    if not iso:
+        return -1
+    return int(datetime.fromisoformat(iso.replace('Z', '+00:00')).timestamp())
+
+
+class _Encoder:
+    """Assigns dense integer codes to string ids in first-seen order."""
+
+    def __init__(self):
+        self.codes = {}
+
+    def __call__(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def table(self):
+        return np.array(list(self.codes), dtype=str)
+
+
+def _is_main_node(item):
+    """Node items of the main tree, from the trees table or a pre-migration nodes table export."""
+    if 'entity' in item:
+        return item['entity'] == 'node' and item.get('pk') == 'TREE#main'
+    return str(item.get('pk', '')).startswith('NODE#') and 'sk' not in item
+
+
+def export(unlocks_path, events_path, nodes_path, edges_path, out_path):
+    """Stream the four table exports into one compressed .npz file; returns row counts."""
+    node_ids = _Encoder()
+    user_ids = _Encoder()
+    event_types = _Encoder()
+
+    node_key, node_title, node_root = [], [], array('b')
+    for item in iter_items(nodes_path):
+        if not _is_main_node(item):
+            continue
+        code = node_ids(item['id'])
+        # Nodes arrive in export order; pad so columns stay indexable by code
+        while len(node_key) <= code:
+            node_key.append('')
+            node_title.append('')
+            node_root.append(0)
+        node_key[code] = item.get('key') or ''
+        node_title[code] = item.get('title') or ''
+        node_root[code] = 1 if item.get('is_root') else 0
+
+    edge_parent, edge_child, edge_type = array('i'), array('i'), array('b')
+    for item in iter_items(edges_path):
+        if not str(item.get('pk', '')).startswith('EDGE#'):
+            continue
+        edge_parent.append(node_ids(item['parent_id']))
+        edge_child.append(node_ids(item['child_id']))
+        edge_type.append(UNLOCK_TYPES.index(item.get('unlock_type', 'manual')))
+
+    unlock_user, unlock_node, unlock_ts, unlock_by = array('i'), array('i'), array('q'), array('b')
+    for item in iter_items(unlocks_path):
+        # The partition also holds frontier items; only UNLOCK# rows are unlocks
+        if not str(item.get('sk', '')).startswith('UNLOCK#'):
+            continue
+        unlock_user.append(user_ids(item['user_id']))
+        unlock_node.append(node_ids(item['node_id']))
+        unlock_ts.append(_epoch_seconds(item.get('unlocked_at')))
+        by = item.get('unlocked_by') or 'user'
+        unlock_by.append(UNLOCKED_BY.index(by) if by in UNLOCKED_BY else 0)
+
+    event_user, event_type, event_ts = array('i'), array('i'), array('q')
+    for item in iter_items(events_path):
+        if not str(item.get('sk', '')).startswith('EVENT#'):
+            continue
+        event_user.append(user_ids(item['user_id']))
+        event_type.append(event_types(item.get('type') or ''))
+        event_ts.append(_epoch_seconds(item.get('created_at')))
+
+    n_nodes = len(node_ids.codes)
+    pad = n_nodes - len(node_key)
+    node_key.extend([''] * pad)
+    node_title.extend([''] * pad)
+    node_root.extend([0] * pad)
+
+    np.savez_compressed(
+        out_path,
+        node_ids=node_ids.table(),
+        node_key=np.array(node_key, dtype=str),
+        node_title=np.array(node_title, dtype=str),
+        node_root=np.frombuffer(node_root, dtype=np.int8).astype(bool),
+        user_ids=user_ids.table(),
+        event_types=event_types.table(),
+        edge_parent=np.frombuffer(edge_parent, dtype=np.int32),
+        edge_child=np.frombuffer(edge_child, dtype=np.int32),
+        edge_type=np.frombuffer(edge_type, dtype=np.int8),
+        unlock_user=np.frombuffer(unlock_user, dtype=np.int32),
+        unlock_node=np.frombuffer(unlock_node, dtype=np.int32),
+        unlock_ts=np.frombuffer(unlock_ts, dtype=np.int64),
+        unlock_by=np.frombuffer(unlock_by, dtype=np.int8),
+        event_user=np.frombuffer(event_user, dtype=np.int32),
+        event_type=np.frombuffer(event_type, dtype=np.int32),
+        event_ts=np.frombuffer(event_ts, dtype=np.int64),
+    )
+    return {
+        'nodes': n_nodes,
+        'edges': len(edge_parent),
+        'users': len(user_ids.codes),
+        'unlocks': len(unlock_user),
+        'events': len(event_user),
+    }
+
+
+def load(path):
+    """Load a file written by export() as a dict of arrays."""
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
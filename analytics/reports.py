@@ -0,0 +1,114 @@
+"""
+Vectorized cohort reports over the arrays produced by columnar.export().
+
+Every report is a handful of whole-array NumPy operations (bincount, lexsort, searchsorted),
+so they scale with the number of unlock rows rather than with Python-level loops.
+"""
+import numpy as np
+
+DAY = 86400
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75, 0.9)
+
+
+def _unique_unlocks(data):
+    """(user, node) pairs, de-duplicated, as parallel arrays plus their timestamps."""
+    n_nodes = len(data['node_ids'])
+    keys = data['unlock_user'].astype(np.int64) * n_nodes + data['unlock_node']
+    keys, first = np.unique(keys, return_index=True)
+    return keys, data['unlock_user'][first], data['unlock_node'][first], data['unlock_ts'][first]
+
+
+def reach_counts(data):
+    """Number of distinct users who unlocked each node, indexed by node code."""
+    _keys, _users, nodes, _ts = _unique_unlocks(data)
+    return np.bincount(nodes, minlength=len(data['node_ids']))
+
+
+def time_to_unlock(data, quantiles=DEFAULT_QUANTILES):
+    """
+    Distribution, per node, of the seconds between a user's root unlock and their unlock of that node.
+    Returns {'count': int array, q: float array per quantile}; nodes nobody reached get NaN.
+    """
+    n_nodes = len(data['node_ids'])
+    n_users = len(data['user_ids'])
+    _keys, users, nodes, ts = _unique_unlocks(data)
+
+    # Earliest root unlock per user
+    never = np.iinfo(np.int64).max
+    root_ts = np.full(n_users, never, dtype=np.int64)
+    is_root = data['node_root'][nodes] & (ts >= 0)
+    np.minimum.at(root_ts, users[is_root], ts[is_root])
+
+    valid = (root_ts[users] != never) & (ts >= 0)
+    nodes = nodes[valid]
+    delta = ts[valid] - root_ts[users[valid]]
+
+    order = np.lexsort((delta, nodes))
+    delta = delta[order]
+    counts = np.bincount(nodes, minlength=n_nodes)
+    starts = np.cumsum(counts) - counts
+    reached = counts > 0
+
+    result = {'count': counts}
+    for q in quantiles:
+        values = np.full(n_nodes, np.nan)
+        idx = starts[reached] + np.floor((counts[reached] - 1) * q).astype(np.int64)
+        values[reached] = delta[idx]
+        result[q] = values
+    return result
+
+
+def edge_dropoff(data):
+    """
+    Per edge: users who reached the parent, users who reached both parent and child, and the share of
+    parent users who never reached the child. Arrays are indexed like data['edge_parent'].
+    """
+    n_nodes = len(data['node_ids'])
+    keys, users, nodes, _ts = _unique_unlocks(data)
+    parent, child = data['edge_parent'], data['edge_child']
+    reach = np.bincount(nodes, minlength=n_nodes)
+
+    # Users grouped by node, so each edge's child users are one contiguous slice
+    order = np.argsort(nodes, kind='stable')
+    users_by_node = users[order]
+    starts = np.cumsum(reach) - reach
+
+    lengths = reach[child]
+    edge_of_row = np.repeat(np.arange(len(child)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    child_users = users_by_node[starts[child][edge_of_row] + offsets]
+
+    # Did each of those users also unlock the edge's parent? keys is sorted, so binary search it
+    probe = child_users.astype(np.int64) * n_nodes + parent[edge_of_row]
+    pos = np.clip(np.searchsorted(keys, probe), 0, max(len(keys) - 1, 0))
+    found = keys[pos] == probe if len(keys) else np.zeros(len(probe), dtype=bool)
+    both = np.bincount(edge_of_row[found], minlength=len(child))
+
+    parent_reach = reach[parent]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dropoff = np.where(parent_reach > 0, 1 - both / parent_reach, np.nan)
+    return {'parent_reach': parent_reach, 'both': both, 'dropoff': dropoff}
+
+
+def stalled_at(data, now, inactive_days=14):
+    """
+    For users with no unlock or event in the last inactive_days, count the node they unlocked last:
+    where inactive patients stopped. Indexed by node code.
+    """
+    n_nodes = len(data['node_ids'])
+    n_users = len(data['user_ids'])
+    _keys, users, nodes, ts = _unique_unlocks(data)
+
+    last_activity = np.full(n_users, -1, dtype=np.int64)
+    np.maximum.at(last_activity, users, ts)
+    np.maximum.at(last_activity, data['event_user'], data['event_ts'])
+
+    # Last unlocked node per user: sort by (user, ts) and take each user's final row
+    order = np.lexsort((ts, users))
+    sorted_users = users[order]
+    is_last = np.append(sorted_users[1:] != sorted_users[:-1], True) if len(sorted_users) else np.array([], dtype=bool)
+    last_user = sorted_users[is_last]
+    last_node = nodes[order][is_last]
+
+    inactive = (last_activity[last_user] >= 0) & (last_activity[last_user] < now - inactive_days * DAY)
+    return np.bincount(last_node[inactive], minlength=n_nodes)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Synthetic data for scaling benchmarks.
+
+    python -m datagen --scale 100 --format jsonl --out data/x100
+    python -m datagen --scale 10 --format sql --out data/x10.sql
+    python -m datagen --scale 1000 --format dynamodb --endpoint http://localhost:8000
+
+--scale multiplies today's size (about 25 nodes, 10 symptoms, 50 patients); --nodes, --symptoms
+and --users override individual dimensions. The same --seed always produces the same data.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+
+from datagen.generate import Config, Generator
+from datagen.writers import DynamoDBLocalWriter, JsonlWriter, SqlWriter
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic Treatment Tracker data')
+    parser.add_argument('--scale', type=int, default=10, help='Multiple of today\'s size (e.g. 10, 100, 1000)')
+    parser.add_argument('--nodes', type=int, help='Override the node count')
+    parser.add_argument('--symptoms', type=int, help='Override the symptom count')
+    parser.add_argument('--users', type=int, help='Override the patient count')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--now', help='Reference time (ISO 8601) for timestamps; defaults to the current time')
+    parser.add_argument('--format', choices=['jsonl', 'sql', 'dynamodb'], default='jsonl')
+    parser.add_argument('--out', help='Output directory (jsonl) or file (sql)')
+    parser.add_argument('--gzip', action='store_true', help='Compress jsonl output')
+    parser.add_argument('--endpoint', default='http://localhost:8000', help='DynamoDB endpoint for --format dynamodb')
+    parser.add_argument('--table-prefix', default='treatment_tracker', help='Table prefix for --format dynamodb')
+    args = parser.parse_args()
+
+    now = datetime.fromisoformat(args.now.replace('Z', '+00:00')) if args.now else None
+    config = Config(scale=args.scale, nodes=args.nodes, symptoms=args.symptoms, users=args.users,
+                    seed=args.seed, now=now)
+
+    if args.format == 'jsonl':
+        writer = JsonlWriter(args.out or f'data/x{args.scale}', compress=args.gzip)
+    elif args.format == 'sql':
+        writer = SqlWriter(args.out or f'data/x{args.scale}.sql')
+    else:
+        writer = DynamoDBLocalWriter(args.endpoint, prefix=args.table_prefix)
+
+    print(f'Generating {config.nodes} nodes, {config.symptoms} symptoms, {config.users} patients (seed {config.seed})')
+    started = time.perf_counter()
+    generator = Generator(config)
+    try:
+        for table, row in generator.rows():
+            writer.write(table, row)
+    finally:
+        writer.close()
+
+    print(f'Done in {time.perf_counter() - started:.1f}s: '
+          + ', '.join(f'{count} {table}' for table, count in generator.counts.items()))
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,208 @@
+"""
+Synthetic tree and cohort generator.
+
+Rows are yielded as (table, row) pairs in a neutral shape (plain ids, ISO timestamps) and in
+dependency order: symptoms, nodes and their categories/videos, edges, then one user at a time with
+that user's unlocks, unlock frontier and events. Nothing is held in memory beyond the tree, so
+millions of unlock and event rows stream straight to the writer.
+"""
+import heapq
+import math
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+CATEGORIES = ('skincare', 'nutrition', 'oral_care', 'pain')
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Size of today's deployment; --scale multiplies these
+BASE_NODES = 25
+BASE_SYMPTOMS = 10
+BASE_USERS = 50
+
+
+@dataclass
+class Config:
+    scale: int = 1
+    nodes: Optional[int] = None
+    symptoms: Optional[int] = None
+    users: Optional[int] = None
+    seed: int = 1
+    now: Optional[datetime] = None
+    enrollment_days: int = 180
+    max_unlocks_per_user: int = 60
+    edge_mix: tuple = (0.3, 0.3, 0.4)  # always, manual, symptom_match
+    extra_parent_rate: float = 0.1
+
+    def __post_init__(self):
+        self.nodes = self.nodes or BASE_NODES * self.scale
+        self.symptoms = self.symptoms or min(BASE_SYMPTOMS * self.scale, 500)
+        self.users = self.users or BASE_USERS * self.scale
+        self.now = self.now or datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _iso(ts):
+    # Same shape as JavaScript's toISOString(), which the app writes
+    return datetime.fromtimestamp(ts, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.') + f'{int(ts * 1000) % 1000:03d}Z'
+
+
+class Generator:
+    def __init__(self, config):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.uuid = lambda: str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        self.node_ids = []
+        self.children = {}  # node index -> [(edge_id, child index, unlock_type, unlock_value, weight)]
+        self.counts = {}
+
+    def _emit(self, table, row):
+        self.counts[table] = self.counts.get(table, 0) + 1
+        return table, row
+
+    # ---------- Catalog ----------
+    def _symptoms(self):
+        self.symptom_keys = [f'symptom_{i:04d}' for i in range(self.config.symptoms)]
+        for key in self.symptom_keys:
+            yield self._emit('symptoms', {
+                'id': self.uuid(), 'key': key, 'label': key.replace('_', ' ').title(), 'description': None,
+            })
+
+    def _unlock_rule(self):
+        always, manual, _symptom = self.config.edge_mix
+        roll = self.rng.random()
+        if roll < always:
+            return 'always', None
+        if roll < always + manual:
+            return 'manual', None
+        keys = self.rng.sample(self.symptom_keys, k=min(len(self.symptom_keys), self.rng.randint(1, 3)))
+        return 'symptom_match', {self.rng.choice(('any', 'all')): keys}
+
+    def _tree(self):
+        n = self.config.nodes
+        category = [None] * n
+        created = self.config.now.timestamp() - 365 * DAY
+        for i in range(n):
+            node_id = self.uuid()
+            self.node_ids.append(node_id)
+            key = 'root' if i == 0 else f'node_{i:05d}'
+            if 1 <= i <= len(CATEGORIES):
+                category[i] = CATEGORIES[i - 1]
+            yield self._emit('nodes', {
+                'id': node_id, 'key': key, 'title': 'Start here' if i == 0 else f'Step {i}',
+                'summary': f'Synthetic node {i}.', 'is_root': i == 0, 'order_index': i,
+                'created_at': _iso(created),
+            })
+            yield self._emit('node_videos', {
+                'id': self.uuid(), 'node_id': node_id, 'title': f'Step {i} video', 'order_index': 0,
+                'video_url': f'https://vimeo.com/{100000000 + i}', 'created_at': _iso(created),
+            })
+
+        seen_pairs = set()
+        for i in range(1, n):
+            if i <= len(CATEGORIES):
+                parents = [0]
+            else:
+                # Biased towards recent nodes, so the tree grows deep rather than wide
+                parents = [max(1, int((i - 1) * (1 - self.rng.random() ** 3)))]
+                if self.rng.random() < self.config.extra_parent_rate:
+                    parents.append(self.rng.randrange(1, i))
+                category[i] = category[parents[0]]
+            for parent in parents:
+                if (parent, i) in seen_pairs:
+                    continue
+                seen_pairs.add((parent, i))
+                unlock_type, unlock_value = ('always', None) if parent == 0 else self._unlock_rule()
+                edge_id = self.uuid()
+                weight = self.rng.randint(0, 10)
+                self.children.setdefault(parent, []).append((edge_id, i, unlock_type, unlock_value, weight))
+                yield self._emit('edges', {
+                    'id': edge_id, 'parent_id': self.node_ids[parent], 'child_id': self.node_ids[i],
+                    'unlock_type': unlock_type, 'unlock_value': unlock_value, 'weight': weight,
+                    'description': f'Unlock step {i}', 'created_at': _iso(created),
+                })
+        for i in range(1, n):
+            yield self._emit('node_categories', {'node_id': self.node_ids[i], 'category': category[i]})
+
+    # ---------- Cohort ----------
+    def _user(self, index):
+        cfg = self.config
+        now = cfg.now.timestamp()
+        user_id = self.uuid()
+        enrolled = now - self.rng.random() * cfg.enrollment_days * DAY
+        yield self._emit('users', {
+            'id': user_id, 'email': f'patient{index:07d}@example.test', 'name': f'Patient {index}',
+            'is_admin': False, 'created_at': _iso(enrolled),
+        })
+
+        # How far this patient goes: each step beyond the cascade survives with this probability
+        persistence = self.rng.betavariate(4, 2)
+        unlocked = {0: enrolled}
+        rows = [(enrolled, 0, 'system', 'auto_root')]
+        queue = []  # (time, tiebreak, parent, edge)
+
+        def offer(parent, at):
+            for edge in self.children.get(parent, []):
+                heapq.heappush(queue, (at, self.rng.random(), parent, edge))
+
+        offer(0, enrolled)
+        while queue and len(rows) < cfg.max_unlocks_per_user:
+            at, _tie, _parent, (_edge_id, child, unlock_type, _value, _weight) = heapq.heappop(queue)
+            if child in unlocked:
+                continue
+            if unlock_type == 'always':
+                when, by, source = at + self.rng.uniform(0, 5), 'system', 'auto_always'
+            elif self.rng.random() < persistence:
+                mean = 48 * HOUR if unlock_type == 'manual' else 72 * HOUR
+                when = at + self.rng.expovariate(1 / mean)
+                by, source = ('user', 'patient_unlock') if unlock_type == 'manual' else ('user', 'symptom_unlock')
+            else:
+                continue
+            if when > now:
+                continue
+            unlocked[child] = when
+            rows.append((when, child, by, source))
+            offer(child, when)
+
+        for when, node, by, source in rows:
+            yield self._emit('user_unlocked_nodes', {
+                'id': self.uuid(), 'user_id': user_id, 'node_id': self.node_ids[node],
+                'unlocked_at': _iso(when), 'unlocked_by': by, 'source': source,
+            })
+        for parent in unlocked:
+            for edge_id, child, unlock_type, unlock_value, weight in self.children.get(parent, []):
+                if child in unlocked:
+                    continue
+                yield self._emit('frontier', {
+                    'user_id': user_id, 'node_id': self.node_ids[child], 'parent_id': self.node_ids[parent],
+                    'edge_id': edge_id, 'unlock_type': unlock_type, 'unlock_value': unlock_value,
+                    'description': f'Unlock step {child}', 'weight': weight,
+                })
+
+        yield self._emit('frontier_meta', {'user_id': user_id, 'built_at': _iso(now)})
+
+        # Events: a view per unlock, a symptom report per symptom unlock, logins every few days
+        last = max(unlocked.values())
+        for when, node, _by, source in rows:
+            yield self._emit('user_events', {
+                'id': self.uuid(), 'user_id': user_id, 'type': 'node_view',
+                'metadata': {'node_id': self.node_ids[node]}, 'created_at': _iso(when + 1),
+            })
+            if source == 'symptom_unlock':
+                yield self._emit('user_events', {
+                    'id': self.uuid(), 'user_id': user_id, 'type': 'symptom_report',
+                    'metadata': {'node_id': self.node_ids[node]}, 'created_at': _iso(when),
+                })
+        for k in range(math.ceil((last - enrolled) / (3 * DAY))):
+            yield self._emit('user_events', {
+                'id': self.uuid(), 'user_id': user_id, 'type': 'login', 'metadata': None,
+                'created_at': _iso(min(now, enrolled + k * 3 * DAY + self.rng.uniform(0, DAY))),
+            })
+
+    def rows(self):
+        yield from self._symptoms()
+        yield from self._tree()
+        for index in range(self.config.users):
+            yield from self._user(index)
@@ -0,0 +1,213 @@
+"""
+Sinks for generated rows: DynamoDB-shaped JSON lines, PostgreSQL inserts, or DynamoDB Local.
+
+The DynamoDB item shapes (pk/sk, GSI attributes, sharded keys, frontier items) mirror what
+lambda/operations.js writes, so the data can be read by the Lambda and by `python -m analytics export`.
+"""
+import gzip
+import json
+import os
+from decimal import Decimal
+
+KEY_SHARDS = 8
+MAIN_TREE = 'TREE#main'
+
+# Table name suffixes, as in lambda/dynamo.js
+DYNAMO_TABLES = {
+    'users': 'users',
+    'nodes': 'trees',
+    'node_categories': 'trees',
+    'node_videos': 'trees',
+    'edges': 'edges',
+    'symptoms': 'symptoms',
+    'user_unlocked_nodes': 'user_unlocked_nodes',
+    'frontier': 'user_unlocked_nodes',
+    'frontier_meta': 'user_unlocked_nodes',
+    'user_events': 'user_events',
+}
+
+
+def shard_of(value):
+    """FNV-1a over UTF-16 code units; must match shardOf() in lambda/operations.js."""
+    h = 0x811c9dc5
+    data = str(value if value is not None else '').encode('utf-16-le')
+    for i in range(0, len(data), 2):
+        h ^= data[i] | (data[i + 1] << 8)
+        h = (h * 0x01000193) & 0xffffffff
+    return h % KEY_SHARDS
+
+
+def shard_key(base, value):
+    return f'{base}#{shard_of(value)}'
+
+
+def dynamo_item(table, row):
+    """Add the key attributes operations.js would store for this row."""
+    if table == 'users':
+        return {'pk': f"USER#{row['id']}", 'gsi_pk': shard_key('EMAIL', row['email']), 'gsi_sk': row['email'], **row}
+    if table == 'nodes':
+        return {'pk': MAIN_TREE, 'sk': f"NODE#{row['id']}", 'entity': 'node',
+                'gsi_pk': shard_key('NODE_KEY', row['key']), 'gsi_sk': row['key'], **row, 'updated_at': row['created_at']}
+    if table == 'node_categories':
+        return {'pk': MAIN_TREE, 'sk': f"NODE#{row['node_id']}#CATEGORY#{row['category']}", 'entity': 'category', **row}
+    if table == 'node_videos':
+        return {'pk': MAIN_TREE, 'sk': f"NODE#{row['node_id']}#VIDEO#{row['id']}", 'entity': 'video',
+                **row, 'updated_at': row['created_at']}
+    if table == 'edges':
+        return {
+            'pk': f"EDGE#{row['id']}",
+            'gsi_child_pk': row['child_id'], 'gsi_child_sk': row['id'],
+            'gsi_parent_pk': row['parent_id'], 'gsi_parent_sk': row['id'],
+            'gsi_unlock_type_pk': row['unlock_type'], 'gsi_unlock_type_sk': row['id'],
+            **row,
+        }
+    if table == 'symptoms':
+        return {'pk': f"SYMPTOM#{row['id']}", 'gsi_pk': shard_key('SYMPTOM_KEY', row['key']), 'gsi_sk': row['key'], **row}
+    if table == 'user_unlocked_nodes':
+        return {
+            'pk': f"USER#{row['user_id']}", 'sk': f"UNLOCK#{row['node_id']}",
+            'gsi_pk': f"NODE#{row['node_id']}", 'gsi_sk': f"USER#{row['user_id']}", **row,
+        }
+    if table == 'frontier':
+        return {
+            'pk': f"USER#{row['user_id']}", 'sk': f"FRONTIER#{row['node_id']}#{row['edge_id']}",
+            'gsi_pk': f"EDGE#{row['edge_id']}", 'gsi_sk': f"USER#{row['user_id']}", **row,
+        }
+    if table == 'frontier_meta':
+        return {'pk': f"USER#{row['user_id']}", 'sk': 'FRONTIER_META', **row}
+    if table == 'user_events':
+        return {'pk': f"USER#{row['user_id']}", 'sk': f"EVENT#{row['created_at']}#{row['id']}", **row}
+    raise ValueError(f'Unknown table: {table}')
+
+
+class JsonlWriter:
+    """One <table>.jsonl(.gz) file per DynamoDB table under out_dir."""
+
+    def __init__(self, out_dir, compress=False):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.compress = compress
+        self.files = {}
+
+    def _file(self, name):
+        if name not in self.files:
+            path = os.path.join(self.out_dir, f"{name}.jsonl{'.gz' if self.compress else ''}")
+            self.files[name] = gzip.open(path, 'wt', encoding='utf-8') if self.compress else open(path, 'w', encoding='utf-8')
+        return self.files[name]
+
+    def write(self, table, row):
+        name = DYNAMO_TABLES[table]
+        self._file(name).write(json.dumps(dynamo_item(table, row), separators=(',', ':')) + '\n')
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def _sql_literal(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class SqlWriter:
+    """PostgreSQL inserts against db/schema.sql, in multi-row statements."""
+
+    COLUMNS = {
+        'users': ('id', 'email', 'name', 'created_at'),
+        'symptoms': ('id', 'key', 'label', 'description'),
+        'nodes': ('id', 'key', 'title', 'summary', 'video_url', 'is_root', 'order_index', 'created_at'),
+        'edges': ('id', 'parent_id', 'child_id', 'unlock_type', 'unlock_value', 'created_at'),
+        'user_unlocked_nodes': ('id', 'user_id', 'node_id', 'unlocked_at', 'unlocked_by', 'source'),
+        'user_events': ('id', 'user_id', 'type', 'metadata', 'created_at'),
+    }
+    # Flush order respects the foreign keys
+    ORDER = ('symptoms', 'nodes', 'edges', 'users', 'user_unlocked_nodes', 'user_events')
+
+    def __init__(self, path, batch=1000):
+        self.f = open(path, 'w', encoding='utf-8')
+        self.batch = batch
+        self.buffers = {table: [] for table in self.ORDER}
+        self.pending_node = None
+        self.f.write('-- Generated by python -m datagen; load into a schema created from db/schema.sql\nbegin;\n')
+
+    def write(self, table, row):
+        if table == 'node_videos':
+            # schema.sql keeps a single video_url on the node; the generator yields it right after its node
+            if self.pending_node is not None and self.pending_node['id'] == row['node_id']:
+                self.pending_node['video_url'] = row['video_url']
+            return
+        # A node is only buffered once its video has had the chance to arrive, so no batch goes out without it
+        self._release_node()
+        if table == 'nodes':
+            self.pending_node = dict(row, video_url=None)
+            return
+        if table not in self.buffers:
+            return  # DynamoDB-only shapes (frontier, categories)
+        self._buffer(table, row)
+
+    def _buffer(self, table, row):
+        self.buffers[table].append(row)
+        if len(self.buffers[table]) >= self.batch:
+            self.flush()
+
+    def _release_node(self):
+        if self.pending_node is not None:
+            node, self.pending_node = self.pending_node, None
+            self._buffer('nodes', node)
+
+    def flush(self):
+        for table in self.ORDER:
+            rows = self.buffers[table]
+            if not rows:
+                continue
+            cols = self.COLUMNS[table]
+            values = ',\n  '.join('(' + ', '.join(_sql_literal(r.get(c)) for c in cols) + ')' for r in rows)
+            self.f.write(f"insert into public.{table} ({', '.join(cols)}) values\n  {values};\n")
+            self.buffers[table] = []
+
+    def close(self):
+        self._release_node()
+        self.flush()
+        self.f.write('commit;\n')
+        self.f.close()
+
+
+class DynamoDBLocalWriter:
+    """Batch-writes straight into DynamoDB Local (or any endpoint) using the app's table names."""
+
+    def __init__(self, endpoint, prefix='treatment_tracker', region='us-east-1'):
+        try:
+            import boto3
+        except ImportError as exc:
+            raise SystemExit('--format dynamodb needs boto3: pip install -r datagen/requirements.txt') from exc
+        self.resource = boto3.resource(
+            'dynamodb',
+            endpoint_url=endpoint,
+            region_name=region,
+            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'local'),
+            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'local'),
+        )
+        self.prefix = prefix
+        self.batches = {}
+
+    def _batch(self, name):
+        if name not in self.batches:
+            self.batches[name] = self.resource.Table(f'{self.prefix}_{name}').batch_writer()
+        return self.batches[name]
+
+    def write(self, table, row):
+        name = DYNAMO_TABLES[table]
+        # boto3 rejects floats; DynamoDB numbers go through Decimal
+        item = json.loads(json.dumps(dynamo_item(table, row)), parse_float=Decimal)
+        self._batch(name).put_item(Item=item)
+
+    def close(self):
+        for batch in self.batches.values():
+            batch.__exit__(None, None, None)
@@ -36,29 +36,11 @@ run_aws \
   ]' \
   --billing-mode PAY_PER_REQUEST
 
-# --- 2. treatment_tracker_nodes (pk only, GSI: gsi_key) ---
+# --- 2. treatment_tracker_trees (pk + sk, GSI: gsi_key) ---
+# One item collection per tree (TREE#main, TREE#intro) holding nodes, their videos and categories.
+# Existing deployments: create this table, deploy the Lambda, then invoke MigrateTreeCollections.
 run_aws \
-  --table-name treatment_tracker_nodes \
-  --attribute-definitions \
-    AttributeName=pk,AttributeType=S \
-    AttributeName=gsi_pk,AttributeType=S \
-    AttributeName=gsi_sk,AttributeType=S \
-  --key-schema AttributeName=pk,KeyType=HASH \
-  --global-secondary-indexes '[
-    {
-      "IndexName": "gsi_key",
-      "KeySchema": [
-        {"AttributeName": "gsi_pk", "KeyType": "HASH"},
-        {"AttributeName": "gsi_sk", "KeyType": "RANGE"}
-      ],
-      "Projection": {"ProjectionType": "ALL"}
-    }
-  ]' \
-  --billing-mode PAY_PER_REQUEST
-
-# --- 3. treatment_tracker_node_categories (pk + sk, optional GSI: gsi_category) ---
-run_aws \
-  --table-name treatment_tracker_node_categories \
+  --table-name treatment_tracker_trees \
   --attribute-definitions \
     AttributeName=pk,AttributeType=S \
     AttributeName=sk,AttributeType=S \
@@ -67,7 +49,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --global-secondary-indexes '[
     {
-      "IndexName": "gsi_category",
+      "IndexName": "gsi_key",
       "KeySchema": [
         {"AttributeName": "gsi_pk", "KeyType": "HASH"},
         {"AttributeName": "gsi_sk", "KeyType": "RANGE"}
@@ -77,16 +59,7 @@ run_aws \
   ]' \
   --billing-mode PAY_PER_REQUEST
 
-# --- 4. treatment_tracker_node_videos (pk + sk, no GSI) ---
-run_aws \
-  --table-name treatment_tracker_node_videos \
-  --attribute-definitions \
-    AttributeName=pk,AttributeType=S \
-    AttributeName=sk,AttributeType=S \
-  --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
-  --billing-mode PAY_PER_REQUEST
-
-# --- 5. treatment_tracker_edges (pk only, GSIs: gsi_child, gsi_parent, gsi_unlock_type; each GSI has its own key attrs) ---
+# --- 3. treatment_tracker_edges (pk only, GSIs: gsi_child, gsi_parent, gsi_unlock_type; each GSI has its own key attrs) ---
 run_aws \
   --table-name treatment_tracker_edges \
   --attribute-definitions \
@@ -126,7 +99,7 @@ run_aws \
   ]' \
   --billing-mode PAY_PER_REQUEST
 
-# --- 6. treatment_tracker_symptoms (pk only, GSI: gsi_key) ---
+# --- 4. treatment_tracker_symptoms (pk only, GSI: gsi_key) ---
 run_aws \
   --table-name treatment_tracker_symptoms \
   --attribute-definitions \
@@ -146,7 +119,7 @@ run_aws \
   ]' \
   --billing-mode PAY_PER_REQUEST
 
-# --- 7. treatment_tracker_user_unlocked_nodes (pk + sk, optional GSI: gsi_node) ---
+# --- 5. treatment_tracker_user_unlocked_nodes (pk + sk, GSI: gsi_node for the edge -> frontier sync) ---
 run_aws \
   --table-name treatment_tracker_user_unlocked_nodes \
   --attribute-definitions \
@@ -167,7 +140,7 @@ run_aws \
   ]' \
   --billing-mode PAY_PER_REQUEST
 
-# --- 8. treatment_tracker_user_events (pk + sk, no GSI) ---
+# --- 6. treatment_tracker_user_events (pk + sk, no GSI) ---
 run_aws \
   --table-name treatment_tracker_user_events \
   --attribute-definitions \
@@ -176,7 +149,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 9. treatment_tracker_category_videos (pk + sk) ---
+# --- 7. treatment_tracker_category_videos (pk + sk) ---
 run_aws \
   --table-name treatment_tracker_category_videos \
   --attribute-definitions \
@@ -185,7 +158,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 10. treatment_tracker_category_positions (pk + sk) ---
+# --- 8. treatment_tracker_category_positions (pk + sk) ---
 run_aws \
   --table-name treatment_tracker_category_positions \
   --attribute-definitions \
@@ -194,7 +167,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 11. treatment_tracker_symptom_positions (pk + sk) ---
+# --- 9. treatment_tracker_symptom_positions (pk + sk) ---
 run_aws \
   --table-name treatment_tracker_symptom_positions \
   --attribute-definitions \
@@ -203,7 +176,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 12. treatment_tracker_bonus_content_videos (pk + sk) ---
+# --- 10. treatment_tracker_bonus_content_videos (pk + sk) ---
 run_aws \
   --table-name treatment_tracker_bonus_content_videos \
   --attribute-definitions \
@@ -212,7 +185,7 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 13. treatment_tracker_bonus_content_positions (pk + sk) ---
+# --- 11. treatment_tracker_bonus_content_positions (pk + sk) ---
 run_aws \
   --table-name treatment_tracker_bonus_content_positions \
   --attribute-definitions \
@@ -221,33 +194,4 @@ run_aws \
   --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
   --billing-mode PAY_PER_REQUEST
 
-# --- 14. treatment_tracker_introduction_tree_nodes (pk only, GSI: gsi_node_key) ---
-run_aws \
-  --table-name treatment_tracker_introduction_tree_nodes \
-  --attribute-definitions \
-    AttributeName=pk,AttributeType=S \
-    AttributeName=gsi_pk,AttributeType=S \
-    AttributeName=gsi_sk,AttributeType=S \
-  --key-schema AttributeName=pk,KeyType=HASH \
-  --global-secondary-indexes '[
-    {
-      "IndexName": "gsi_node_key",
-      "KeySchema": [
-        {"AttributeName": "gsi_pk", "KeyType": "HASH"},
-        {"AttributeName": "gsi_sk", "KeyType": "RANGE"}
-      ],
-      "Projection": {"ProjectionType": "ALL"}
-    }
-  ]' \
-  --billing-mode PAY_PER_REQUEST
-
-# --- 15. treatment_tracker_introduction_tree_node_videos (pk + sk) ---
-run_aws \
-  --table-name treatment_tracker_introduction_tree_node_videos \
-  --attribute-definitions \
-    AttributeName=pk,AttributeType=S \
-    AttributeName=sk,AttributeType=S \
-  --key-schema AttributeName=pk,KeyType=HASH AttributeName=sk,KeyType=RANGE \
-  --billing-mode PAY_PER_REQUEST
-
-echo "All 15 DynamoDB tables created successfully."
+echo "All 11 DynamoDB tables created successfully."
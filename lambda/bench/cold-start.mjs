@@ -0,0 +1,157 @@
+#!/usr/bin/env node
+/**
+ * Cold-start benchmark for the Lambda handler.
+ *
+ * Every sample runs in a fresh Node process, so it pays the same module loading and client setup as a
+ * Lambda cold start: "init" is the time to import the handler, "first" the latency of the first
+ * invocation and "warm" of the one after it. Each action from bench/actions.json is measured against
+ * three targets:
+ *   baseline  the handler as it was before the bundle and the lazy client (eager SDK import and client
+ *             construction), checked out from git into a temporary directory
+ *   source    the current unbundled handler (index.js)
+ *   bundle    the current bundle (dist/lambda/index.mjs), if it has been built
+ * The baseline predates the trees table and some actions, so compare "init" across all three; "first"
+ * and "warm" are only comparable for actions that return no errors on every target.
+ *
+ * For reproducible numbers run it against DynamoDB Local rather than AWS:
+ *   docker run -p 8000:8000 amazon/dynamodb-local
+ *   DYNAMODB_ENDPOINT=http://localhost:8000 npm run bench -- --runs 20
+ *
+ * Options:
+ *   --runs <n>          samples per action and target (default 10)
+ *   --actions <a,b>     only these actions
+ *   --target <name>     only "baseline", "source" or "bundle"
+ *   --baseline <ref>    git revision to take the baseline handler from (default: the parent of the
+ *                       commit that added build.mjs)
+ *   --out <file>        also write the raw summary as JSON
+ */
+import { spawnSync } from 'node:child_process';
+import { existsSync, readFileSync, writeFileSync, mkdirSync, mkdtempSync, rmSync, symlinkSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { dirname, join } from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+const root = join(dirname(fileURLToPath(import.meta.url)), '..');
+
+function parseArgs(argv) {
+  const args = { runs: 10, actions: null, target: null, baseline: null, out: null };
+  for (let i = 0; i < argv.length; i++) {
+    const next = () => argv[++i];
+    if (argv[i] === '--runs') args.runs = Number(next());
+    else if (argv[i] === '--actions') args.actions = next().split(',');
+    else if (argv[i] === '--target') args.target = next();
+    else if (argv[i] === '--baseline') args.baseline = next();
+    else if (argv[i] === '--out') args.out = next();
+  }
+  return args;
+}
+
+// Runs in the child process; prints one JSON line with the three timings
+const SAMPLE = `
+const [url, action, params] = JSON.parse(process.argv[1]);
+const t0 = performance.now();
+const { handler } = await import(url);
+const t1 = performance.now();
+const event = { body: JSON.stringify({ action, params }) };
+const first = await handler(event, {});
+const t2 = performance.now();
+await handler(event, {});
+const t3 = performance.now();
+console.log(JSON.stringify({ init: t1 - t0, first: t2 - t1, warm: t3 - t2, status: first.statusCode }));
+`;
+
+function git(...argv) {
+  const res = spawnSync('git', argv, { cwd: root, encoding: 'utf8', maxBuffer: 64 * 1024 * 1024 });
+  if (res.status !== 0) throw new Error(`git ${argv[0]} failed: ${res.stderr}`);
+  return res.stdout;
+}
+
+/** Check out lambda/ at `ref` into a temporary directory, sharing this checkout's node_modules. */
+function checkoutBaseline(ref) {
+  const rev = ref ?? `${git('log', '--diff-filter=A', '--format=%H', '-1', '--', 'build.mjs').trim()}^`;
+  const dir = mkdtempSync(join(tmpdir(), 'lambda-baseline-'));
+  const archive = spawnSync('git', ['archive', '--format=tar', rev, '.'], { cwd: root, maxBuffer: 64 * 1024 * 1024 });
+  if (archive.status !== 0) throw new Error(`git archive ${rev} failed: ${archive.stderr}`);
+  const untar = spawnSync('tar', ['-x', '-C', dir], { input: archive.stdout });
+  if (untar.status !== 0) throw new Error(`extracting ${rev} failed: ${untar.stderr}`);
+  symlinkSync(join(root, 'node_modules'), join(dir, 'node_modules'), 'dir');
+  return { dir, rev };
+}
+
+function sample(url, action, params) {
+  const env = { ...process.env };
+  if (env.DYNAMODB_ENDPOINT) {
+    // The baseline handler ignores DYNAMODB_ENDPOINT; the SDK's own variable points it at the same place
+    env.AWS_ENDPOINT_URL_DYNAMODB ??= env.DYNAMODB_ENDPOINT;
+    // DynamoDB Local accepts any credentials, but the SDK still insists on having some
+    env.AWS_REGION ??= 'us-east-1';
+    env.AWS_ACCESS_KEY_ID ??= 'local';
+    env.AWS_SECRET_ACCESS_KEY ??= 'local';
+  }
+  const res = spawnSync(process.execPath, ['--input-type=module', '-e', SAMPLE, JSON.stringify([url, action, params])], {
+    env,
+    encoding: 'utf8',
+  });
+  if (res.status !== 0) throw new Error(`sample failed for ${action}: ${res.stderr}`);
+  return JSON.parse(res.stdout.trim().split('\n').pop());
+}
+
+const percentile = (values, p) => {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+function summarize(samples) {
+  const out = {};
+  for (const key of ['init', 'first', 'warm']) {
+    const values = samples.map((s) => s[key]);
+    out[key] = { p50: percentile(values, 50), p90: percentile(values, 90) };
+  }
+  out.errors = samples.filter((s) => s.status !== 200).length;
+  return out;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const fixtures = JSON.parse(readFileSync(join(root, 'bench', 'actions.json'), 'utf8'));
+const actions = args.actions ?? Object.keys(fixtures);
+
+const baseline = !args.target || args.target === 'baseline' ? checkoutBaseline(args.baseline) : null;
+if (baseline) console.log(`baseline: lambda/ at ${baseline.rev}`);
+process.on('exit', () => baseline && rmSync(baseline.dir, { recursive: true, force: true }));
+
+const targets = [
+  ...(baseline ? [{ name: 'baseline', file: join(baseline.dir, 'index.js') }] : []),
+  { name: 'source', file: join(root, 'index.js') },
+  { name: 'bundle', file: join(root, 'dist', 'lambda', 'index.mjs') },
+].filter((t) => (!args.target || t.name === args.target) && existsSync(t.file));
+if (!targets.some((t) => t.name === 'bundle') && (!args.target || args.target === 'bundle')) {
+  console.warn('dist/lambda/index.mjs not found; run `npm run build` to benchmark the bundle as well.');
+}
+
+const results = {};
+for (const target of targets) {
+  results[target.name] = {};
+  for (const action of actions) {
+    const samples = [];
+    for (let i = 0; i < args.runs; i++) {
+      samples.push(sample(pathToFileURL(target.file).href, action, fixtures[action] ?? {}));
+    }
+    results[target.name][action] = summarize(samples);
+  }
+}
+
+const ms = (v) => v.toFixed(1).padStart(8);
+console.log(`\n${'target'.padEnd(8)} ${'action'.padEnd(22)} ${'init p50'.padStart(8)} ${'init p90'.padStart(8)} ${'1st p50'.padStart(8)} ${'1st p90'.padStart(8)} ${'warm p50'.padStart(8)} errors`);
+for (const [target, byAction] of Object.entries(results)) {
+  for (const [action, r] of Object.entries(byAction)) {
+    console.log(`${target.padEnd(8)} ${action.padEnd(22)} ${ms(r.init.p50)} ${ms(r.init.p90)} ${ms(r.first.p50)} ${ms(r.first.p90)} ${ms(r.warm.p50)} ${String(r.errors).padStart(6)}`);
+  }
+}
+if (!process.env.DYNAMODB_ENDPOINT) {
+  console.log('\nDYNAMODB_ENDPOINT is not set: invocations went to AWS (or failed without credentials).');
+}
+
+if (args.out) {
+  mkdirSync(dirname(args.out), { recursive: true });
+  writeFileSync(args.out, JSON.stringify({ runs: args.runs, node: process.version, baseline: baseline?.rev ?? null, results }, null, 2));
+}
@@ -0,0 +1,27 @@
+import { build } from 'esbuild';
+
+// Bundles the handler with the AWS SDK into a single minified ESM file. Shipping our own,
+// tree-shaken copy of the SDK is faster to load than the runtime-provided one, which is resolved
+// module by module from disk on every cold start.
+// The bundle sits at lambda/index.mjs inside the zip, where the unbundled lambda/index.js used to be,
+// so the function's handler setting stays lambda/index.handler.
+await build({
+  entryPoints: ['index.js'],
+  outfile: 'dist/lambda/index.mjs',
+  bundle: true,
+  minify: true,
+  treeShaking: true,
+  platform: 'node',
+  target: 'node20',
+  format: 'esm',
+  mainFields: ['module', 'main'],
+  legalComments: 'none',
+  metafile: true,
+  // Some SDK dependencies are CommonJS and call require() for Node built-ins
+  banner: {
+    js: "import { createRequire } from 'node:module'; const require = createRequire(import.meta.url);",
+  },
+}).then(({ metafile }) => {
+  const { bytes } = metafile.outputs['dist/lambda/index.mjs'];
+  console.log(`dist/lambda/index.mjs ${(bytes / 1024).toFixed(1)} KiB`);
+});
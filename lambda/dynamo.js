@@ -1,15 +1,37 @@
+import { Agent as HttpAgent } from 'node:http';
+import { Agent as HttpsAgent } from 'node:https';
 import { DynamoDBClient } from '@aws-sdk/client-dynamodb';
 import { DynamoDBDocumentClient } from '@aws-sdk/lib-dynamodb';
 
-const client = new DynamoDBClient({});
-export const doc = DynamoDBDocumentClient.from(client);
+// The client is built on the first send rather than at import, so module init stays cheap and
+// invocations that fail validation never resolve credentials. The keep-alive agents let every warm
+// invocation reuse the TLS connection opened by the first one.
+let client = null;
+
+function getClient() {
+  if (!client) {
+    client = DynamoDBDocumentClient.from(new DynamoDBClient({
+      // Lets the local benchmark (and DynamoDB Local) point the Lambda at another endpoint
+      ...(process.env.DYNAMODB_ENDPOINT ? { endpoint: process.env.DYNAMODB_ENDPOINT } : {}),
+      requestHandler: {
+        httpAgent: new HttpAgent({ keepAlive: true, maxSockets: 50 }),
+        httpsAgent: new HttpsAgent({ keepAlive: true, maxSockets: 50 }),
+        connectionTimeout: 1000,
+      },
+    }));
+  }
+  return client;
+}
+
+export const doc = {
+  send: (command) => getClient().send(command),
+};
 
 const prefix = process.env.TABLE_PREFIX || 'treatment_tracker';
 export const tables = {
   users: `${prefix}_users`,
-  nodes: `${prefix}_nodes`,
-  nodeCategories: `${prefix}_node_categories`,
-  nodeVideos: `${prefix}_node_videos`,
+  // Nodes, videos and categories of both trees, one item collection per tree
+  trees: `${prefix}_trees`,
   edges: `${prefix}_edges`,
   symptoms: `${prefix}_symptoms`,
   userUnlockedNodes: `${prefix}_user_unlocked_nodes`,
@@ -19,6 +41,10 @@ export const tables = {
   symptomPositions: `${prefix}_symptom_positions`,
   bonusContentVideos: `${prefix}_bonus_content_videos`,
   bonusContentPositions: `${prefix}_bonus_content_positions`,
+  // Per-entity tables from before the trees table; only read by MigrateTreeCollections
+  nodes: `${prefix}_nodes`,
+  nodeCategories: `${prefix}_node_categories`,
+  nodeVideos: `${prefix}_node_videos`,
   introTreeNodes: `${prefix}_introduction_tree_nodes`,
   introTreeNodeVideos: `${prefix}_introduction_tree_node_videos`,
 };
@@ -1,3 +1,4 @@
+import { once } from 'node:events';
 import * as ops from './operations.js';
 
 const ACTIONS = {
@@ -18,7 +19,9 @@ const ACTIONS = {
   GetNodeByKey: (p) => ops.getNodeByKey(p.key),
   GetNodeById: (p) => ops.getNodeById(p.id),
   ListNodes: () => ops.listNodes(),
+  GetTree: () => ops.getTree(),
   PutNode: (p) => ops.putNode(p),
+  DeleteNode: (p) => ops.deleteNode(p.nodeId),
 
   // Node categories & videos
   ListCategoriesByNode: (p) => ops.listCategoriesByNode(p.nodeId),
@@ -30,6 +33,7 @@ const ACTIONS = {
   // Edges
   ListEdges: () => ops.listEdges(),
   GetEdgesByChild: (p) => ops.getEdgesByChild(p.childId),
+  GetEdgesByParent: (p) => ops.getEdgesByParent(p.parentId),
   GetEdgesByUnlockType: (p) => ops.getEdgesByUnlockType(p.unlockType),
   PutEdge: (p) => ops.putEdge(p),
   DeleteEdge: (p) => ops.deleteEdge(p.edgeId),
@@ -44,6 +48,11 @@ const ACTIONS = {
   GetUnlock: (p) => ops.getUnlock(p.userId, p.nodeId),
   InsertUnlocks: (p) => ops.insertUnlocks(p.rows),
   DeleteUnlocksByUser: (p) => ops.deleteUnlocksByUser(p.userId),
+  ListFrontierByUser: (p) => ops.listFrontierByUser(p.userId),
+  GetFrontierForNode: (p) => ops.getFrontierForNode(p.userId, p.nodeId),
+  GetUserOverlay: (p) => ops.getUserOverlay(p.userId),
+  RebuildFrontier: (p) => ops.rebuildFrontier(p.userId),
+  UnlockNode: (p) => ops.unlockNode(p.userId, p.nodeId, { unlockedBy: p.unlockedBy, source: p.source }),
 
   // Events
   InsertUserEvent: (p) => ops.insertUserEvent(p.userId, p.type, p.metadata),
@@ -69,6 +78,7 @@ const ACTIONS = {
   PutBonusContentPosition: (p) => ops.putBonusContentPosition(p.record),
 
   // Introduction tree
+  GetIntroTree: () => ops.getIntroTree(),
   ListIntroTreeNodes: () => ops.listIntroTreeNodes(),
   GetIntroNodeByKey: (p) => ops.getIntroNodeByKey(p.nodeKey),
   PutIntroTreeNode: (p) => ops.putIntroTreeNode(p.node),
@@ -76,61 +86,110 @@ const ACTIONS = {
   ListIntroTreeNodeVideos: (p) => ops.listIntroTreeNodeVideos(p.nodeId),
   PutIntroTreeNodeVideo: (p) => ops.putIntroTreeNodeVideo(p.nodeId, p.video),
   DeleteIntroTreeNodeVideo: (p) => ops.deleteIntroTreeNodeVideo(p.nodeId, p.videoId),
+
+  // Maintenance
+  MigrateShardedKeys: () => ops.migrateShardedKeys(),
+  MigrateTreeCollections: () => ops.migrateTreeCollections(),
+  MigrateFrontiers: (p) => ops.migrateFrontiers(p),
+};
+
+// Actions that can also answer as newline-delimited JSON when the body sets "stream": true.
+// Items are written as each DynamoDB page arrives, one per line; the last line is a trailer,
+// {"$done":true,"count":n} on success or {"$error":"..."} if the scan failed part way.
+const STREAMS = {
+  ListUsers: () => ops.streamUsers(),
+  ListAllUnlocks: () => ops.streamAllUnlocks(),
+  ListNodes: () => ops.streamNodes(),
+  ListEdges: () => ops.streamEdges(),
+};
+
+const HEADERS = {
+  'Content-Type': 'application/json',
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'Content-Type, Authorization',
 };
 
-export async function handler(event, context) {
-  const headers = {
-    'Content-Type': 'application/json',
-    'Access-Control-Allow-Origin': '*',
-    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
-  };
+const NDJSON_HEADERS = { ...HEADERS, 'Content-Type': 'application/x-ndjson' };
+
+function reply(statusCode, payload) {
+  return { statusCode, headers: HEADERS, body: JSON.stringify(payload) };
+}
+
+async function* ndjsonChunks(pages) {
+  let count = 0;
+  try {
+    for await (const items of pages) {
+      count += items.length;
+      yield items.map((item) => JSON.stringify(item) + '\n').join('');
+    }
+    yield JSON.stringify({ $done: true, count }) + '\n';
+  } catch (err) {
+    // The 200 status has already gone out, so the failure can only be reported in-band.
+    console.error('Lambda stream error:', err);
+    yield JSON.stringify({ $error: err.message || 'Internal server error' }) + '\n';
+  }
+}
 
+/** Resolve a request to a JSON response, or for streamed actions to { statusCode, headers, chunks }. */
+async function route(event) {
   let body;
   try {
     const raw = typeof event.body === 'string' ? event.body : (event.body && JSON.stringify(event.body)) || '{}';
     body = JSON.parse(raw);
   } catch {
-    return {
-      statusCode: 400,
-      headers,
-      body: JSON.stringify({ success: false, error: 'Invalid JSON body' }),
-    };
+    return reply(400, { success: false, error: 'Invalid JSON body' });
   }
 
-  const { action, params = {} } = body;
+  const { action, params = {}, stream = false } = body;
   if (!action || typeof action !== 'string') {
-    return {
-      statusCode: 400,
-      headers,
-      body: JSON.stringify({ success: false, error: 'Missing or invalid "action"' }),
-    };
+    return reply(400, { success: false, error: 'Missing or invalid "action"' });
+  }
+
+  if (stream) {
+    const open = STREAMS[action];
+    if (!open) {
+      return reply(400, { success: false, error: `Action cannot be streamed: ${action}` });
+    }
+    return { statusCode: 200, headers: NDJSON_HEADERS, chunks: ndjsonChunks(open(params)) };
   }
 
   const fn = ACTIONS[action];
   if (!fn) {
-    return {
-      statusCode: 400,
-      headers,
-      body: JSON.stringify({ success: false, error: `Unknown action: ${action}` }),
-    };
+    return reply(400, { success: false, error: `Unknown action: ${action}` });
   }
 
   try {
     const data = await fn(params);
-    return {
-      statusCode: 200,
-      headers,
-      body: JSON.stringify({ success: true, data }),
-    };
+    return reply(200, { success: true, data });
   } catch (err) {
     console.error('Lambda error:', err);
-    return {
-      statusCode: 500,
-      headers,
-      body: JSON.stringify({
-        success: false,
-        error: err.message || 'Internal server error',
-      }),
-    };
+    return reply(500, { success: false, error: err.message || 'Internal server error' });
+  }
+}
+
+async function bufferedHandler(event, context) {
+  const res = await route(event);
+  if (!res.chunks) return res;
+  let body = '';
+  for await (const chunk of res.chunks) body += chunk;
+  return { statusCode: res.statusCode, headers: res.headers, body };
+}
+
+async function streamingHandler(event, responseStream, context) {
+  const res = await route(event);
+  const out = globalThis.awslambda.HttpResponseStream.from(responseStream, {
+    statusCode: res.statusCode,
+    headers: res.headers,
+  });
+  for await (const chunk of res.chunks ?? [res.body]) {
+    if (!out.write(chunk)) await once(out, 'drain');
   }
+  out.end();
 }
+
+// Streaming needs both the runtime's awslambda global and a function URL with invoke mode
+// RESPONSE_STREAM, which is what RESPONSE_STREAMING=true asserts. Otherwise (including the
+// bench and local runs) streamed actions are buffered into one NDJSON body with the same lines.
+export const handler = process.env.RESPONSE_STREAMING === 'true' && globalThis.awslambda?.streamifyResponse
+  ? globalThis.awslambda.streamifyResponse(streamingHandler)
+  : bufferedHandler;
@@ -6,21 +6,113 @@ import {
   DeleteCommand,
   BatchGetCommand,
   BatchWriteCommand,
+  TransactWriteCommand,
+  UpdateCommand,
 } from '@aws-sdk/lib-dynamodb';
 import { doc, tables as T } from './dynamo.js';
 
 const uuid = () => crypto.randomUUID();
 const now = () => new Date().toISOString();
 
+// ---------- Key sharding ----------
+// Lookup GSIs (EMAIL, NODE_KEY, SYMPTOM_KEY) and the shared collections (category/bonus videos and the
+// position tables) spread their items over KEY_SHARDS partitions, `<BASE>#<n>`, so write bursts are not
+// capped by a single partition. The shard is a hash of the value being looked up (email, key, category),
+// so lookups by that value still hit one partition; full listings query every shard in parallel.
+// Changing KEY_SHARDS requires re-running MigrateShardedKeys.
+const KEY_SHARDS = 8;
+
+function shardOf(value) {
+  // FNV-1a: stable across runtimes, unlike anything seeded
+  let hash = 0x811c9dc5;
+  const str = String(value ?? '');
+  for (let i = 0; i < str.length; i++) {
+    hash ^= str.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0) % KEY_SHARDS;
+}
+
+const shardKey = (base, value) => `${base}#${shardOf(value)}`;
+
+// Items written before sharding still sit under the bare base key until MigrateShardedKeys has run,
+// so reads look there as well. Once it has run, SHARDED_KEYS_MIGRATED=true drops that extra read.
+const legacyFallback = () => process.env.SHARDED_KEYS_MIGRATED !== 'true';
+
+const shardPartitions = (base) => [
+  ...Array.from({ length: KEY_SHARDS }, (_, n) => `${base}#${n}`),
+  ...(legacyFallback() ? [base] : []),
+];
+
+async function queryAllShards(params, base) {
+  const pages = await Promise.all(shardPartitions(base).map((pk) => queryAll({
+    ...params,
+    ExpressionAttributeValues: { ...params.ExpressionAttributeValues, ':pk': pk },
+  })));
+  // An item can briefly exist under both its old and new key while it is being migrated;
+  // the sharded copy comes first and wins
+  const seen = new Set();
+  return pages.flat().filter((item) => {
+    const id = `${item.sk ?? ''}|${item.id ?? ''}`;
+    if (seen.has(id)) return false;
+    seen.add(id);
+    return true;
+  });
+}
+
+/** The partitions holding one value's items: its shard, plus the pre-sharding one until migrated. */
+const valuePartitions = (base, value) => [shardKey(base, value), ...(legacyFallback() ? [base] : [])];
+
+/** Query a sharded lookup GSI for one value, falling back to the pre-sharding partition until migrated. */
+async function queryLookup(params, base, value) {
+  for (const pk of valuePartitions(base, value)) {
+    const { Items } = await doc.send(new QueryCommand({
+      ...params,
+      ExpressionAttributeValues: { ...params.ExpressionAttributeValues, ':pk': pk },
+    }));
+    if (Items && Items.length > 0) return Items;
+  }
+  return [];
+}
+
+// ---------- Paginated reads ----------
+/** Run a Scan or Query one DynamoDB page (up to 1 MB) at a time, yielding each page's raw items. */
+async function* readPages(Command, params) {
+  let ExclusiveStartKey;
+  do {
+    const page = await doc.send(new Command({ ...params, ExclusiveStartKey }));
+    if (page.Items && page.Items.length > 0) yield page.Items;
+    ExclusiveStartKey = page.LastEvaluatedKey;
+  } while (ExclusiveStartKey);
+}
+
+const scanPages = (params) => readPages(ScanCommand, params);
+const queryPages = (params) => readPages(QueryCommand, params);
+
+async function collect(pages) {
+  const items = [];
+  for await (const page of pages) items.push(...page);
+  return items;
+}
+
+const scanAll = (params) => collect(scanPages(params));
+const queryAll = (params) => collect(queryPages(params));
+
+/** Stripped items, one array per DynamoDB page, for actions answered as NDJSON streams. */
+async function* streamItems(pages) {
+  for await (const page of pages) yield page.map(stripKeys);
+}
+
 // ---------- Users ----------
 export async function getUserByEmail(email) {
-  const { Items } = await doc.send(new QueryCommand({
+  const normalized = (email || '').toLowerCase();
+  const Items = await queryLookup({
     TableName: T.users,
     IndexName: 'gsi_email',
     KeyConditionExpression: 'gsi_pk = :pk AND gsi_sk = :sk',
-    ExpressionAttributeValues: { ':pk': 'EMAIL', ':sk': (email || '').toLowerCase() },
-  }));
-  return Items && Items[0] ? stripKeys(Items[0]) : null;
+    ExpressionAttributeValues: { ':sk': normalized },
+  }, 'EMAIL', normalized);
+  return Items[0] ? stripKeys(Items[0]) : null;
 }
 
 export async function getUserById(id) {
@@ -35,7 +127,7 @@ export async function createUser({ email, name, is_admin }) {
   const id = uuid();
   const item = {
     pk: `USER#${id}`,
-    gsi_pk: 'EMAIL',
+    gsi_pk: shardKey('EMAIL', (email || '').toLowerCase()),
     gsi_sk: (email || '').toLowerCase(),
     id,
     email: (email || '').toLowerCase(),
@@ -53,7 +145,7 @@ export async function putUser(record) {
   if (!id) throw new Error('putUser requires record.id');
   const item = {
     pk: `USER#${id}`,
-    gsi_pk: 'EMAIL',
+    gsi_pk: shardKey('EMAIL', (record.email || '').toLowerCase()),
     gsi_sk: (record.email || '').toLowerCase(),
     id,
     email: (record.email || '').toLowerCase(),
@@ -67,8 +159,13 @@ export async function putUser(record) {
 }
 
 export async function listUsers() {
-  const { Items } = await doc.send(new ScanCommand({ TableName: T.users }));
-  return (Items || []).map(stripKeys).sort((a, b) => (b.created_at || '').localeCompare(a.created_at || ''));
+  const Items = await scanAll({ TableName: T.users });
+  return Items.map(stripKeys).sort((a, b) => (b.created_at || '').localeCompare(a.created_at || ''));
+}
+
+/** Unlike listUsers, not sorted by created_at: rows go out in scan order. */
+export function streamUsers() {
+  return streamItems(scanPages({ TableName: T.users }));
 }
 
 export async function deleteUser(id) {
@@ -78,9 +175,19 @@ export async function deleteUser(id) {
   }));
 }
 
+const ALL_UNLOCKS_SCAN = {
+  TableName: T.userUnlockedNodes,
+  FilterExpression: 'begins_with(sk, :prefix)',
+  ExpressionAttributeValues: { ':prefix': 'UNLOCK#' },
+};
+
 export async function listAllUnlocks() {
-  const { Items } = await doc.send(new ScanCommand({ TableName: T.userUnlockedNodes }));
-  return (Items || []).map(stripKeys);
+  const Items = await scanAll(ALL_UNLOCKS_SCAN);
+  return Items.map(stripKeys);
+}
+
+export function streamAllUnlocks() {
+  return streamItems(scanPages(ALL_UNLOCKS_SCAN));
 }
 
 export async function deleteAllUnlocks() {
@@ -103,35 +210,120 @@ export async function deleteAllUserEvents() {
   }
 }
 
+// ---------- Tree item collections ----------
+// Each tree lives in one item collection of the trees table: pk TREE#<tree>, every node at
+// sk NODE#<id>, and its videos and categories right after it at NODE#<id>#VIDEO#<video_id> and
+// NODE#<id>#CATEGORY#<category>. `entity` tells the kinds apart. A whole tree is one paginated
+// Query, and a node's own items are one begins_with Query away from a batch delete.
+const MAIN_TREE = 'TREE#main';
+const INTRO_TREE = 'TREE#intro';
+
+const nodeSk = (nodeId) => `NODE#${nodeId}`;
+const childPrefix = (nodeId, kind = '') => `NODE#${nodeId}#${kind && `${kind}#`}`;
+
+function collectionQuery(tree, { prefix, nodesOnly = false } = {}) {
+  const params = {
+    TableName: T.trees,
+    KeyConditionExpression: prefix ? 'pk = :pk AND begins_with(sk, :prefix)' : 'pk = :pk',
+    ExpressionAttributeValues: { ':pk': tree, ...(prefix && { ':prefix': prefix }) },
+  };
+  if (nodesOnly) {
+    params.FilterExpression = '#entity = :node';
+    params.ExpressionAttributeNames = { '#entity': 'entity' };
+    params.ExpressionAttributeValues[':node'] = 'node';
+  }
+  return params;
+}
+
+/** Every node of a tree with its categories and videos (by order_index), from one paginated Query. */
+async function readTree(tree) {
+  const nodes = new Map();
+  const children = [];
+  for await (const page of queryPages(collectionQuery(tree))) {
+    for (const item of page) {
+      if (item.entity === 'node') nodes.set(item.id, { ...stripKeys(item), categories: [], videos: [] });
+      else children.push(item);
+    }
+  }
+  for (const item of children) {
+    const node = nodes.get(item.node_id);
+    if (!node) continue;
+    if (item.entity === 'video') node.videos.push(stripKeys(item));
+    if (item.entity === 'category') node.categories.push(item.category);
+  }
+  nodes.forEach((node) => node.videos.sort((a, b) => (a.order_index ?? 0) - (b.order_index ?? 0)));
+  return [...nodes.values()];
+}
+
+async function listCollectionChildren(tree, nodeId, kind) {
+  return queryAll(collectionQuery(tree, { prefix: childPrefix(nodeId, kind) }));
+}
+
+/** Delete a node's item and everything under its sort-key prefix with batched writes. */
+async function deleteTreeNode(tree, nodeId) {
+  const children = await queryAll({
+    ...collectionQuery(tree, { prefix: childPrefix(nodeId) }),
+    ProjectionExpression: 'pk, sk',
+  });
+  const keys = [{ pk: tree, sk: nodeSk(nodeId) }, ...children];
+  await batchWrite(T.trees, keys.map(({ pk, sk }) => ({ DeleteRequest: { Key: { pk, sk } } })));
+}
+
+function videoItem(tree, nodeId, video) {
+  const id = video.id || uuid();
+  return {
+    pk: tree,
+    sk: `${childPrefix(nodeId, 'VIDEO')}${id}`,
+    entity: 'video',
+    id,
+    node_id: nodeId,
+    video_url: video.video_url,
+    title: video.title,
+    order_index: video.order_index ?? 0,
+    created_at: video.created_at || now(),
+    updated_at: now(),
+  };
+}
+
 // ---------- Nodes ----------
+export async function getTree() {
+  return readTree(MAIN_TREE);
+}
+
 export async function getNodeByKey(key) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.nodes,
+  const Items = await queryLookup({
+    TableName: T.trees,
     IndexName: 'gsi_key',
     KeyConditionExpression: 'gsi_pk = :pk AND gsi_sk = :sk',
-    ExpressionAttributeValues: { ':pk': 'NODE_KEY', ':sk': key },
-  }));
-  return Items && Items[0] ? stripKeys(Items[0]) : null;
+    ExpressionAttributeValues: { ':sk': key },
+  }, 'NODE_KEY', key);
+  return Items[0] ? stripKeys(Items[0]) : null;
 }
 
 export async function getNodeById(id) {
   const { Item } = await doc.send(new GetCommand({
-    TableName: T.nodes,
-    Key: { pk: `NODE#${id}` },
+    TableName: T.trees,
+    Key: { pk: MAIN_TREE, sk: nodeSk(id) },
   }));
   return Item ? stripKeys(Item) : null;
 }
 
 export async function listNodes() {
-  const { Items } = await doc.send(new ScanCommand({ TableName: T.nodes }));
-  return (Items || []).map(stripKeys);
+  const Items = await queryAll(collectionQuery(MAIN_TREE, { nodesOnly: true }));
+  return Items.map(stripKeys);
+}
+
+export function streamNodes() {
+  return streamItems(queryPages(collectionQuery(MAIN_TREE, { nodesOnly: true })));
 }
 
 export async function putNode(node) {
   const id = node.id || uuid();
   const item = {
-    pk: `NODE#${id}`,
-    gsi_pk: 'NODE_KEY',
+    pk: MAIN_TREE,
+    sk: nodeSk(id),
+    entity: 'node',
+    gsi_pk: shardKey('NODE_KEY', node.key),
     gsi_sk: node.key,
     id,
     key: node.key,
@@ -146,85 +338,70 @@ export async function putNode(node) {
     created_at: node.created_at || now(),
     updated_at: now(),
   };
-  await doc.send(new PutCommand({ TableName: T.nodes, Item: item }));
+  await doc.send(new PutCommand({ TableName: T.trees, Item: item }));
   return stripKeys(item);
 }
 
+/** Remove a node, its videos and categories, and every edge into or out of it. */
+export async function deleteNode(nodeId) {
+  const [incoming, outgoing] = await Promise.all([getEdgesByChild(nodeId), getEdgesByParent(nodeId)]);
+  for (const edge of [...incoming, ...outgoing]) {
+    await deleteEdge(edge.id);
+  }
+  await deleteTreeNode(MAIN_TREE, nodeId);
+}
+
 // ---------- Node categories ----------
 export async function listCategoriesByNode(nodeId) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.nodeCategories,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': `NODE#${nodeId}` },
-  }));
-  return (Items || []).map((i) => ({ node_id: i.node_id, category: i.category, created_at: i.created_at }));
+  const Items = await listCollectionChildren(MAIN_TREE, nodeId, 'CATEGORY');
+  return Items.map((i) => ({ node_id: i.node_id, category: i.category, created_at: i.created_at }));
 }
 
 export async function setNodeCategories(nodeId, categories) {
-  const pk = `NODE#${nodeId}`;
-  const existing = await doc.send(new QueryCommand({
-    TableName: T.nodeCategories,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': pk },
-  }));
-  const toDelete = (existing.Items || []).filter((i) => !categories.includes(i.category));
+  const existing = await listCollectionChildren(MAIN_TREE, nodeId, 'CATEGORY');
+  const toDelete = existing.filter((i) => !categories.includes(i.category));
   const toPut = categories.map((category) => ({
-    pk,
-    sk: `CATEGORY#${category}`,
+    pk: MAIN_TREE,
+    sk: `${childPrefix(nodeId, 'CATEGORY')}${category}`,
+    entity: 'category',
     node_id: nodeId,
     category,
     created_at: now(),
   }));
-  for (const item of toDelete) {
-    await doc.send(new DeleteCommand({
-      TableName: T.nodeCategories,
-      Key: { pk: item.pk, sk: item.sk },
-    }));
-  }
-  for (const item of toPut) {
-    await doc.send(new PutCommand({ TableName: T.nodeCategories, Item: item }));
-  }
+  await batchWrite(T.trees, [
+    ...toDelete.map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })),
+    ...toPut.map((item) => ({ PutRequest: { Item: item } })),
+  ]);
   return toPut.map((i) => ({ node_id: i.node_id, category: i.category }));
 }
 
 // ---------- Node videos ----------
 export async function listNodeVideos(nodeId) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.nodeVideos,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': `NODE#${nodeId}` },
-  }));
-  return (Items || []).map(stripKeys).sort((a, b) => (a.order_index ?? 0) - (b.order_index ?? 0));
+  const Items = await listCollectionChildren(MAIN_TREE, nodeId, 'VIDEO');
+  return Items.map(stripKeys).sort((a, b) => (a.order_index ?? 0) - (b.order_index ?? 0));
 }
 
 export async function putNodeVideo(nodeId, video) {
-  const id = video.id || uuid();
-  const item = {
-    pk: `NODE#${nodeId}`,
-    sk: `VIDEO#${id}`,
-    id,
-    node_id: nodeId,
-    video_url: video.video_url,
-    title: video.title,
-    order_index: video.order_index ?? 0,
-    created_at: video.created_at || now(),
-    updated_at: now(),
-  };
-  await doc.send(new PutCommand({ TableName: T.nodeVideos, Item: item }));
+  const item = videoItem(MAIN_TREE, nodeId, video);
+  await doc.send(new PutCommand({ TableName: T.trees, Item: item }));
   return stripKeys(item);
 }
 
 export async function deleteNodeVideo(nodeId, videoId) {
   await doc.send(new DeleteCommand({
-    TableName: T.nodeVideos,
-    Key: { pk: `NODE#${nodeId}`, sk: `VIDEO#${videoId}` },
+    TableName: T.trees,
+    Key: { pk: MAIN_TREE, sk: `${childPrefix(nodeId, 'VIDEO')}${videoId}` },
   }));
 }
 
 // ---------- Edges ----------
 export async function listEdges() {
-  const { Items } = await doc.send(new ScanCommand({ TableName: T.edges }));
-  return (Items || []).map(stripKeys);
+  const Items = await scanAll({ TableName: T.edges });
+  return Items.map(stripKeys);
+}
+
+export function streamEdges() {
+  return streamItems(scanPages({ TableName: T.edges }));
 }
 
 export async function getEdgesByChild(childId) {
@@ -237,6 +414,16 @@ export async function getEdgesByChild(childId) {
   return (Items || []).map(stripKeys);
 }
 
+export async function getEdgesByParent(parentId) {
+  const { Items } = await doc.send(new QueryCommand({
+    TableName: T.edges,
+    IndexName: 'gsi_parent',
+    KeyConditionExpression: 'gsi_parent_pk = :pk',
+    ExpressionAttributeValues: { ':pk': parentId },
+  }));
+  return (Items || []).map(stripKeys);
+}
+
 export async function getEdgesByUnlockType(unlockType) {
   const { Items } = await doc.send(new QueryCommand({
     TableName: T.edges,
@@ -267,6 +454,7 @@ export async function putEdge(edge) {
     created_at: edge.created_at || now(),
   };
   await doc.send(new PutCommand({ TableName: T.edges, Item: item }));
+  await syncFrontierForEdge(item);
   return stripKeys(item);
 }
 
@@ -275,6 +463,7 @@ export async function deleteEdge(edgeId) {
     TableName: T.edges,
     Key: { pk: `EDGE#${edgeId}` },
   }));
+  await syncFrontierForEdge({ id: edgeId }, { removed: true });
 }
 
 // ---------- Symptoms ----------
@@ -285,21 +474,21 @@ export async function listSymptoms() {
 
 export async function getSymptomsByKeys(keys) {
   if (!keys || keys.length === 0) return [];
-  const { Items } = await doc.send(new QueryCommand({
+  // One targeted lookup per distinct key, in parallel
+  const found = await Promise.all([...new Set(keys)].map((key) => queryLookup({
     TableName: T.symptoms,
     IndexName: 'gsi_key',
-    KeyConditionExpression: 'gsi_pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'SYMPTOM_KEY' },
-  }));
-  const keySet = new Set(keys);
-  return (Items || []).map(stripKeys).filter((s) => keySet.has(s.key));
+    KeyConditionExpression: 'gsi_pk = :pk AND gsi_sk = :sk',
+    ExpressionAttributeValues: { ':sk': key },
+  }, 'SYMPTOM_KEY', key)));
+  return found.flat().map(stripKeys);
 }
 
 export async function putSymptom(symptom) {
   const id = symptom.id || uuid();
   const item = {
     pk: `SYMPTOM#${id}`,
-    gsi_pk: 'SYMPTOM_KEY',
+    gsi_pk: shardKey('SYMPTOM_KEY', symptom.key),
     gsi_sk: symptom.key,
     id,
     key: symptom.key,
@@ -312,12 +501,12 @@ export async function putSymptom(symptom) {
 
 // ---------- User unlocked nodes ----------
 export async function listUnlocksByUser(userId) {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAll({
     TableName: T.userUnlockedNodes,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': `USER#${userId}` },
-  }));
-  return (Items || []).map((i) => ({ node_id: i.node_id, unlocked_at: i.unlocked_at, unlocked_by: i.unlocked_by, source: i.source }));
+    KeyConditionExpression: 'pk = :pk AND begins_with(sk, :prefix)',
+    ExpressionAttributeValues: { ':pk': `USER#${userId}`, ':prefix': 'UNLOCK#' },
+  });
+  return Items.map((i) => ({ node_id: i.node_id, unlocked_at: i.unlocked_at, unlocked_by: i.unlocked_by, source: i.source }));
 }
 
 export async function getUnlock(userId, nodeId) {
@@ -336,6 +525,7 @@ export async function insertUnlocks(rows) {
       Item: {
         pk: `USER#${row.user_id}`,
         sk: `UNLOCK#${row.node_id}`,
+        ...unlockIndexKeys(row.user_id, row.node_id),
         id,
         user_id: row.user_id,
         node_id: row.node_id,
@@ -345,20 +535,313 @@ export async function insertUnlocks(rows) {
       },
     }));
   }
+  const byUser = new Map();
+  for (const row of rows) {
+    if (!byUser.has(row.user_id)) byUser.set(row.user_id, []);
+    byUser.get(row.user_id).push(row.node_id);
+  }
+  for (const [userId, nodeIds] of byUser) {
+    await advanceFrontier(userId, nodeIds);
+  }
 }
 
 export async function deleteUnlocksByUser(userId) {
-  const { Items } = await doc.send(new QueryCommand({
+  const partition = await queryUserPartition(userId);
+  await batchWrite(T.userUnlockedNodes, partition.map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })));
+  // No unlocks means an empty frontier, which is built as it stands
+  await doc.send(new PutCommand({ TableName: T.userUnlockedNodes, Item: frontierMeta(userId) }));
+}
+
+// ---------- Unlock frontier ----------
+// Each user's partition in user_unlocked_nodes also holds one FRONTIER#<child_id>#<edge_id> item per edge
+// leading from an unlocked parent to a locked child, plus a FRONTIER_META marker once the frontier has been
+// built. insertUnlocks and the edge writers keep it current, so readers never walk the full edge list.
+// Reads never write: a partition without the marker gets its frontier computed in memory until
+// MigrateFrontiers, RebuildFrontier or the user's next unlock stores it.
+// gsi_node finds the items an edge change touches without scanning: unlocks under NODE#<node_id>,
+// frontier items under EDGE#<edge_id>, both sorted by USER#<user_id>.
+const FRONTIER_PREFIX = 'FRONTIER#';
+const FRONTIER_META_SK = 'FRONTIER_META';
+
+const isUnlockItem = (item) => item.sk.startsWith('UNLOCK#');
+const isFrontierItem = (item) => item.sk.startsWith(FRONTIER_PREFIX);
+
+const unlockIndexKeys = (userId, nodeId) => ({ gsi_pk: `NODE#${nodeId}`, gsi_sk: `USER#${userId}` });
+const frontierMeta = (userId) => ({ pk: `USER#${userId}`, sk: FRONTIER_META_SK, user_id: userId, built_at: now() });
+
+function frontierItem(userId, edge) {
+  return {
+    pk: `USER#${userId}`,
+    sk: `${FRONTIER_PREFIX}${edge.child_id}#${edge.id}`,
+    gsi_pk: `EDGE#${edge.id}`,
+    gsi_sk: `USER#${userId}`,
+    user_id: userId,
+    node_id: edge.child_id,
+    parent_id: edge.parent_id,
+    edge_id: edge.id,
+    unlock_type: edge.unlock_type,
+    unlock_value: edge.unlock_value ?? null,
+    description: edge.description ?? null,
+    weight: edge.weight ?? 0,
+  };
+}
+
+function toFrontierEntry(item) {
+  return {
+    node_id: item.node_id,
+    parent_id: item.parent_id,
+    edge_id: item.edge_id,
+    unlock_type: item.unlock_type,
+    unlock_value: item.unlock_value ?? null,
+    description: item.description ?? null,
+    weight: item.weight ?? 0,
+  };
+}
+
+function queryUserPartition(userId) {
+  return queryAll({
     TableName: T.userUnlockedNodes,
     KeyConditionExpression: 'pk = :pk',
     ExpressionAttributeValues: { ':pk': `USER#${userId}` },
-  }));
-  for (const item of Items || []) {
-    await doc.send(new DeleteCommand({
+  });
+}
+
+function queryNodeIndex(gsiPk) {
+  return queryAll({
+    TableName: T.userUnlockedNodes,
+    IndexName: 'gsi_node',
+    KeyConditionExpression: 'gsi_pk = :pk',
+    ExpressionAttributeValues: { ':pk': gsiPk },
+  });
+}
+
+/** Compute a user's frontier items from their unlocks and the edge list, without writing them. */
+async function computeFrontier(userId, partition, edges = null) {
+  const unlockedIds = new Set(partition.filter(isUnlockItem).map((i) => i.node_id));
+  if (unlockedIds.size === 0) return [];
+  return (edges || await listEdges())
+    .filter((e) => unlockedIds.has(e.parent_id) && !unlockedIds.has(e.child_id))
+    .map((e) => frontierItem(userId, e));
+}
+
+/** The stored frontier, or the computed one when it has not been built yet. */
+async function readFrontier(userId, partition) {
+  if (partition.some((i) => i.sk === FRONTIER_META_SK)) return partition.filter(isFrontierItem).map(toFrontierEntry);
+  return (await computeFrontier(userId, partition)).map(toFrontierEntry);
+}
+
+/** Recompute and store a user's frontier from scratch (first unlock, or after a reset dropped the marker). */
+async function storeFrontier(userId, partition, edges = null) {
+  const entries = await computeFrontier(userId, partition, edges);
+  const keep = new Set(entries.map((item) => item.sk));
+  await batchWrite(T.userUnlockedNodes, [
+    ...partition
+      .filter((item) => isFrontierItem(item) && !keep.has(item.sk))
+      .map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })),
+    ...entries.map((item) => ({ PutRequest: { Item: item } })),
+  ]);
+  await doc.send(new PutCommand({ TableName: T.userUnlockedNodes, Item: frontierMeta(userId) }));
+  return entries.map(toFrontierEntry);
+}
+
+/** Move the frontier past newly unlocked nodes: drop entries for them, add their locked children. */
+async function advanceFrontier(userId, nodeIds) {
+  const partition = await queryUserPartition(userId);
+  if (!partition.some((i) => i.sk === FRONTIER_META_SK)) {
+    await storeFrontier(userId, partition);
+    return;
+  }
+  const unlockedIds = new Set(partition.filter(isUnlockItem).map((i) => i.node_id));
+  const added = new Map();
+  for (const edges of await Promise.all([...new Set(nodeIds)].map(getEdgesByParent))) {
+    for (const edge of edges) {
+      if (!unlockedIds.has(edge.child_id)) added.set(edge.id, frontierItem(userId, edge));
+    }
+  }
+  await batchWrite(T.userUnlockedNodes, [
+    ...partition
+      .filter((item) => isFrontierItem(item) && unlockedIds.has(item.node_id))
+      .map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })),
+    ...[...added.values()].map((item) => ({ PutRequest: { Item: item } })),
+  ]);
+}
+
+/** Rebuild and store a user's frontier; the maintenance path for partitions without a FRONTIER_META marker. */
+export async function rebuildFrontier(userId) {
+  return storeFrontier(userId, await queryUserPartition(userId));
+}
+
+/**
+ * Re-point every user's frontier at an edge that was written or removed: drop the edge's frontier items
+ * and, unless it was removed, add one for each user who has unlocked its parent but not its child.
+ * Reads only the gsi_node partitions of the edge and its two nodes, never the whole table.
+ */
+async function syncFrontierForEdge(edge, { removed = false } = {}) {
+  const [stale, withParent, withChild] = await Promise.all([
+    queryNodeIndex(`EDGE#${edge.id}`),
+    removed ? [] : queryNodeIndex(`NODE#${edge.parent_id}`),
+    removed ? [] : queryNodeIndex(`NODE#${edge.child_id}`),
+  ]);
+  const hasChild = new Set(withChild.map((item) => item.user_id));
+  const added = withParent.filter((item) => !hasChild.has(item.user_id)).map((item) => frontierItem(item.user_id, edge));
+  const keep = new Set(added.map((item) => `${item.pk}|${item.sk}`));
+  await batchWrite(T.userUnlockedNodes, [
+    ...stale
+      .filter((item) => !keep.has(`${item.pk}|${item.sk}`))
+      .map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })),
+    ...added.map((item) => ({ PutRequest: { Item: item } })),
+  ]);
+}
+
+export async function listFrontierByUser(userId) {
+  return readFrontier(userId, await queryUserPartition(userId));
+}
+
+/** Everything user-specific the patient view needs (unlocks + frontier) from one partition Query. */
+export async function getUserOverlay(userId) {
+  const partition = await queryUserPartition(userId);
+  const unlocks = partition
+    .filter(isUnlockItem)
+    .map((i) => ({ node_id: i.node_id, unlocked_at: i.unlocked_at, unlocked_by: i.unlocked_by, source: i.source }));
+  const frontier = await readFrontier(userId, partition);
+  return { unlocks, frontier };
+}
+
+export async function getFrontierForNode(userId, nodeId) {
+  const frontier = await listFrontierByUser(userId);
+  return frontier.filter((e) => e.node_id === nodeId);
+}
+
+// ---------- Atomic unlock ----------
+const TRANSACTION_LIMIT = 100;
+const isGatingEntry = (e) => e.unlock_type === 'always' || e.unlock_type === 'symptom_match';
+
+/**
+ * Plan an unlock of nodeId against a snapshot of the user's partition: the node itself, every node the
+ * 'always' edges then cascade to, and the frontier items to drop and add. Returns null when the node
+ * is not gated open on the frontier.
+ */
+async function planUnlock(userId, nodeId, partition, frontier) {
+  const unlockedIds = new Set(partition.filter(isUnlockItem).map((i) => i.node_id));
+  const gating = frontier.filter((e) => e.node_id === nodeId && isGatingEntry(e));
+  if (gating.length === 0) return null;
+
+  const cascaded = [];
+  const newlyUnlocked = new Set([nodeId]);
+  const added = new Map();
+  // Start from the requested node plus any 'always' entries still pending on the frontier. An entry whose
+  // node is already unlocked (e.g. by a plain InsertUnlocks) is stale: cascading to it would fail the
+  // conditional put on every attempt, so it is only dropped from the frontier.
+  const queue = [nodeId];
+  for (const entry of frontier) {
+    if (entry.unlock_type !== 'always' || newlyUnlocked.has(entry.node_id) || unlockedIds.has(entry.node_id)) continue;
+    newlyUnlocked.add(entry.node_id);
+    cascaded.push(entry.node_id);
+    queue.push(entry.node_id);
+  }
+  while (queue.length > 0) {
+    const edges = await getEdgesByParent(queue.shift());
+    for (const edge of edges) {
+      if (unlockedIds.has(edge.child_id)) continue;
+      if (edge.unlock_type === 'always' && !newlyUnlocked.has(edge.child_id)) {
+        newlyUnlocked.add(edge.child_id);
+        cascaded.push(edge.child_id);
+        queue.push(edge.child_id);
+      }
+      added.set(`${edge.child_id}#${edge.id}`, frontierItem(userId, edge));
+    }
+  }
+
+  const existing = new Set(frontier.map((e) => `${e.node_id}#${e.edge_id}`));
+  const isSettled = (e) => newlyUnlocked.has(e.node_id) || unlockedIds.has(e.node_id);
+  const removed = frontier.filter(isSettled);
+  const additions = [...added.entries()]
+    .filter(([key, item]) => !existing.has(key) && !newlyUnlocked.has(item.node_id))
+    .map(([, item]) => item);
+  const nextFrontier = [
+    ...frontier.filter((e) => !isSettled(e)),
+    ...additions.map(toFrontierEntry),
+  ];
+  return { gating, cascaded, removed, additions, frontier: nextFrontier };
+}
+
+function unlockPut(userId, nodeId, unlockedBy, source) {
+  return {
+    Put: {
       TableName: T.userUnlockedNodes,
-      Key: { pk: item.pk, sk: item.sk },
-    }));
+      Item: {
+        pk: `USER#${userId}`,
+        sk: `UNLOCK#${nodeId}`,
+        ...unlockIndexKeys(userId, nodeId),
+        id: uuid(),
+        user_id: userId,
+        node_id: nodeId,
+        unlocked_at: now(),
+        unlocked_by: unlockedBy,
+        source,
+      },
+      // A retried or double-clicked unlock must not overwrite the original row
+      ConditionExpression: 'attribute_not_exists(pk)',
+    },
+  };
+}
+
+/**
+ * Unlock one node for a user in a single call: check it is gated open on the user's frontier, write the
+ * unlock (conditionally, so it happens at most once), cascade through 'always' edges and move the
+ * frontier, all in one DynamoDB transaction. A plan larger than TRANSACTION_LIMIT items is written as several
+ * transactions and is only atomic up to the first one (the unlock, its checks and the start of the cascade).
+ * Returns { status: 'unlocked' | 'already_unlocked' | 'not_unlockable', unlocked, cascaded, frontier }.
+ */
+export async function unlockNode(userId, nodeId, { unlockedBy = 'user', source = 'patient_unlock' } = {}) {
+  for (let attempt = 0; attempt < 3; attempt++) {
+    const partition = await queryUserPartition(userId);
+    const frontier = partition.some((i) => i.sk === FRONTIER_META_SK)
+      ? partition.filter(isFrontierItem).map(toFrontierEntry)
+      : await storeFrontier(userId, partition);
+
+    if (partition.some((i) => i.sk === `UNLOCK#${nodeId}`)) {
+      return { status: 'already_unlocked', unlocked: [], cascaded: [], frontier };
+    }
+    const plan = await planUnlock(userId, nodeId, partition, frontier);
+    if (!plan) return { status: 'not_unlockable', unlocked: [], cascaded: [], frontier };
+
+    const pk = `USER#${userId}`;
+    const gatingSks = new Set(plan.gating.map((e) => `${FRONTIER_PREFIX}${e.node_id}#${e.edge_id}`));
+    const items = [
+      unlockPut(userId, nodeId, unlockedBy, source),
+      // Deleting the gating entry conditionally re-validates it inside the transaction
+      ...[...gatingSks].map((sk) => ({
+        Delete: { TableName: T.userUnlockedNodes, Key: { pk, sk }, ConditionExpression: 'attribute_exists(pk)' },
+      })),
+      ...plan.cascaded.map((id) => unlockPut(userId, id, 'system', 'auto_always')),
+      ...plan.removed
+        .map((e) => `${FRONTIER_PREFIX}${e.node_id}#${e.edge_id}`)
+        .filter((sk) => !gatingSks.has(sk))
+        .map((sk) => ({ Delete: { TableName: T.userUnlockedNodes, Key: { pk, sk } } })),
+      ...plan.additions.map((item) => ({ Put: { TableName: T.userUnlockedNodes, Item: item } })),
+    ];
+
+    try {
+      await doc.send(new TransactWriteCommand({ TransactItems: items.slice(0, TRANSACTION_LIMIT) }));
+    } catch (err) {
+      // Lost a race with another write to this partition; re-read and decide again
+      if (err.name === 'TransactionCanceledException') continue;
+      throw err;
+    }
+    // Oversized cascades spill into follow-up transactions. Only the first one carries the unlock and its
+    // checks, so past this point the cascade is not atomic: a failure leaves it partly applied and is
+    // surfaced rather than retried as a lost race.
+    for (let i = TRANSACTION_LIMIT; i < items.length; i += TRANSACTION_LIMIT) {
+      try {
+        await doc.send(new TransactWriteCommand({ TransactItems: items.slice(i, i + TRANSACTION_LIMIT) }));
+      } catch (err) {
+        throw new Error(`Unlock of ${nodeId} was applied but its cascade stopped part way: ${err.message}`);
+      }
+    }
+    return { status: 'unlocked', unlocked: [nodeId], cascaded: plan.cascaded, frontier: plan.frontier };
   }
+  throw new Error(`Unlock of ${nodeId} kept conflicting with concurrent writes`);
 }
 
 // ---------- User events ----------
@@ -417,24 +900,22 @@ export async function deleteUserEventsByUser(userId) {
 
 // ---------- Category videos & positions ----------
 export async function listCategoryVideos() {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAllShards({
     TableName: T.categoryVideos,
     KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'CATEGORY_VIDEO' },
-  }));
-  return (Items || []).map(stripKeys).sort((a, b) => {
+  }, 'CATEGORY_VIDEO');
+  return Items.map(stripKeys).sort((a, b) => {
     const c = (a.category || '').localeCompare(b.category || '');
     return c !== 0 ? c : (a.order_index ?? 0) - (b.order_index ?? 0);
   });
 }
 
 export async function listCategoryPositions() {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAllShards({
     TableName: T.categoryPositions,
     KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'CATEGORY_POSITION' },
-  }));
-  return (Items || []).map(stripKeys);
+  }, 'CATEGORY_POSITION');
+  return Items.map(stripKeys);
 }
 
 export async function putCategoryVideo(record) {
@@ -442,7 +923,7 @@ export async function putCategoryVideo(record) {
   const category = record.category;
   const order_index = record.order_index ?? 0;
   const item = {
-    pk: 'CATEGORY_VIDEO',
+    pk: shardKey('CATEGORY_VIDEO', category),
     sk: `${category}#${order_index}#${id}`,
     id,
     category,
@@ -456,18 +937,18 @@ export async function putCategoryVideo(record) {
   return stripKeys(item);
 }
 
-export async function deleteCategoryVideosByCategory(category) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.categoryVideos,
+/** Delete every item of one category from a sharded video collection, across all of its pages. */
+async function deleteCategoryItems(table, base, category) {
+  const pages = await Promise.all(valuePartitions(base, category).map((pk) => queryAll({
+    TableName: table,
     KeyConditionExpression: 'pk = :pk AND begins_with(sk, :prefix)',
-    ExpressionAttributeValues: { ':pk': 'CATEGORY_VIDEO', ':prefix': `${category}#` },
-  }));
-  for (const item of Items || []) {
-    await doc.send(new DeleteCommand({
-      TableName: T.categoryVideos,
-      Key: { pk: item.pk, sk: item.sk },
-    }));
-  }
+    ExpressionAttributeValues: { ':pk': pk, ':prefix': `${category}#` },
+  })));
+  await batchWrite(table, pages.flat().map((item) => ({ DeleteRequest: { Key: { pk: item.pk, sk: item.sk } } })));
+}
+
+export async function deleteCategoryVideosByCategory(category) {
+  await deleteCategoryItems(T.categoryVideos, 'CATEGORY_VIDEO', category);
 }
 
 export async function putBonusContentVideo(record) {
@@ -475,7 +956,7 @@ export async function putBonusContentVideo(record) {
   const category = record.category;
   const order_index = record.order_index ?? 0;
   const item = {
-    pk: 'BONUS_VIDEO',
+    pk: shardKey('BONUS_VIDEO', category),
     sk: `${category}#${order_index}#${id}`,
     id,
     category,
@@ -490,23 +971,13 @@ export async function putBonusContentVideo(record) {
 }
 
 export async function deleteBonusContentVideosByCategory(category) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.bonusContentVideos,
-    KeyConditionExpression: 'pk = :pk AND begins_with(sk, :prefix)',
-    ExpressionAttributeValues: { ':pk': 'BONUS_VIDEO', ':prefix': `${category}#` },
-  }));
-  for (const item of Items || []) {
-    await doc.send(new DeleteCommand({
-      TableName: T.bonusContentVideos,
-      Key: { pk: item.pk, sk: item.sk },
-    }));
-  }
+  await deleteCategoryItems(T.bonusContentVideos, 'BONUS_VIDEO', category);
 }
 
 export async function putCategoryPosition(record) {
   const category = record.category;
   const item = {
-    pk: 'CATEGORY_POSITION',
+    pk: shardKey('CATEGORY_POSITION', category),
     sk: category,
     category,
     pos_x: record.pos_x,
@@ -522,18 +993,17 @@ export async function putCategoryPosition(record) {
 
 // ---------- Symptom positions ----------
 export async function listSymptomPositions() {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAllShards({
     TableName: T.symptomPositions,
     KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'SYMPTOM_POSITION' },
-  }));
-  return (Items || []).map(stripKeys);
+  }, 'SYMPTOM_POSITION');
+  return Items.map(stripKeys);
 }
 
 export async function putSymptomPosition(record) {
   const key = record.position_key;
   const item = {
-    pk: 'SYMPTOM_POSITION',
+    pk: shardKey('SYMPTOM_POSITION', key),
     sk: key,
     id: record.id || uuid(),
     position_key: key,
@@ -550,30 +1020,28 @@ export async function putSymptomPosition(record) {
 
 // ---------- Bonus content ----------
 export async function listBonusContentVideos() {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAllShards({
     TableName: T.bonusContentVideos,
     KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'BONUS_VIDEO' },
-  }));
-  return (Items || []).map(stripKeys).sort((a, b) => {
+  }, 'BONUS_VIDEO');
+  return Items.map(stripKeys).sort((a, b) => {
     const c = (a.category || '').localeCompare(b.category || '');
     return c !== 0 ? c : (a.order_index ?? 0) - (b.order_index ?? 0);
   });
 }
 
 export async function listBonusContentPositions() {
-  const { Items } = await doc.send(new QueryCommand({
+  const Items = await queryAllShards({
     TableName: T.bonusContentPositions,
     KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': 'BONUS_POSITION' },
-  }));
-  return (Items || []).map(stripKeys);
+  }, 'BONUS_POSITION');
+  return Items.map(stripKeys);
 }
 
 export async function putBonusContentPosition(record) {
   const category = record.category;
   const item = {
-    pk: 'BONUS_POSITION',
+    pk: shardKey('BONUS_POSITION', category),
     sk: category,
     category,
     pos_x: record.pos_x,
@@ -588,15 +1056,19 @@ export async function putBonusContentPosition(record) {
 }
 
 // ---------- Introduction tree ----------
+export async function getIntroTree() {
+  return readTree(INTRO_TREE);
+}
+
 export async function listIntroTreeNodes() {
-  const { Items } = await doc.send(new ScanCommand({ TableName: T.introTreeNodes }));
-  return (Items || []).map(stripKeys);
+  const Items = await queryAll(collectionQuery(INTRO_TREE, { nodesOnly: true }));
+  return Items.map(stripKeys);
 }
 
 export async function getIntroNodeByKey(nodeKey) {
   const { Items } = await doc.send(new QueryCommand({
-    TableName: T.introTreeNodes,
-    IndexName: 'gsi_node_key',
+    TableName: T.trees,
+    IndexName: 'gsi_key',
     KeyConditionExpression: 'gsi_pk = :pk AND gsi_sk = :sk',
     ExpressionAttributeValues: { ':pk': 'INTRO_NODE_KEY', ':sk': nodeKey },
   }));
@@ -606,7 +1078,9 @@ export async function getIntroNodeByKey(nodeKey) {
 export async function putIntroTreeNode(node) {
   const id = node.id || uuid();
   const item = {
-    pk: `INTRO_NODE#${id}`,
+    pk: INTRO_TREE,
+    sk: nodeSk(id),
+    entity: 'node',
     gsi_pk: 'INTRO_NODE_KEY',
     gsi_sk: node.node_key,
     id,
@@ -619,63 +1093,209 @@ export async function putIntroTreeNode(node) {
     created_at: node.created_at || now(),
     updated_at: now(),
   };
-  await doc.send(new PutCommand({ TableName: T.introTreeNodes, Item: item }));
+  await doc.send(new PutCommand({ TableName: T.trees, Item: item }));
   return stripKeys(item);
 }
 
 export async function deleteIntroTreeNode(nodeId) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.introTreeNodeVideos,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': `INTRO_NODE#${nodeId}` },
-  }));
-  for (const item of Items || []) {
-    await doc.send(new DeleteCommand({
-      TableName: T.introTreeNodeVideos,
-      Key: { pk: item.pk, sk: item.sk },
-    }));
-  }
-  await doc.send(new DeleteCommand({
-    TableName: T.introTreeNodes,
-    Key: { pk: `INTRO_NODE#${nodeId}` },
-  }));
+  await deleteTreeNode(INTRO_TREE, nodeId);
 }
 
 export async function listIntroTreeNodeVideos(nodeId) {
-  const { Items } = await doc.send(new QueryCommand({
-    TableName: T.introTreeNodeVideos,
-    KeyConditionExpression: 'pk = :pk',
-    ExpressionAttributeValues: { ':pk': `INTRO_NODE#${nodeId}` },
-  }));
-  return (Items || []).map(stripKeys).sort((a, b) => (a.order_index ?? 0) - (b.order_index ?? 0));
+  const Items = await listCollectionChildren(INTRO_TREE, nodeId, 'VIDEO');
+  return Items.map(stripKeys).sort((a, b) => (a.order_index ?? 0) - (b.order_index ?? 0));
 }
 
 export async function deleteIntroTreeNodeVideo(nodeId, videoId) {
   await doc.send(new DeleteCommand({
-    TableName: T.introTreeNodeVideos,
-    Key: { pk: `INTRO_NODE#${nodeId}`, sk: `VIDEO#${videoId}` },
+    TableName: T.trees,
+    Key: { pk: INTRO_TREE, sk: `${childPrefix(nodeId, 'VIDEO')}${videoId}` },
   }));
 }
 
 export async function putIntroTreeNodeVideo(nodeId, video) {
-  const id = video.id || uuid();
-  const item = {
-    pk: `INTRO_NODE#${nodeId}`,
-    sk: `VIDEO#${id}`,
-    id,
-    node_id: nodeId,
-    video_url: video.video_url,
-    title: video.title,
-    order_index: video.order_index ?? 0,
-    created_at: video.created_at || now(),
-    updated_at: now(),
-  };
-  await doc.send(new PutCommand({ TableName: T.introTreeNodeVideos, Item: item }));
+  const item = videoItem(INTRO_TREE, nodeId, video);
+  await doc.send(new PutCommand({ TableName: T.trees, Item: item }));
   return stripKeys(item);
 }
 
+// ---------- Key sharding migration ----------
+
+const SHARDED_LOOKUPS = [
+  { table: 'users', base: 'EMAIL' },
+  { table: 'symptoms', base: 'SYMPTOM_KEY' },
+];
+
+const SHARDED_COLLECTIONS = [
+  { table: 'categoryVideos', base: 'CATEGORY_VIDEO', shardBy: (item) => item.category },
+  { table: 'categoryPositions', base: 'CATEGORY_POSITION', shardBy: (item) => item.category },
+  { table: 'symptomPositions', base: 'SYMPTOM_POSITION', shardBy: (item) => item.position_key },
+  { table: 'bonusContentVideos', base: 'BONUS_VIDEO', shardBy: (item) => item.category },
+  { table: 'bonusContentPositions', base: 'BONUS_POSITION', shardBy: (item) => item.category },
+];
+
+/**
+ * Move items written before key sharding onto their shard. Lookup GSI items only get a new gsi_pk;
+ * collection items are copied to the sharded pk and the old copy deleted. Safe to re-run.
+ */
+export async function migrateShardedKeys() {
+  const migrated = {};
+
+  for (const { table, base } of SHARDED_LOOKUPS) {
+    const items = await scanAll({
+      TableName: T[table],
+      FilterExpression: 'gsi_pk = :base',
+      ExpressionAttributeValues: { ':base': base },
+    });
+    for (const item of items) {
+      await doc.send(new UpdateCommand({
+        TableName: T[table],
+        Key: item.sk === undefined ? { pk: item.pk } : { pk: item.pk, sk: item.sk },
+        UpdateExpression: 'SET gsi_pk = :pk',
+        ConditionExpression: 'gsi_pk = :base',
+        ExpressionAttributeValues: { ':pk': shardKey(base, item.gsi_sk), ':base': base },
+      })).catch((err) => {
+        // Rewritten by a concurrent put, which already used the sharded key
+        if (err.name !== 'ConditionalCheckFailedException') throw err;
+      });
+    }
+    migrated[table] = items.length;
+  }
+
+  for (const { table, base, shardBy } of SHARDED_COLLECTIONS) {
+    const items = await queryAll({
+      TableName: T[table],
+      KeyConditionExpression: 'pk = :pk',
+      ExpressionAttributeValues: { ':pk': base },
+    });
+    for (const item of items) {
+      await doc.send(new PutCommand({
+        TableName: T[table],
+        Item: { ...item, pk: shardKey(base, shardBy(item)) },
+        // Never overwrite a copy that was saved after sharding went live
+        ConditionExpression: 'attribute_not_exists(pk)',
+      })).catch((err) => {
+        if (err.name !== 'ConditionalCheckFailedException') throw err;
+      });
+      await doc.send(new DeleteCommand({
+        TableName: T[table],
+        Key: { pk: item.pk, sk: item.sk },
+      }));
+    }
+    migrated[table] = items.length;
+  }
+
+  return migrated;
+}
+
+// ---------- Tree collections migration ----------
+const TREE_SOURCES = [
+  {
+    table: 'nodes',
+    toItem: (i) => ({
+      ...i, pk: MAIN_TREE, sk: nodeSk(i.id), entity: 'node', gsi_pk: shardKey('NODE_KEY', i.key), gsi_sk: i.key,
+    }),
+  },
+  {
+    table: 'nodeCategories',
+    toItem: (i) => ({ ...i, pk: MAIN_TREE, sk: `${childPrefix(i.node_id, 'CATEGORY')}${i.category}`, entity: 'category' }),
+  },
+  {
+    table: 'nodeVideos',
+    toItem: (i) => ({ ...i, pk: MAIN_TREE, sk: `${childPrefix(i.node_id, 'VIDEO')}${i.id}`, entity: 'video' }),
+  },
+  {
+    table: 'introTreeNodes',
+    toItem: (i) => ({
+      ...i, pk: INTRO_TREE, sk: nodeSk(i.id), entity: 'node', gsi_pk: 'INTRO_NODE_KEY', gsi_sk: i.node_key,
+    }),
+  },
+  {
+    table: 'introTreeNodeVideos',
+    toItem: (i) => ({ ...i, pk: INTRO_TREE, sk: `${childPrefix(i.node_id, 'VIDEO')}${i.id}`, entity: 'video' }),
+  },
+];
+
+/**
+ * Copy nodes, videos and categories from the per-entity tables into the trees table.
+ * Items already in the trees table win, so it is safe to re-run after admins have edited.
+ */
+export async function migrateTreeCollections() {
+  const migrated = {};
+  for (const { table, toItem } of TREE_SOURCES) {
+    migrated[table] = 0;
+    for await (const page of scanPages({ TableName: T[table] })) {
+      for (const item of page) {
+        await doc.send(new PutCommand({
+          TableName: T.trees,
+          Item: toItem(item),
+          ConditionExpression: 'attribute_not_exists(pk)',
+        })).catch((err) => {
+          if (err.name !== 'ConditionalCheckFailedException') throw err;
+        });
+      }
+      migrated[table] += page.length;
+    }
+  }
+  return migrated;
+}
+
+// ---------- Frontier migration ----------
+const FRONTIER_MIGRATION_USERS = 100;
+
+/**
+ * Bring one page of users up to the indexed frontier layout: add the gsi_node keys to unlock items
+ * written without them, and store the frontier of every user without a FRONTIER_META marker (or with
+ * frontier items from before the index). Returns { users, indexed, rebuilt, cursor }; call again with
+ * the returned cursor until it is null. Finished users are skipped, so it is safe to re-run from scratch.
+ */
+export async function migrateFrontiers({ cursor = null, limit = FRONTIER_MIGRATION_USERS } = {}) {
+  const { Items, LastEvaluatedKey } = await doc.send(new ScanCommand({
+    TableName: T.users,
+    ProjectionExpression: 'id',
+    Limit: limit,
+    ...(cursor ? { ExclusiveStartKey: cursor } : {}),
+  }));
+  let edges = null;
+  const result = { users: 0, indexed: 0, rebuilt: 0, cursor: LastEvaluatedKey || null };
+  for (const { id: userId } of Items || []) {
+    result.users += 1;
+    const partition = await queryUserPartition(userId);
+    const unindexed = partition.filter((item) => isUnlockItem(item) && item.gsi_pk === undefined);
+    await batchWrite(T.userUnlockedNodes, unindexed.map((item) => ({
+      PutRequest: { Item: { ...item, ...unlockIndexKeys(userId, item.node_id) } },
+    })));
+    result.indexed += unindexed.length;
+
+    const built = partition.some((item) => item.sk === FRONTIER_META_SK)
+      && partition.every((item) => !isFrontierItem(item) || item.gsi_pk !== undefined);
+    if (built) continue;
+    // The edge list is only read once per call, and only if some user needs it
+    edges = edges || await listEdges();
+    await storeFrontier(userId, partition, edges);
+    result.rebuilt += 1;
+  }
+  return result;
+}
+
 // ---------- Helpers ----------
-const KEY_ATTRS = new Set(['pk', 'sk', 'gsi_pk', 'gsi_sk', 'gsi_child_pk', 'gsi_child_sk', 'gsi_parent_pk', 'gsi_parent_sk', 'gsi_unlock_type_pk', 'gsi_unlock_type_sk']);
+const BATCH_WRITE_LIMIT = 25;
+const BATCH_WRITE_ATTEMPTS = 5;
+
+/** BatchWrite in chunks of 25, resubmitting whatever DynamoDB hands back as unprocessed. */
+async function batchWrite(table, requests) {
+  for (let i = 0; i < requests.length; i += BATCH_WRITE_LIMIT) {
+    let pending = { [table]: requests.slice(i, i + BATCH_WRITE_LIMIT) };
+    for (let attempt = 0; pending[table]?.length; attempt++) {
+      if (attempt === BATCH_WRITE_ATTEMPTS) throw new Error(`BatchWrite to ${table} left items unprocessed`);
+      if (attempt > 0) await new Promise((r) => setTimeout(r, 50 * 2 ** attempt));
+      const { UnprocessedItems } = await doc.send(new BatchWriteCommand({ RequestItems: pending }));
+      pending = UnprocessedItems || {};
+    }
+  }
+}
+
+const KEY_ATTRS = new Set(['pk', 'sk', 'entity', 'gsi_pk', 'gsi_sk', 'gsi_child_pk', 'gsi_child_sk', 'gsi_parent_pk', 'gsi_parent_sk', 'gsi_unlock_type_pk', 'gsi_unlock_type_sk']);
 function stripKeys(item) {
   if (!item) return null;
   const out = { ...item };
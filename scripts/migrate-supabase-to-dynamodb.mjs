@@ -78,6 +78,44 @@ async function lambdaCall(action, params = {}) {
   return json.data;
 }
 
+/** Stream a list action's rows as the Lambda writes them (NDJSON, see lambda/index.js STREAMS). */
+async function* lambdaStream(action, params = {}) {
+  const res = await fetch(lambdaUrl, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ action, params, stream: true }),
+  });
+  if (!res.ok) throw new Error(`${action}: Lambda returned ${res.status} ${await res.text()}`);
+  let buffered = '';
+  for await (const chunk of res.body.pipeThrough(new TextDecoderStream())) {
+    buffered += chunk;
+    const lines = buffered.split('\n');
+    buffered = lines.pop();
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      const row = JSON.parse(line);
+      if (row.$error) throw new Error(`${action}: ${row.$error}`);
+      if (row.$done) return;
+      yield row;
+    }
+  }
+  throw new Error(`${action}: stream ended early`);
+}
+
+/** Count what landed in DynamoDB without holding the tables in memory. */
+async function verify(expected) {
+  console.log('\nVerifying via streamed reads');
+  let mismatches = 0;
+  for (const [action, want] of Object.entries(expected)) {
+    let got = 0;
+    for await (const _row of lambdaStream(action)) got += 1;
+    const ok = got >= want;
+    if (!ok) mismatches += 1;
+    console.log(`${action}: ${got} in DynamoDB, ${want} migrated${ok ? '' : '  <-- MISSING ROWS'}`);
+  }
+  if (mismatches > 0) throw new Error(`Verification failed for ${mismatches} table(s)`);
+}
+
 const supabase = createClient(supabaseUrl, supabaseKey);
 const now = () => new Date().toISOString();
 
@@ -232,6 +270,16 @@ async function migrate() {
   }
   console.log('user_unlocked_nodes:', unlockRows.length);
 
+  // 7b. Unlock frontiers: index and store every user's frontier, one page of users per call
+  let frontierCursor = null;
+  let frontiersRebuilt = 0;
+  do {
+    const page = await lambdaCall('MigrateFrontiers', { cursor: frontierCursor });
+    frontiersRebuilt += page.rebuilt;
+    frontierCursor = page.cursor;
+  } while (frontierCursor);
+  console.log('unlock frontiers rebuilt:', frontiersRebuilt);
+
   // 8. User events (batch via InsertUserEvents)
   const { data: events, error: eventsErr } = await supabase.from('user_events').select('*');
   if (eventsErr) throw new Error('user_events: ' + eventsErr.message);
@@ -372,6 +420,13 @@ async function migrate() {
   }
   console.log('introduction_tree_node_videos:', (introVids || []).length);
 
+  await verify({
+    ListUsers: userRecords.length,
+    ListNodes: nodeRecords.length,
+    ListEdges: (edges || []).length,
+    ListAllUnlocks: unlockRows.length,
+  });
+
   console.log('\nMigration complete.');
 }
 
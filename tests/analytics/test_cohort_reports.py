@@ -0,0 +1,106 @@
+"""
+Tests for the columnar export and cohort reports
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from analytics import columnar, reports
+
+T0 = '2026-01-01T00:00:00.000Z'
+
+
+def _at(hours):
+    return f'2026-01-01T{hours:02d}:00:00.000Z'
+
+
+class TestCohortReports(unittest.TestCase):
+    """Build a tiny export (root -> a -> b, root -> c) and check every report against it"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        nodes = [
+            {'pk': 'NODE#root', 'id': 'root', 'key': 'root', 'title': 'Root', 'is_root': True},
+            {'pk': 'NODE#a', 'id': 'a', 'key': 'a', 'title': 'A', 'is_root': False},
+            {'pk': 'NODE#b', 'id': 'b', 'key': 'b', 'title': 'B', 'is_root': False},
+            {'pk': 'NODE#c', 'id': 'c', 'key': 'c', 'title': 'C', 'is_root': False},
+        ]
+        edges = [
+            {'pk': 'EDGE#1', 'id': '1', 'parent_id': 'root', 'child_id': 'a', 'unlock_type': 'always'},
+            {'pk': 'EDGE#2', 'id': '2', 'parent_id': 'a', 'child_id': 'b', 'unlock_type': 'manual'},
+            {'pk': 'EDGE#3', 'id': '3', 'parent_id': 'root', 'child_id': 'c', 'unlock_type': 'symptom_match'},
+        ]
+        unlocks = [
+            ('u1', 'root', 0), ('u1', 'a', 1), ('u1', 'b', 5),
+            ('u2', 'root', 0), ('u2', 'a', 3),
+            ('u3', 'root', 0),
+        ]
+        unlock_items = [
+            {'pk': f'USER#{u}', 'sk': f'UNLOCK#{n}', 'user_id': u, 'node_id': n, 'unlocked_at': _at(h)}
+            for u, n, h in unlocks
+        ]
+        # Frontier items share the partition and must be ignored
+        unlock_items.append({'pk': 'USER#u3', 'sk': 'FRONTIER#a#1', 'user_id': 'u3', 'node_id': 'a'})
+        # DynamoDB JSON, as written by a point-in-time export
+        events = [
+            {'Item': {'pk': {'S': 'USER#u1'}, 'sk': {'S': f'EVENT#{_at(6)}#e1'}, 'user_id': {'S': 'u1'},
+                      'type': {'S': 'login'}, 'created_at': {'S': _at(6)}}},
+        ]
+
+        self.paths = {}
+        for name, rows in (('nodes', nodes), ('edges', edges), ('unlocks', unlock_items), ('events', events)):
+            path = os.path.join(self.tmp.name, f'{name}.jsonl')
+            with open(path, 'w') as f:
+                f.write('\n'.join(json.dumps(r) for r in rows))
+            self.paths[name] = path
+
+        self.out = os.path.join(self.tmp.name, 'cohort.npz')
+        self.counts = columnar.export(
+            self.paths['unlocks'], self.paths['events'], self.paths['nodes'], self.paths['edges'], self.out
+        )
+        self.data = columnar.load(self.out)
+        self.code = {node_id: i for i, node_id in enumerate(self.data['node_ids'])}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_export_counts(self):
+        """Test export keeps only unlock and event rows and encodes every id"""
+        self.assertEqual(self.counts, {'nodes': 4, 'edges': 3, 'users': 3, 'unlocks': 6, 'events': 1})
+
+    def test_reach_counts(self):
+        """Test per-node reach"""
+        reach = reports.reach_counts(self.data)
+        self.assertEqual(
+            {n: int(reach[self.code[n]]) for n in ('root', 'a', 'b', 'c')},
+            {'root': 3, 'a': 2, 'b': 1, 'c': 0},
+        )
+
+    def test_time_to_unlock(self):
+        """Test time from root unlock per node"""
+        ttu = reports.time_to_unlock(self.data, quantiles=(0.5,))
+        a = self.code['a']
+        self.assertEqual(int(ttu['count'][a]), 2)
+        self.assertEqual(ttu[0.5][a], 3600)  # lower median of 1h and 3h
+        self.assertTrue(ttu[0.5][self.code['c']] != ttu[0.5][self.code['c']])  # NaN: nobody reached c
+
+    def test_edge_dropoff(self):
+        """Test drop-off along each edge"""
+        drop = reports.edge_dropoff(self.data)
+        # Edge order follows the export: root->a, a->b, root->c
+        self.assertEqual(list(drop['parent_reach']), [3, 2, 3])
+        self.assertEqual(list(drop['both']), [2, 1, 0])
+        self.assertAlmostEqual(drop['dropoff'][1], 0.5)
+
+    def test_stalled_at(self):
+        """Test inactive users are counted at their last unlocked node"""
+        now = columnar._epoch_seconds(T0) + 30 * reports.DAY
+        stalled = reports.stalled_at(self.data, now=now, inactive_days=14)
+        self.assertEqual(int(stalled[self.code['b']]), 1)
+        self.assertEqual(int(stalled[self.code['a']]), 1)
+        self.assertEqual(int(stalled[self.code['root']]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -210,6 +210,28 @@ class TestAdminAPI(unittest.TestCase):
         self.assertIn('users', response_data)
         self.assertIsInstance(response_data['users'], list)
     
+    def test_admin_read_endpoints_support_conditional_get(self):
+        """Test admin GET endpoints return an ETag and answer a matching If-None-Match with 304"""
+        if not self.admin_session:
+            self.skipTest("Admin session not available")
+
+        for path in ('category-videos', 'bonus-content', 'positions', 'introduction-tree'):
+            with self.subTest(path=path):
+                response = requests.get(
+                    f"{self.api_url}/admin/{path}",
+                    headers=self._get_authenticated_headers()
+                )
+                self.assertEqual(response.status_code, 200)
+                etag = response.headers.get('ETag')
+                self.assertIsNotNone(etag)
+                self.assertIn('private', response.headers.get('Cache-Control', ''))
+
+                headers = self._get_authenticated_headers()
+                headers['If-None-Match'] = etag
+                revalidated = requests.get(f"{self.api_url}/admin/{path}", headers=headers)
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated.content, b'')
+
     def test_admin_clear_data_unauthorized(self):
         """Test admin clear data without authentication"""
         response = requests.post(
@@ -128,6 +128,32 @@ class TestPatientAPI(unittest.TestCase):
         else:
             self.assertIn('error', response_data)
     
+    def test_unlock_node_repeat_is_idempotent(self):
+        """Test repeating an unlock reports the existing unlock instead of failing or duplicating it"""
+        if not self.user_session:
+            self.skipTest("User session not available")
+
+        data = {'nodeId': 'unlockable-test-node-id'}
+
+        first = requests.post(
+            f"{self.api_url}/unlock-node",
+            headers=self._get_authenticated_headers(),
+            json=data
+        )
+        second = requests.post(
+            f"{self.api_url}/unlock-node",
+            headers=self._get_authenticated_headers(),
+            json=data
+        )
+
+        self.assertIn(first.status_code, [200, 400])
+        if first.status_code == 200:
+            self.assertEqual(second.status_code, 200)
+            response_data = second.json()
+            self.assertTrue(response_data.get('alreadyUnlocked'))
+            self.assertEqual(response_data['unlocked'], [data['nodeId']])
+            self.assertEqual(response_data['cascaded'], [])
+
     def test_unlock_by_symptoms_unauthorized(self):
         """Test unlock by symptoms without authentication"""
         data = {'symptoms': ['pain', 'nausea']}
@@ -176,6 +202,28 @@ class TestPatientAPI(unittest.TestCase):
         response_data = response.json()
         self.assertEqual(response_data['unlockedNodes'], [])
 
+    def test_unlock_by_symptoms_returns_delta(self):
+        """Test unlock by symptoms returns the unlock delta for in-place client updates"""
+        if not self.user_session:
+            self.skipTest("User session not available")
+
+        data = {'symptoms': []}
+
+        response = requests.post(
+            f"{self.api_url}/unlock-by-symptoms",
+            headers=self._get_authenticated_headers(),
+            json=data
+        )
+
+        self.assertEqual(response.status_code, 200)
+        response_data = response.json()
+        for key in ('unlocked', 'cascaded', 'frontier'):
+            self.assertIn(key, response_data)
+            self.assertIsInstance(response_data[key], list)
+        for entry in response_data['frontier']:
+            self.assertIn('node_id', entry)
+            self.assertIn('edge_id', entry)
+
 
 class TestPublicEndpoints(unittest.TestCase):
     """Test public endpoints that don't require authentication"""
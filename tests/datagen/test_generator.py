@@ -0,0 +1,115 @@
+"""
+Tests for the synthetic data generator
+"""
+import os
+import re
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from datagen.generate import Config, Generator
+from datagen.writers import SqlWriter, dynamo_item, shard_of
+
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _rows(**overrides):
+    config = Config(scale=1, seed=7, now=NOW, **overrides)
+    generator = Generator(config)
+    rows = {}
+    for table, row in generator.rows():
+        rows.setdefault(table, []).append(row)
+    return rows
+
+
+class TestGenerator(unittest.TestCase):
+    """Test generated data is deterministic and internally consistent"""
+
+    def setUp(self):
+        self.rows = _rows()
+
+    def test_same_seed_same_data(self):
+        """Test the same seed reproduces the same dataset"""
+        self.assertEqual(self.rows, _rows())
+
+    def test_scale_sets_sizes(self):
+        """Test --scale multiplies today's size and overrides win"""
+        self.assertEqual(len(self.rows['nodes']), 25)
+        self.assertEqual(len(self.rows['users']), 50)
+        self.assertEqual(len(_rows(users=3)['users']), 3)
+
+    def test_referential_integrity(self):
+        """Test edges, unlocks and frontier entries only point at generated nodes and users"""
+        node_ids = {n['id'] for n in self.rows['nodes']}
+        user_ids = {u['id'] for u in self.rows['users']}
+        for edge in self.rows['edges']:
+            self.assertIn(edge['parent_id'], node_ids)
+            self.assertIn(edge['child_id'], node_ids)
+        for unlock in self.rows['user_unlocked_nodes']:
+            self.assertIn(unlock['user_id'], user_ids)
+            self.assertIn(unlock['node_id'], node_ids)
+        pairs = [(u['user_id'], u['node_id']) for u in self.rows['user_unlocked_nodes']]
+        self.assertEqual(len(pairs), len(set(pairs)))
+
+    def test_frontier_matches_unlocks(self):
+        """Test every frontier entry leads from an unlocked parent to a locked child"""
+        unlocked = {(u['user_id'], u['node_id']) for u in self.rows['user_unlocked_nodes']}
+        for entry in self.rows['frontier']:
+            self.assertIn((entry['user_id'], entry['parent_id']), unlocked)
+            self.assertNotIn((entry['user_id'], entry['node_id']), unlocked)
+
+    def test_edge_mix(self):
+        """Test all unlock types and both symptom rule kinds are generated"""
+        edges = _rows(nodes=400)['edges']
+        self.assertEqual({e['unlock_type'] for e in edges}, {'always', 'manual', 'symptom_match'})
+        rules = {next(iter(e['unlock_value'])) for e in edges if e['unlock_type'] == 'symptom_match'}
+        self.assertEqual(rules, {'any', 'all'})
+
+    def test_sharded_keys_match_lambda(self):
+        """Test item keys use the same shard hash as lambda/operations.js"""
+        # Reference values computed with shardOf() from lambda/operations.js
+        self.assertEqual([shard_of(v) for v in ('a@b.com', 'root', 'skincare', '')], [1, 5, 1, 5])
+        user = dynamo_item('users', {'id': 'u1', 'email': 'a@b.com'})
+        self.assertEqual(user['gsi_pk'], 'EMAIL#1')
+        self.assertEqual(user['pk'], 'USER#u1')
+
+    def test_tree_items_share_one_collection(self):
+        """Test nodes, their videos and categories land in the main tree's item collection, node first"""
+        node = dynamo_item('nodes', {'id': 'n1', 'key': 'root', 'created_at': '2026-01-01T00:00:00Z'})
+        video = dynamo_item('node_videos', {'id': 'v1', 'node_id': 'n1', 'created_at': '2026-01-01T00:00:00Z'})
+        category = dynamo_item('node_categories', {'node_id': 'n1', 'category': 'pain'})
+        self.assertEqual({node['pk'], video['pk'], category['pk']}, {'TREE#main'})
+        self.assertEqual(node['gsi_pk'], 'NODE_KEY#5')
+        self.assertEqual(sorted([category['sk'], video['sk'], node['sk']])[0], node['sk'])
+        self.assertTrue(video['sk'].startswith(node['sk'] + '#'))
+        self.assertTrue(category['sk'].startswith(node['sk'] + '#'))
+
+    def test_unlock_items_are_indexed_for_edge_sync(self):
+        """Test unlocks and frontier items carry the gsi_node keys the Lambda's edge sync queries"""
+        unlock = dynamo_item('user_unlocked_nodes', {'user_id': 'u1', 'node_id': 'n1'})
+        entry = dynamo_item('frontier', {'user_id': 'u1', 'node_id': 'n2', 'edge_id': 'e1'})
+        self.assertEqual((unlock['gsi_pk'], unlock['gsi_sk']), ('NODE#n1', 'USER#u1'))
+        self.assertEqual((entry['gsi_pk'], entry['gsi_sk']), ('EDGE#e1', 'USER#u1'))
+
+    def test_sql_nodes_keep_their_video(self):
+        """Test no SQL node row is written without its video_url, even when every row fills a batch"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'seed.sql')
+            writer = SqlWriter(path, batch=1)
+            for table, row in Generator(Config(scale=1, seed=7, now=NOW)).rows():
+                writer.write(table, row)
+            writer.close()
+            with open(path, encoding='utf-8') as f:
+                sql = f.read()
+        statements = re.findall(r'insert into public\.nodes \(([^)]*)\) values\n(.*?);\n', sql, re.S)
+        video_urls = []
+        for cols, values in statements:
+            index = cols.split(', ').index('video_url')
+            for line in values.strip().split(',\n'):
+                video_urls.append(line.strip()[1:-1].split(', ')[index])
+        self.assertEqual(len(video_urls), len(self.rows['nodes']))
+        self.assertNotIn('null', video_urls)
+
+
+if __name__ == '__main__':
+    unittest.main()
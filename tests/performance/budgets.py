@@ -0,0 +1,308 @@
+"""
+Performance budgets for the backend endpoints.
+
+Every endpoint in ENDPOINTS is called against TEST_BASE_URL after one warm-up request, and the
+median latency of the measured runs is compared with baseline.json. When a data API upstream is
+given, a local stand-in for LAMBDA_DATA_API_URL forwards each Lambda call to it and counts the
+calls, so every endpoint is also charged with the data operations it made. For that, the web app
+has to be started with LAMBDA_DATA_API_URL pointing at the stand-in.
+"""
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+from datetime import datetime, timezone
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Read-only (or no-op for an existing test user) requests, measured with a warm catalog cache
+ENDPOINTS = {
+    'GET /': {'method': 'GET', 'path': '/', 'auth': None},
+    'GET /me': {'method': 'GET', 'path': '/me', 'auth': 'user'},
+    'POST /api/unlock-by-symptoms': {
+        'method': 'POST', 'path': '/api/unlock-by-symptoms', 'auth': 'user', 'json': {'symptoms': []},
+    },
+    'GET /admin': {'method': 'GET', 'path': '/admin', 'auth': 'admin'},
+    'GET /api/admin/positions': {'method': 'GET', 'path': '/api/admin/positions', 'auth': 'admin'},
+    'GET /api/admin/category-videos': {'method': 'GET', 'path': '/api/admin/category-videos', 'auth': 'admin'},
+    'GET /api/admin/bonus-content': {'method': 'GET', 'path': '/api/admin/bonus-content', 'auth': 'admin'},
+    'GET /api/admin/introduction-tree': {'method': 'GET', 'path': '/api/admin/introduction-tree', 'auth': 'admin'},
+    'GET /api/admin/symptoms': {'method': 'GET', 'path': '/api/admin/symptoms', 'auth': 'admin'},
+    'POST /api/admin/patients/search': {
+        'method': 'POST', 'path': '/api/admin/patients/search', 'auth': 'admin', 'json': {'searchTerm': 'test'},
+    },
+}
+
+
+class DataApiStandIn:
+    """Counting pass-through for the Lambda data API; one recorded action per forwarded call."""
+
+    def __init__(self, upstream, port=8787):
+        self.upstream = upstream
+        self.calls = []
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                try:
+                    action = json.loads(body or b'{}').get('action') or '?'
+                except ValueError:
+                    action = '?'
+                stand_in.record(action)
+
+                forward = urllib.request.Request(
+                    stand_in.upstream, data=body, headers={'Content-Type': 'application/json'}, method='POST'
+                )
+                try:
+                    with urllib.request.urlopen(forward, timeout=60) as upstream:
+                        status, content_type, payload = upstream.status, upstream.headers.get('Content-Type'), upstream.read()
+                except urllib.error.HTTPError as err:
+                    status, content_type, payload = err.code, err.headers.get('Content-Type'), err.read()
+
+                self.send_response(status)
+                self.send_header('Content-Type', content_type or 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def record(self, action):
+        with self._lock:
+            self.calls.append(action)
+
+    def take(self):
+        """Return and clear the actions recorded since the last call."""
+        with self._lock:
+            calls, self.calls = self.calls, []
+        return calls
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _login(base_url, auth):
+    """Return a requests session carrying the user's or admin's session cookie, or None."""
+    session = requests.Session()
+    if auth is None:
+        return session
+    if auth == 'admin':
+        response = session.post(f"{base_url}/api/admin/login", json={
+            'email': os.getenv('TEST_ADMIN_EMAIL', 'admin@example.com'),
+            'password': os.getenv('TEST_ADMIN_PASSWORD', 'password123'),
+        })
+    else:
+        response = session.post(f"{base_url}/api/login", json={'email': os.getenv('TEST_USER_EMAIL', 'test@example.com')})
+    return session if response.status_code == 200 and 'session' in session.cookies else None
+
+
+def measure(session, base_url, endpoint, runs=5, stand_in=None):
+    """Median latency and peak data-op count over `runs` requests, after one warm-up request.
+
+    A request that fails (HTTP status >= 400 or no response) ends the endpoint's measurement with
+    {'error': ...} instead of raising, so the other endpoints are still measured.
+    """
+    def call():
+        return session.request(
+            endpoint['method'], f"{base_url}{endpoint['path']}",
+            json=endpoint.get('json'), allow_redirects=False, timeout=60,
+        )
+
+    def failed(response):
+        return f"returned {response.status_code}" if response.status_code >= 400 else None
+
+    try:
+        warm_up = call()  # fills the catalog cache (and compiles the route under `next dev`)
+    except requests.RequestException as exc:
+        return {'error': f"request failed: {exc}"}
+    if failed(warm_up):
+        return {'error': failed(warm_up)}
+
+    latencies, op_counts, actions = [], [], Counter()
+    for _ in range(runs):
+        if stand_in:
+            stand_in.take()
+        start = time.perf_counter()
+        try:
+            response = call()
+        except requests.RequestException as exc:
+            return {'error': f"request failed: {exc}"}
+        latencies.append((time.perf_counter() - start) * 1000)
+        if failed(response):
+            return {'error': failed(response)}
+        if stand_in:
+            calls = stand_in.take()
+            op_counts.append(len(calls))
+            if len(calls) >= max(op_counts):
+                actions = Counter(calls)
+
+    result = {'latency_ms': round(statistics.median(latencies))}
+    if stand_in:
+        result['data_ops'] = max(op_counts)
+        result['actions'] = dict(actions)
+    return result
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(measured, path=BASELINE_PATH, source=None):
+    """Write measured numbers as the new baseline, keeping the allowances and unmeasured endpoints.
+
+    `source` describes where the numbers came from and replaces the baseline's previous one.
+    """
+    baseline = load_baseline(path) if os.path.exists(path) else {'allowance': {'latency_pct': 50, 'data_ops': 0}}
+    if source is not None:
+        baseline['source'] = source
+    endpoints = baseline.setdefault('endpoints', {})
+    for name, result in measured.items():
+        if 'error' in result:
+            continue
+        entry = endpoints.setdefault(name, {})
+        entry['latency_ms'] = result['latency_ms']
+        if 'data_ops' in result:
+            entry['data_ops'] = result['data_ops']
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+
+
+def latency_enforced(baseline):
+    """Latency budgets only gate once they come from a measured run (see save_baseline)."""
+    return baseline.get('source', {}).get('latency_measured', True)
+
+
+def compare(measured, baseline):
+    """Return {endpoint: [(metric, baseline, measured, budget)]} for every budget that was exceeded.
+
+    An endpoint whose measurement failed is reported as ('error', None, message, None).
+    """
+    allowance = baseline.get('allowance', {})
+    latency_pct = allowance.get('latency_pct', 50)
+    op_slack = allowance.get('data_ops', 0)
+    failures = {}
+    for name, result in measured.items():
+        if 'error' in result:
+            failures[name] = [('error', None, result['error'], None)]
+            continue
+        expected = baseline.get('endpoints', {}).get(name)
+        if expected is None:
+            continue
+        over = []
+        latency_budget = round(expected['latency_ms'] * (1 + latency_pct / 100))
+        if latency_enforced(baseline) and result['latency_ms'] > latency_budget:
+            over.append(('latency_ms', expected['latency_ms'], result['latency_ms'], latency_budget))
+        if 'data_ops' in result and 'data_ops' in expected:
+            op_budget = expected['data_ops'] + op_slack
+            if result['data_ops'] > op_budget:
+                over.append(('data_ops', expected['data_ops'], result['data_ops'], op_budget))
+        if over:
+            failures[name] = over
+    return failures
+
+
+def format_diff(failures, measured):
+    lines = []
+    for name, over in failures.items():
+        lines.append(f"  {name}")
+        for metric, expected, got, budget in over:
+            if metric == 'error':
+                lines.append(f"    {metric:<11} {got}")
+                continue
+            change = f"{(got - expected) / expected:+.0%}" if expected else f"{got - expected:+d}"
+            lines.append(f"    {metric:<11} baseline {expected:>6}  measured {got:>6}  ({change}, budget {budget})")
+        actions = measured[name].get('actions')
+        if actions and any(metric == 'data_ops' for metric, *_ in over):
+            listed = ', '.join(f"{action} x{n}" for action, n in sorted(actions.items(), key=lambda a: -a[1]))
+            lines.append(f"    {'':<11} calls: {listed}")
+    return '\n'.join(lines)
+
+
+def run_budget_checks(base_url, runs=5, upstream=None, port=8787, update_baseline=False, baseline_path=BASELINE_PATH):
+    """Measure every endpoint; print the table and either the diff or the updated baseline. Returns success."""
+    stand_in = DataApiStandIn(upstream, port).start() if upstream else None
+    if stand_in:
+        print(f"Data API stand-in on {stand_in.url} -> {upstream}")
+        print("The web app must run with LAMBDA_DATA_API_URL set to that address.")
+    else:
+        print("No data API upstream given: checking latency only.")
+
+    measured = {}
+    try:
+        sessions = {auth: _login(base_url, auth) for auth in {e['auth'] for e in ENDPOINTS.values()}}
+        for name, endpoint in ENDPOINTS.items():
+            session = sessions[endpoint['auth']]
+            if session is None:
+                print(f"  {name:<40} skipped ({endpoint['auth']} session not available)")
+                continue
+            measured[name] = measure(session, base_url, endpoint, runs, stand_in)
+            if 'error' in measured[name]:
+                print(f"  {name:<40} failed: {measured[name]['error']}")
+                continue
+            ops = measured[name].get('data_ops', '-')
+            print(f"  {name:<40} {measured[name]['latency_ms']:>6} ms  {ops:>4} data ops")
+    finally:
+        if stand_in:
+            stand_in.stop()
+
+    if stand_in and measured and not any(result.get('data_ops') for result in measured.values()):
+        print("WARNING: no data calls reached the stand-in; is LAMBDA_DATA_API_URL pointing at it?")
+
+    errors = {name: result['error'] for name, result in measured.items() if 'error' in result}
+    if update_baseline:
+        for name, error in errors.items():
+            print(f"Not recorded: {name} ({error})")
+        save_baseline(measured, baseline_path, source={
+            'recorded_by': 'run_tests.py --budget --update-baseline',
+            'latency_measured': True,
+            'recorded_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'base_url': base_url,
+            'runs': runs,
+            'data_ops_counted': stand_in is not None,
+            'host': platform.node(),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+        })
+        print(f"Baseline written to {baseline_path}")
+        return not errors
+
+    baseline = load_baseline(baseline_path)
+    if not latency_enforced(baseline):
+        print("Latency budgets are not measured yet (baseline.json source); only data ops and errors are checked.")
+    failures = compare(measured, baseline)
+    if failures:
+        print("\nBudget checks failed:")
+        print(format_diff(failures, measured))
+        return False
+    print("\nAll endpoints within budget.")
+    return True
@@ -0,0 +1,137 @@
+"""
+Tests for the performance budget comparison and the data API stand-in
+"""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from .budgets import DataApiStandIn, compare, format_diff, load_baseline, measure, save_baseline
+
+BASELINE = {
+    'allowance': {'latency_pct': 50, 'data_ops': 0},
+    'endpoints': {
+        'GET /me': {'latency_ms': 400, 'data_ops': 1},
+        'GET /admin': {'latency_ms': 800, 'data_ops': 2},
+    },
+}
+
+
+class _FakeLambda(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        payload = json.dumps({'success': True, 'data': body['action']}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Failing(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(500)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestBudgetComparison(unittest.TestCase):
+    """Test measured numbers are held against the baseline plus allowance"""
+
+    def test_within_allowance_passes(self):
+        """Test latency up to the percentage allowance and equal data ops pass"""
+        measured = {'GET /me': {'latency_ms': 600, 'data_ops': 1}, 'GET /admin': {'latency_ms': 900, 'data_ops': 2}}
+        self.assertEqual(compare(measured, BASELINE), {})
+
+    def test_exceeded_budgets_are_reported_per_endpoint(self):
+        """Test every exceeded metric is reported with baseline, measurement and budget"""
+        measured = {
+            'GET /me': {'latency_ms': 601, 'data_ops': 200, 'actions': {'GetUserOverlay': 1, 'ListNodeVideos': 199}},
+            'GET /admin': {'latency_ms': 800, 'data_ops': 2},
+        }
+        failures = compare(measured, BASELINE)
+        self.assertEqual(failures, {'GET /me': [('latency_ms', 400, 601, 600), ('data_ops', 1, 200, 1)]})
+        diff = format_diff(failures, measured)
+        self.assertIn('GET /me', diff)
+        self.assertIn('ListNodeVideos x199', diff)
+        self.assertNotIn('GET /admin', diff)
+
+    def test_latency_only_runs_skip_data_ops(self):
+        """Test measurements without data_ops (no stand-in) are only checked for latency"""
+        self.assertEqual(compare({'GET /me': {'latency_ms': 100}}, BASELINE), {})
+
+    def test_unmeasured_latency_is_not_enforced(self):
+        """Test a baseline whose latency was not measured only gates data ops"""
+        baseline = {**BASELINE, 'source': {'latency_measured': False}}
+        measured = {'GET /me': {'latency_ms': 5000, 'data_ops': 2}}
+        self.assertEqual(compare(measured, baseline), {'GET /me': [('data_ops', 1, 2, 1)]})
+
+    def test_failed_endpoint_is_reported_and_others_still_checked(self):
+        """Test a failed measurement is a failure of its own endpoint without hiding the rest"""
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _Failing)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            host, port = server.server_address[:2]
+            result = measure(requests.Session(), f'http://{host}:{port}', {'method': 'GET', 'path': '/me'}, runs=2)
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(result, {'error': 'returned 500'})
+        measured = {'GET /me': result, 'GET /admin': {'latency_ms': 2000, 'data_ops': 2}}
+        failures = compare(measured, BASELINE)
+        self.assertEqual(failures['GET /me'], [('error', None, 'returned 500', None)])
+        self.assertEqual(failures['GET /admin'], [('latency_ms', 800, 2000, 1200)])
+        self.assertIn('returned 500', format_diff(failures, measured))
+
+    def test_update_keeps_allowance_and_unmeasured_endpoints(self):
+        """Test saving a new baseline only replaces the measured endpoints"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.json')
+            with open(path, 'w') as f:
+                json.dump(BASELINE, f)
+            save_baseline(
+                {'GET /me': {'latency_ms': 350, 'data_ops': 1, 'actions': {'GetUserOverlay': 1}}}, path,
+                source={'recorded_by': 'test'},
+            )
+            saved = load_baseline(path)
+        self.assertEqual(saved['source'], {'recorded_by': 'test'})
+        self.assertEqual(saved['allowance'], BASELINE['allowance'])
+        self.assertEqual(saved['endpoints']['GET /me'], {'latency_ms': 350, 'data_ops': 1})
+        self.assertEqual(saved['endpoints']['GET /admin'], BASELINE['endpoints']['GET /admin'])
+
+
+class TestDataApiStandIn(unittest.TestCase):
+    """Test the stand-in forwards Lambda calls unchanged and counts them"""
+
+    def setUp(self):
+        self.upstream = ThreadingHTTPServer(('127.0.0.1', 0), _FakeLambda)
+        threading.Thread(target=self.upstream.serve_forever, daemon=True).start()
+        host, port = self.upstream.server_address[:2]
+        self.stand_in = DataApiStandIn(f'http://{host}:{port}', port=0).start()
+
+    def tearDown(self):
+        self.stand_in.stop()
+        self.upstream.shutdown()
+        self.upstream.server_close()
+
+    def test_calls_are_forwarded_and_counted(self):
+        """Test each call reaches the upstream and is recorded by action until taken"""
+        for action in ('GetUserOverlay', 'ListNodes', 'ListNodes'):
+            response = requests.post(self.stand_in.url, json={'action': action, 'params': {}})
+            self.assertEqual(response.json(), {'success': True, 'data': action})
+        self.assertEqual(self.stand_in.take(), ['GetUserOverlay', 'ListNodes', 'ListNodes'])
+        self.assertEqual(self.stand_in.take(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ import unittest
 import argparse
 from dotenv import load_dotenv
 
+from performance.budgets import run_budget_checks
+
 # Load environment variables
 load_dotenv()  # Load from tests/.env for local testing
 # In CI/CD, environment variables are provided by GitHub Secrets
@@ -66,6 +68,20 @@ def run_all_tests():
     
     return backend_success
 
+def run_budget_tests(args):
+    """Check endpoint latency and data-op counts against tests/performance/baseline.json"""
+    print("=" * 60)
+    print("RUNNING PERFORMANCE BUDGETS")
+    print("=" * 60)
+
+    return run_budget_checks(
+        os.getenv('TEST_BASE_URL', 'http://localhost:3000'),
+        runs=args.budget_runs,
+        upstream=args.data_upstream,
+        port=args.data_port,
+        update_baseline=args.update_baseline,
+    )
+
 def validate_environment():
     """Validate that required environment variables are set"""
     required_vars = [
@@ -97,6 +113,13 @@ def main():
     parser.add_argument('--frontend', action='store_true', help='Run only frontend tests')
     parser.add_argument('--validate-env', action='store_true', help='Only validate environment setup')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--budget', action='store_true', help='Run only the performance budget checks')
+    parser.add_argument('--update-baseline', action='store_true', help='With --budget, save the measured numbers as the new baseline')
+    parser.add_argument('--budget-runs', type=int, default=5, help='Measured requests per endpoint (default: 5)')
+    parser.add_argument('--data-upstream', default=os.getenv('BUDGET_DATA_UPSTREAM'),
+                        help='Real Lambda data API URL; enables data-op budgets via the local stand-in')
+    parser.add_argument('--data-port', type=int, default=int(os.getenv('BUDGET_DATA_PORT', '8787')),
+                        help='Port of the data API stand-in (default: 8787)')
     
     args = parser.parse_args()
     
@@ -114,7 +137,9 @@ def main():
     verbosity = 2 if args.verbose else 1
     
     try:
-        if args.backend:
+        if args.budget:
+            success = run_budget_tests(args)
+        elif args.backend:
             success = run_backend_tests()
         elif args.frontend:
             success = run_frontend_tests()
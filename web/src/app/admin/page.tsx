@@ -1,12 +1,14 @@
 import { getSessionUser } from '@/lib/session';
 import { AdminLoginForm } from '@/components/AdminLoginForm';
 import { AdminLayout } from '@/components/AdminLayout';
-import { listUsers, listAllUnlocks } from '@/lib/lambdaDataClient';
+import { streamUsers, streamAllUnlocks } from '@/lib/lambdaDataClient';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { Users, Activity, TrendingUp, UserPlus, Edit, Search, Clock, TreePine } from 'lucide-react';
 import Link from 'next/link';
 
+const RECENT_UNLOCKS = 100;
+
 export default async function AdminPage() {
   const user = await getSessionUser();
   if (!user?.admin) {
@@ -46,20 +48,33 @@ export default async function AdminPage() {
     );
   }
 
-  const [users, allUnlocks] = await Promise.all([listUsers(), listAllUnlocks()]);
-  const userCount = users.length;
-  const totalUnlocks = allUnlocks.length;
+  // Both tables are streamed and folded into the counters as rows arrive, so memory stays flat as they grow
   const sevenDaysAgo = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000).toISOString();
   const oneDayAgo = new Date(Date.now() - 24 * 60 * 60 * 1000).toISOString();
-  const activeUserIds = new Set(
-    allUnlocks.filter((u) => (u.unlocked_at ?? '') >= sevenDaysAgo).map((u) => u.user_id)
-  );
-  const recentActivityCount = allUnlocks.filter((u) => (u.unlocked_at ?? '') >= oneDayAgo).length;
-  const progressStatsData = allUnlocks
-    .sort((a, b) => (b.unlocked_at ?? '').localeCompare(a.unlocked_at ?? ''))
-    .slice(0, 100)
-    .map((u) => ({ user_id: u.user_id, unlocked_at: u.unlocked_at }));
-  const userIdToEmail = new Map(users.map((u) => [u.id, u.email]));
+  const userIdToEmail = new Map<string, string>();
+  const activeUserIds = new Set<string>();
+  let totalUnlocks = 0;
+  let recentActivityCount = 0;
+  let progressStatsData: Array<{ user_id: string; unlocked_at?: string }> = [];
+  const keepLatest = (rows: typeof progressStatsData) =>
+    rows.sort((a, b) => (b.unlocked_at ?? '').localeCompare(a.unlocked_at ?? '')).slice(0, RECENT_UNLOCKS);
+
+  await Promise.all([
+    (async () => {
+      for await (const u of streamUsers()) userIdToEmail.set(u.id, u.email);
+    })(),
+    (async () => {
+      for await (const u of streamAllUnlocks()) {
+        totalUnlocks++;
+        if ((u.unlocked_at ?? '') >= sevenDaysAgo) activeUserIds.add(u.user_id);
+        if ((u.unlocked_at ?? '') >= oneDayAgo) recentActivityCount++;
+        progressStatsData.push({ user_id: u.user_id, unlocked_at: u.unlocked_at });
+        if (progressStatsData.length >= RECENT_UNLOCKS * 2) progressStatsData = keepLatest(progressStatsData);
+      }
+    })(),
+  ]);
+  progressStatsData = keepLatest(progressStatsData);
+  const userCount = userIdToEmail.size;
   const avgProgress = userCount > 0 ? Math.round(totalUnlocks / userCount) : 0;
 
   return (
@@ -1,6 +1,6 @@
 import { getSessionUser } from '@/lib/session';
 import { redirect } from 'next/navigation';
-import { listNodes, listCategoriesByNode, listNodeVideos, listEdges } from '@/lib/lambdaDataClient';
+import { getCatalog } from '@/lib/catalog';
 import { NodeEditor } from '@/components/NodeEditor';
 import { AdminTreeView } from '@/components/AdminTreeView';
 import { AdminLayout } from '@/components/AdminLayout';
@@ -21,54 +21,13 @@ type Node = {
 };
 type Edge = { id: string; parent_id: string; child_id: string; unlock_type: 'always' | 'manual' | 'symptom_match'; unlock_value: unknown; description?: string | null; weight?: number };
 
-type AppNode = {
-  id: string;
-  key: string;
-  title: string;
-  summary: string | null;
-  is_root: boolean;
-  categories?: string[];
-  node_videos: { id: string; video_url: string; title: string; order_index: number }[];
-};
-
-type AppEdge = {
-  id: string;
-  parent_id: string;
-  child_id: string;
-  unlock_type: 'always' | 'manual' | 'symptom_match';
-  unlock_value: Record<string, unknown> | null;
-  description?: string | null;
-  weight?: number;
-};
-
 export default async function TreePage() {
   const user = await getSessionUser();
   if (!user?.admin) {
     redirect('/admin');
   }
 
-  const [nodesRaw, edgesRaw] = await Promise.all([listNodes(), listEdges()]);
-  const nodes: AppNode[] = await Promise.all(
-    nodesRaw.map(async (node) => {
-      const [categories, nodeVideos] = await Promise.all([
-        listCategoriesByNode((node as { id: string }).id),
-        listNodeVideos((node as { id: string }).id),
-      ]);
-      return {
-        id: (node as { id: string }).id,
-        key: (node as { key: string }).key,
-        title: (node as { title: string }).title,
-        summary: (node as { summary?: string | null }).summary ?? null,
-        is_root: (node as { is_root?: boolean }).is_root ?? false,
-        order_index: (node as { order_index?: number }).order_index ?? 0,
-        pos_x: (node as { pos_x?: number | null }).pos_x,
-        pos_y: (node as { pos_y?: number | null }).pos_y,
-        categories: categories.map((c) => c.category),
-        node_videos: nodeVideos.map((v) => ({ id: v.id, video_url: v.video_url, title: v.title, order_index: v.order_index })),
-      };
-    })
-  );
-  const edges = edgesRaw.sort((a, b) => (b.weight ?? 0) - (a.weight ?? 0)) as AppEdge[];
+  const { nodes, edges } = await getCatalog();
 
   return (
     <AdminLayout>
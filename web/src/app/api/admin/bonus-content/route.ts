@@ -1,8 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { getCatalog, revalidateCatalog } from '@/lib/catalog';
+import { conditionalJson } from '@/lib/conditionalGet';
 import {
-  listBonusContentVideos,
-  listBonusContentPositions,
   putBonusContentPosition,
   deleteBonusContentVideosByCategory,
   putBonusContentVideo,
@@ -13,20 +13,12 @@ export async function GET(req: NextRequest) {
   if (!user?.admin) return NextResponse.json({ error: 'unauthorized' }, { status: 401 });
 
   try {
-    const [videos, positions] = await Promise.all([listBonusContentVideos(), listBonusContentPositions()]);
-    const videosByCategory = videos.reduce((acc, video) => {
-      if (!acc[video.category]) acc[video.category] = [];
-      acc[video.category].push(video);
-      return acc;
-    }, {} as Record<string, typeof videos>);
-    const positionsMap = positions.reduce(
-      (acc, pos) => {
-        acc[pos.category] = { pos_x: pos.pos_x, pos_y: pos.pos_y, width: pos.width, height: pos.height };
-        return acc;
-      },
-      {} as Record<string, { pos_x: number; pos_y: number; width: number; height: number }>
-    );
-    return NextResponse.json({ videos: videosByCategory, positions: positionsMap });
+    // Served from the cached catalog, which every POST here revalidates
+    const catalog = await getCatalog();
+    return conditionalJson(req, catalog.version, () => ({
+      videos: catalog.bonusContentVideos,
+      positions: catalog.bonusContentPositions,
+    }));
   } catch (err) {
     console.error('Failed to fetch bonus content:', err);
     return NextResponse.json({ error: 'Failed to fetch' }, { status: 500 });
@@ -66,6 +58,7 @@ export async function POST(req: NextRequest) {
         });
       }
     }
+    revalidateCatalog();
     return NextResponse.json({ ok: true });
   } catch (err) {
     console.error('Failed to save bonus content:', err);
@@ -1,7 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { getIntroductionTree, revalidateIntroductionTree } from '@/lib/catalog';
+import { conditionalJson, dataVersion } from '@/lib/conditionalGet';
+import { resolveVimeoPosters } from '@/lib/vimeoPosters';
 import {
-  listIntroTreeNodes,
   listIntroTreeNodeVideos,
   getIntroNodeByKey,
   putIntroTreeNode,
@@ -15,24 +17,10 @@ export async function GET(req: NextRequest) {
   if (!user) return NextResponse.json({ error: 'unauthorized' }, { status: 401 });
 
   try {
-    const nodes = await listIntroTreeNodes();
-    const formattedNodes = await Promise.all(
-      nodes.map(async (node) => {
-        const videos = await listIntroTreeNodeVideos(node.id);
-        return {
-          id: node.id,
-          node_key: node.node_key,
-          title: node.title,
-          pos_x: node.pos_x,
-          pos_y: node.pos_y,
-          width: node.width,
-          height: node.height,
-          videos: videos.sort((a, b) => a.order_index - b.order_index),
-        };
-      })
-    );
-    formattedNodes.sort((a, b) => a.title.localeCompare(b.title));
-    return NextResponse.json({ nodes: formattedNodes });
+    const { nodes, version } = await getIntroductionTree();
+    const videoPosters = await resolveVimeoPosters(nodes.flatMap((node) => node.videos.map((v) => v.video_url)));
+    // A poster that resolves later (after a failed lookup) must change the ETag as well
+    return conditionalJson(req, dataVersion([version, videoPosters]), () => ({ nodes, videoPosters }));
   } catch (err) {
     console.error('Failed to fetch introduction tree nodes:', err);
     return NextResponse.json({ error: 'Failed to fetch nodes' }, { status: 500 });
@@ -78,6 +66,7 @@ export async function POST(req: NextRequest) {
           });
         }
       }
+      revalidateIntroductionTree();
 
       return NextResponse.json({ node: { ...savedNode, id: savedId } });
     } catch (err) {
@@ -93,6 +82,7 @@ export async function POST(req: NextRequest) {
     }
     try {
       await deleteIntroTreeNode(id);
+      revalidateIntroductionTree();
       return NextResponse.json({ ok: true });
     } catch (err) {
       console.error('Failed to delete node:', err);
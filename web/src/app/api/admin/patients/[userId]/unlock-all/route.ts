@@ -1,9 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
-import { listNodes, listUnlocksByUser, insertUnlocks } from '@/lib/lambdaDataClient';
+import { streamNodes, listUnlocksByUser, insertUnlocks } from '@/lib/lambdaDataClient';
 
 export const runtime = 'nodejs';
 
+const INSERT_BATCH_SIZE = 100;
+
 export async function POST(
   req: NextRequest,
   { params }: { params: Promise<{ userId: string }> }
@@ -16,24 +18,34 @@ export async function POST(
   const { userId } = await params;
 
   try {
-    const [allNodes, currentUnlocks] = await Promise.all([listNodes(), listUnlocksByUser(userId)]);
-    const currentlyUnlockedIds = new Set(currentUnlocks.map((u) => u.node_id));
-    const nodesToUnlock = allNodes
-      .filter((node) => !currentlyUnlockedIds.has((node as { id: string }).id))
-      .map((node) => ({
+    const currentlyUnlockedIds = new Set((await listUnlocksByUser(userId)).map((u) => u.node_id));
+
+    // Insert while the node table streams in, one bounded batch at a time
+    let batch: Parameters<typeof insertUnlocks>[0] = [];
+    let unlockedCount = 0;
+    for await (const node of streamNodes()) {
+      const nodeId = (node as { id: string }).id;
+      if (currentlyUnlockedIds.has(nodeId)) continue;
+      batch.push({
         user_id: userId,
-        node_id: (node as { id: string }).id,
+        node_id: nodeId,
         unlocked_by: 'admin' as const,
         source: 'admin_unlock_all',
-      }));
-
-    if (nodesToUnlock.length > 0) {
-      await insertUnlocks(nodesToUnlock);
+      });
+      if (batch.length >= INSERT_BATCH_SIZE) {
+        await insertUnlocks(batch);
+        unlockedCount += batch.length;
+        batch = [];
+      }
+    }
+    if (batch.length > 0) {
+      await insertUnlocks(batch);
+      unlockedCount += batch.length;
     }
 
     return NextResponse.json({ 
       success: true, 
-      unlockedCount: nodesToUnlock.length 
+      unlockedCount 
     });
 
   } catch (error) {
@@ -1,11 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { getCatalog, revalidateCatalog } from '@/lib/catalog';
+import { conditionalJson } from '@/lib/conditionalGet';
 import {
   getNodeByKey,
   putNode,
   putSymptomPosition,
-  listNodes,
-  listSymptomPositions,
 } from '@/lib/lambdaDataClient';
 
 export async function POST(req: NextRequest) {
@@ -50,6 +50,7 @@ export async function POST(req: NextRequest) {
     console.error('Failed to save position:', err);
     return NextResponse.json({ error: 'Failed to save position' }, { status: 500 });
   }
+  revalidateCatalog();
   return NextResponse.json({ ok: true });
 }
 
@@ -58,29 +59,8 @@ export async function GET(req: NextRequest) {
   if (!user?.admin) return NextResponse.json({ error: 'unauthorized' }, { status: 401 });
 
   try {
-    const [nodes, symptoms] = await Promise.all([listNodes(), listSymptomPositions()]);
-    const nodePositions: Record<string, { x: number; y: number; width: number; height: number }> = {};
-    nodes.forEach((node) => {
-      const n = node as { key: string; pos_x?: number | null; pos_y?: number | null; box_width?: number | null; box_height?: number | null };
-      if (n.pos_x != null && n.pos_y != null) {
-        nodePositions[n.key] = {
-          x: Number(n.pos_x),
-          y: Number(n.pos_y),
-          width: Number(n.box_width ?? 10),
-          height: Number(n.box_height ?? 5),
-        };
-      }
-    });
-    const symptomPositions: Record<string, { x: number; y: number; width: number; height: number }> = {};
-    symptoms.forEach((s) => {
-      symptomPositions[s.position_key] = {
-        x: Number(s.pos_x),
-        y: Number(s.pos_y),
-        width: Number(s.width),
-        height: Number(s.height),
-      };
-    });
-    return NextResponse.json({ nodes: nodePositions, symptoms: symptomPositions });
+    const { nodePositions, symptomPositions, version } = await getCatalog();
+    return conditionalJson(req, version, () => ({ nodes: nodePositions, symptoms: symptomPositions }));
   } catch (err) {
     console.error('Failed to fetch positions:', err);
     return NextResponse.json({ error: 'Failed to fetch positions' }, { status: 500 });
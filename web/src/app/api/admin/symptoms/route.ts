@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from 'next/server';
 import { z } from 'zod';
 import { getUserById, listSymptoms, putSymptom } from '@/lib/lambdaDataClient';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { revalidateCatalog } from '@/lib/catalog';
 
 export const runtime = 'nodejs';
 
@@ -55,6 +56,7 @@ export async function POST(req: NextRequest) {
     }
     const { key, label, description } = parse.data;
     const symptom = await putSymptom({ key, label, description: description ?? undefined });
+    revalidateCatalog();
     return NextResponse.json({ symptom });
 
   } catch (error) {
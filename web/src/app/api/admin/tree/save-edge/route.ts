@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { revalidateCatalog } from '@/lib/catalog';
 import { listEdges, putEdge } from '@/lib/lambdaDataClient';
 
 export async function POST(request: NextRequest) {
@@ -31,6 +32,7 @@ export async function POST(request: NextRequest) {
       description: description ?? e.description ?? null,
       weight: e.weight,
     });
+    revalidateCatalog();
 
     return NextResponse.json({ success: true });
   } catch (error) {
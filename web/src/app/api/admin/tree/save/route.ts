@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getSessionUserFromRequest } from '@/lib/session';
+import { revalidateCatalog } from '@/lib/catalog';
 import {
   putNode,
   setNodeCategories,
@@ -59,6 +60,7 @@ export async function POST(req: NextRequest) {
         });
       }
     }
+    revalidateCatalog();
     return NextResponse.json({ ok: true });
   } catch (err) {
     console.error('Failed to update node with videos:', err);
@@ -1,8 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { z } from 'zod';
-import { listUnlocksByUser, listEdges, insertUnlocks } from '@/lib/lambdaDataClient';
+import { listFrontierByUser, listNodes, insertUnlocks } from '@/lib/lambdaDataClient';
 import { getSessionUserFromRequest } from '@/lib/session';
 import { ensureUserHasBasicUnlocks } from '@/lib/autoUnlock';
+import type { UnlockDelta } from '@/lib/patientTree';
 import { getCategoryForNodeKey, type CategoryKey } from '@/lib/categories';
 
 export const runtime = 'nodejs';
@@ -19,23 +20,23 @@ export async function POST(req: NextRequest) {
   const reported = new Set(parse.data.symptoms);
   const category = parse.data.category as CategoryKey | undefined;
 
-  const unlocked = await listUnlocksByUser(user.id);
-  const unlockedIds = new Set(unlocked.map((r) => r.node_id));
-
-  const edges = await listEdges();
-  const nodes = await import('@/lib/lambdaDataClient').then((m) => m.listNodes());
+  // The frontier already holds exactly the edges from unlocked parents to locked children
+  const [frontier, nodes] = await Promise.all([
+    listFrontierByUser(user.id),
+    category ? listNodes() : Promise.resolve([] as Record<string, unknown>[]),
+  ]);
   const nodeById = new Map(nodes.map((n) => [(n as { id: string }).id, n]));
 
   const toUnlock: string[] = [];
-  for (const e of edges as Array<{ parent_id: string; child_id: string; unlock_type: string; unlock_value: unknown }>) {
-    if (!unlockedIds.has(e.parent_id)) continue;
-
-    const childNode = nodeById.get(e.child_id) as { key?: string } | undefined;
-    const childKey = childNode?.key;
-    if (category && (!childKey || getCategoryForNodeKey(childKey as CategoryKey) !== category)) continue;
+  for (const e of frontier) {
+    if (category) {
+      const childNode = nodeById.get(e.node_id) as { key?: string } | undefined;
+      const childKey = childNode?.key;
+      if (!childKey || getCategoryForNodeKey(childKey as CategoryKey) !== category) continue;
+    }
 
     if (e.unlock_type === 'always') {
-      toUnlock.push(e.child_id);
+      toUnlock.push(e.node_id);
       continue;
     }
     if (e.unlock_type === 'symptom_match') {
@@ -44,11 +45,11 @@ export async function POST(req: NextRequest) {
       const all = Array.isArray(rule.all) ? (rule.all as string[]) : [];
       const anyOk = any.length === 0 || any.some((k) => reported.has(k));
       const allOk = all.length === 0 || all.every((k) => reported.has(k));
-      if (anyOk && allOk) toUnlock.push(e.child_id);
+      if (anyOk && allOk) toUnlock.push(e.node_id);
     }
   }
 
-  const uniqueChildIds = Array.from(new Set(toUnlock)).filter((id) => !unlockedIds.has(id));
+  const uniqueChildIds = Array.from(new Set(toUnlock));
 
   if (uniqueChildIds.length > 0) {
     const rows = uniqueChildIds.map((node_id) => ({
@@ -61,7 +62,8 @@ export async function POST(req: NextRequest) {
   }
 
   // After unlocking symptom-based nodes, also process any newly available 'always' edges
-  await ensureUserHasBasicUnlocks(user.id);
+  const cascade = await ensureUserHasBasicUnlocks(user.id);
+  const delta: UnlockDelta = { unlocked: uniqueChildIds, cascaded: cascade.unlocked, frontier: cascade.frontier };
 
-  return NextResponse.json({ unlocked: uniqueChildIds });
+  return NextResponse.json(delta);
 } 
\ No newline at end of file
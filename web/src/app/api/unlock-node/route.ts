@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { getUnlock, listUnlocksByUser, getEdgesByChild, insertUnlocks } from '@/lib/lambdaDataClient';
+import { unlockNode } from '@/lib/lambdaDataClient';
 import { getSessionUserFromRequest } from '@/lib/session';
-import { ensureUserHasBasicUnlocks } from '@/lib/autoUnlock';
+import type { UnlockDelta } from '@/lib/patientTree';
 
 export const runtime = 'nodejs';
 
@@ -16,42 +16,27 @@ export async function POST(req: NextRequest) {
       return NextResponse.json({ error: 'nodeId is required' }, { status: 400 });
     }
 
-    // Check if user already has this node unlocked
-    const existingUnlock = await getUnlock(user.id, nodeId);
-    if (existingUnlock) {
-      return NextResponse.json({ error: 'Node already unlocked' }, { status: 400 });
-    }
-
-    // Get all unlocked nodes for this user
-    const unlocked = await listUnlocksByUser(user.id);
-    const unlockedIds = new Set(unlocked.map(u => u.node_id));
-
-    // Check if this node can be unlocked (has an unlocked parent)
-    const edges = await getEdgesByChild(nodeId);
-    const canUnlock = edges.some(
-      (edge) =>
-        unlockedIds.has(edge.parent_id) &&
-        (edge.unlock_type === 'always' || edge.unlock_type === 'symptom_match')
-    );
-
-    if (!canUnlock) {
-      return NextResponse.json({ error: 'Node cannot be unlocked yet' }, { status: 400 });
-    }
-
-    // Unlock the node
+    // Gate check, unlock and 'always' cascade happen in one conditional transaction on the Lambda side
+    let result: Awaited<ReturnType<typeof unlockNode>>;
     try {
-      await insertUnlocks([
-        { user_id: user.id, node_id: nodeId, unlocked_by: 'user', source: 'patient_unlock' },
-      ]);
+      result = await unlockNode(user.id, nodeId);
     } catch (err) {
       console.error('Failed to unlock node:', err);
       return NextResponse.json({ error: 'Failed to unlock node' }, { status: 500 });
     }
 
-    // Process any newly available 'always' edges
-    await ensureUserHasBasicUnlocks(user.id);
+    if (result.status === 'not_unlockable') {
+      return NextResponse.json({ error: 'Node cannot be unlocked yet' }, { status: 400 });
+    }
 
-    return NextResponse.json({ success: true });
+    // A retry (or double click) of an unlock that already went through gets the current state back
+    const alreadyUnlocked = result.status === 'already_unlocked';
+    const delta: UnlockDelta = {
+      unlocked: alreadyUnlocked ? [nodeId] : result.unlocked,
+      cascaded: result.cascaded,
+      frontier: result.frontier,
+    };
+    return NextResponse.json({ success: true, alreadyUnlocked, ...delta });
 
   } catch (error) {
     console.error('Unlock node error:', error);
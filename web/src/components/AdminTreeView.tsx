@@ -8,6 +8,7 @@ import { IntroductionTreeEditor } from './IntroductionTreeEditor';
 import { Button } from './ui/button';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
+import { fetchJsonCached, invalidateCached } from '@/lib/cachedFetch';
 
 type AppNode = {
   id: string;
@@ -43,6 +44,8 @@ type CategoryPosition = {
   height: number;
 };
 
+type Position = { x: number; y: number; width: number; height: number };
+
 interface AdminTreeViewProps {
   initialNodes: AppNode[];
   initialEdges: AppEdge[];
@@ -53,8 +56,8 @@ export function AdminTreeView({ initialNodes, initialEdges }: AdminTreeViewProps
   const [categoryPositions, setCategoryPositions] = useState<Record<string, CategoryPosition>>({});
   const [bonusContentVideos, setBonusContentVideos] = useState<Record<string, CategoryVideo[]>>({});
   const [bonusContentPositions, setBonusContentPositions] = useState<Record<string, CategoryPosition>>({});
-  const [nodePositions, setNodePositions] = useState<Record<string, { x: number; y: number; width: number; height: number }>>({});
-  const [symptomPositions, setSymptomPositions] = useState<Record<string, { x: number; y: number; width: number; height: number }>>({});
+  const [nodePositions, setNodePositions] = useState<Record<string, Position>>({});
+  const [symptomPositions, setSymptomPositions] = useState<Record<string, Position>>({});
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState<'tree' | 'categories' | 'bonus' | 'introduction'>('tree');
 
@@ -64,29 +67,19 @@ export function AdminTreeView({ initialNodes, initialEdges }: AdminTreeViewProps
 
   const fetchAllData = async () => {
     try {
-      // Fetch category data
-      const categoryResponse = await fetch('/api/admin/category-videos');
-      if (categoryResponse.ok) {
-        const categoryData = await categoryResponse.json();
-        setCategoryVideos(categoryData.videos || {});
-        setCategoryPositions(categoryData.positions || {});
-      }
-      
-      // Fetch bonus content data
-      const bonusResponse = await fetch('/api/admin/bonus-content');
-      if (bonusResponse.ok) {
-        const bonusData = await bonusResponse.json();
-        setBonusContentVideos(bonusData.videos || {});
-        setBonusContentPositions(bonusData.positions || {});
-      }
-      
-      // Fetch node and symptom positions
-      const positionsResponse = await fetch('/api/admin/positions');
-      if (positionsResponse.ok) {
-        const positionsData = await positionsResponse.json();
-        setNodePositions(positionsData.nodes || {});
-        setSymptomPositions(positionsData.symptoms || {});
-      }
+      const [categoryData, bonusData] = await Promise.all([
+        fetchJsonCached<{ videos?: Record<string, CategoryVideo[]>; positions?: Record<string, CategoryPosition> }>(
+          '/api/admin/category-videos'
+        ),
+        fetchJsonCached<{ videos?: Record<string, CategoryVideo[]>; positions?: Record<string, CategoryPosition> }>(
+          '/api/admin/bonus-content'
+        ),
+        refreshPositions(),
+      ]);
+      setCategoryVideos(categoryData.videos || {});
+      setCategoryPositions(categoryData.positions || {});
+      setBonusContentVideos(bonusData.videos || {});
+      setBonusContentPositions(bonusData.positions || {});
     } catch (error) {
       console.error('Failed to fetch data:', error);
     } finally {
@@ -94,15 +87,14 @@ export function AdminTreeView({ initialNodes, initialEdges }: AdminTreeViewProps
     }
   };
   
-  // Separate function to just refresh positions (for callbacks)
+  // Also used on its own by the position callbacks; unchanged positions come back as a 304
   const refreshPositions = async () => {
     try {
-      const positionsResponse = await fetch('/api/admin/positions');
-      if (positionsResponse.ok) {
-        const positionsData = await positionsResponse.json();
-        setNodePositions(positionsData.nodes || {});
-        setSymptomPositions(positionsData.symptoms || {});
-      }
+      const positionsData = await fetchJsonCached<{ nodes?: Record<string, Position>; symptoms?: Record<string, Position> }>(
+        '/api/admin/positions'
+      );
+      setNodePositions(positionsData.nodes || {});
+      setSymptomPositions(positionsData.symptoms || {});
     } catch (error) {
       console.error('Failed to refresh positions:', error);
     }
@@ -118,6 +110,7 @@ export function AdminTreeView({ initialNodes, initialEdges }: AdminTreeViewProps
           position,
         }),
       });
+      invalidateCached('/api/admin/category-videos');
 
       if (response.ok) {
         setCategoryPositions(prev => ({
@@ -144,6 +137,7 @@ export function AdminTreeView({ initialNodes, initialEdges }: AdminTreeViewProps
           position,
         }),
       });
+      invalidateCached('/api/admin/bonus-content');
 
       if (response.ok) {
         setBonusContentPositions(prev => ({
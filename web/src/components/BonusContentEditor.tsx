@@ -6,6 +6,7 @@ import { Input } from './ui/input';
 import { Label } from './ui/label';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 import { PlusCircle, Trash2, Save, Video } from 'lucide-react';
+import { invalidateCached } from '@/lib/cachedFetch';
 
 type BonusContentVideo = {
   id: string;
@@ -91,6 +92,7 @@ export function BonusContentEditor({ bonusContentVideos, onUpdate }: BonusConten
           videos: videos.filter(v => v.video_url && v.title),
         }),
       });
+      invalidateCached('/api/admin/bonus-content');
 
       if (response.ok) {
         setEditingCategory(null);
@@ -7,6 +7,8 @@ import { Button } from '@/components/ui/button';
 import { VimeoPlayer } from './VimeoPlayer';
 import { IntroductionMiniTree } from './IntroductionMiniTree';
 import { Lock, ZoomIn, ZoomOut, RotateCcw, Stethoscope, Edit2, Save } from 'lucide-react';
+import type { UnlockDelta } from '@/lib/patientTree';
+import { invalidateCached } from '@/lib/cachedFetch';
 
 // Type definitions
 type AppNode = {
@@ -53,6 +55,7 @@ interface InteractiveSVGTreeProps {
   nodes: AppNode[];
   edges: AppEdge[];
   unlockedNodeIds: Set<string>;
+  unlockableEdgeIds?: Set<string>; // edge ids on the user's unlock frontier (derived from unlockedNodeIds when omitted)
   symptomsMap?: Map<string, string>; // symptom key -> label mapping
   categoryVideos?: Record<string, CategoryVideo[]>; // category -> videos
   categoryPositions?: Record<string, CategoryPosition>; // category -> position
@@ -70,7 +73,8 @@ interface InteractiveSVGTreeProps {
 export function InteractiveSVGTree({ 
   nodes, 
   edges, 
-  unlockedNodeIds, 
+  unlockedNodeIds: initialUnlockedNodeIds, 
+  unlockableEdgeIds: initialUnlockableEdgeIds,
   symptomsMap = new Map(),
   categoryVideos = {},
   categoryPositions = {},
@@ -85,6 +89,8 @@ export function InteractiveSVGTree({
   onSymptomPositionUpdate,
 }: InteractiveSVGTreeProps) {
   // Component State
+  const [unlockedNodeIds, setUnlockedNodeIds] = useState<Set<string>>(initialUnlockedNodeIds);
+  const [unlockableEdgeIds, setUnlockableEdgeIds] = useState<Set<string> | undefined>(initialUnlockableEdgeIds);
   const [selectedNode, setSelectedNode] = useState<AppNode | null>(null);
   const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
   const [selectedBonusContent, setSelectedBonusContent] = useState<string | null>(null);
@@ -136,6 +142,7 @@ export function InteractiveSVGTree({
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ type, key, position }),
       });
+      invalidateCached('/api/admin/positions');
       
       if (response.ok) {
         // Update local temp state immediately to prevent reversion
@@ -264,7 +271,12 @@ export function InteractiveSVGTree({
   const handleUnlock = async (nodeId: string) => {
     try {
       const response = await fetch('/api/unlock-node', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ nodeId }) });
-      if (response.ok) { window.location.reload(); } else { alert('Failed to unlock node'); }
+      if (response.ok) {
+        // Apply the unlock delta locally instead of reloading the page (and the SVG)
+        const delta = (await response.json()) as UnlockDelta;
+        setUnlockedNodeIds(prev => new Set([...prev, ...delta.unlocked, ...delta.cascaded]));
+        setUnlockableEdgeIds(new Set(delta.frontier.map(entry => entry.edge_id)));
+      } else { alert('Failed to unlock node'); }
     } catch (error) { console.error('Error unlocking node:', error); alert('Failed to unlock node'); }
   };
   const handleWheel = (e: React.WheelEvent) => { 
@@ -934,7 +946,9 @@ export function InteractiveSVGTree({
               const defaultPosition = symptomPositions.get(positionKey);
               if (!defaultPosition) return null;
 
-              const isActuallyUnlockable = unlockedNodeIds.has(edge.parent_id) && !unlockedNodeIds.has(edge.child_id);
+              const isActuallyUnlockable = unlockableEdgeIds
+                ? unlockableEdgeIds.has(edge.id)
+                : unlockedNodeIds.has(edge.parent_id) && !unlockedNodeIds.has(edge.child_id);
               
               // In patient view (non-admin), only show unlockable diamonds
               // In admin/edit mode, show all diamonds for editing
@@ -3,7 +3,9 @@
 import { useState, useEffect, useRef, useMemo } from 'react';
 import { Button } from './ui/button';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from './ui/dialog';
-import { VimeoPlayer } from './VimeoPlayer';
+import { VimeoPlayer, VimeoPosterProvider } from './VimeoPlayer';
+import { fetchJsonCached, invalidateCached } from '@/lib/cachedFetch';
+import type { VimeoPoster } from '@/lib/vimeoUtils';
 import { Save, ZoomIn, ZoomOut, RotateCcw, Edit2 } from 'lucide-react';
 
 type MiniTreeNode = {
@@ -29,6 +31,7 @@ interface IntroductionMiniTreeProps {
 
 export function IntroductionMiniTree({ isAdmin = false, onUpdate }: IntroductionMiniTreeProps) {
   const [nodes, setNodes] = useState<MiniTreeNode[]>([]);
+  const [videoPosters, setVideoPosters] = useState<Record<string, VimeoPoster>>({});
   const [loading, setLoading] = useState(true);
   const [editMode, setEditMode] = useState(false);
   const [editingNode, setEditingNode] = useState<string | null>(null);
@@ -51,23 +54,23 @@ export function IntroductionMiniTree({ isAdmin = false, onUpdate }: Introduction
 
   const fetchNodes = async () => {
     try {
-      const response = await fetch('/api/admin/introduction-tree');
-      if (response.ok) {
-        const data = await response.json();
-        setNodes(data.nodes || []);
-        
-        // Initialize temp positions
-        const positions: Record<string, { x: number; y: number; width: number; height: number }> = {};
-        (data.nodes || []).forEach((node: MiniTreeNode) => {
-          positions[node.id] = {
-            x: node.pos_x,
-            y: node.pos_y,
-            width: node.width,
-            height: node.height,
-          };
-        });
-        setTempPositions(positions);
-      }
+      const data = await fetchJsonCached<{ nodes?: MiniTreeNode[]; videoPosters?: Record<string, VimeoPoster> }>(
+        '/api/admin/introduction-tree'
+      );
+      setNodes(data.nodes || []);
+      setVideoPosters(data.videoPosters || {});
+      
+      // Initialize temp positions
+      const positions: Record<string, { x: number; y: number; width: number; height: number }> = {};
+      (data.nodes || []).forEach((node: MiniTreeNode) => {
+        positions[node.id] = {
+          x: node.pos_x,
+          y: node.pos_y,
+          width: node.width,
+          height: node.height,
+        };
+      });
+      setTempPositions(positions);
     } catch (error) {
       console.error('Failed to fetch nodes:', error);
     } finally {
@@ -216,6 +219,7 @@ export function IntroductionMiniTree({ isAdmin = false, onUpdate }: Introduction
           },
         }),
       });
+      invalidateCached('/api/admin/introduction-tree');
 
       if (response.ok) {
         const data = await response.json();
@@ -481,16 +485,18 @@ export function IntroductionMiniTree({ isAdmin = false, onUpdate }: Introduction
               <DialogHeader className="pr-8">
                 <DialogTitle className="text-xl font-semibold">{selectedNode.title}</DialogTitle>
               </DialogHeader>
-              <div className="space-y-4">
-                {selectedNode.videos.sort((a, b) => a.order_index - b.order_index).map(video => (
-                  <div key={video.id}>
-                    <h4 className="font-medium mb-2">{video.title}</h4>
-                    <div className="aspect-video rounded-lg overflow-hidden">
-                      <VimeoPlayer videoUrl={video.video_url} />
+              <VimeoPosterProvider posters={videoPosters}>
+                <div className="space-y-4">
+                  {[...selectedNode.videos].sort((a, b) => a.order_index - b.order_index).map(video => (
+                    <div key={video.id}>
+                      <h4 className="font-medium mb-2">{video.title}</h4>
+                      <div className="aspect-video rounded-lg overflow-hidden">
+                        <VimeoPlayer videoUrl={video.video_url} title={video.title} />
+                      </div>
                     </div>
-                  </div>
-                ))}
-              </div>
+                  ))}
+                </div>
+              </VimeoPosterProvider>
             </>
           )}
         </DialogContent>
@@ -7,6 +7,7 @@ import { Label } from './ui/label';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from './ui/card';
 import { PlusCircle, Trash2, Save, Video } from 'lucide-react';
 import { IntroductionMiniTree } from './IntroductionMiniTree';
+import { fetchJsonCached, invalidateCached } from '@/lib/cachedFetch';
 
 type MiniTreeNode = {
   id: string;
@@ -37,11 +38,8 @@ export function IntroductionTreeEditor() {
 
   const fetchNodes = async () => {
     try {
-      const response = await fetch('/api/admin/introduction-tree');
-      if (response.ok) {
-        const data = await response.json();
-        setNodes(data.nodes || []);
-      }
+      const data = await fetchJsonCached<{ nodes?: MiniTreeNode[] }>('/api/admin/introduction-tree');
+      setNodes(data.nodes || []);
     } catch (error) {
       console.error('Failed to fetch nodes:', error);
     } finally {
@@ -144,6 +142,7 @@ export function IntroductionTreeEditor() {
           },
         }),
       });
+      invalidateCached('/api/admin/introduction-tree');
 
       if (response.ok) {
         setEditingNode(null);
@@ -190,6 +189,7 @@ export function IntroductionTreeEditor() {
           },
         }),
       });
+      invalidateCached('/api/admin/introduction-tree');
 
       if (response.ok) {
         fetchNodes();
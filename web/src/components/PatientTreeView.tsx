@@ -5,6 +5,7 @@ import { ChevronDown, ChevronRight, Lock, TreePine, CheckCircle2, Stethoscope }
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from '@/components/ui/dialog';
 import { Button } from '@/components/ui/button';
 import { VimeoPlayer } from '@/components/VimeoPlayer';
+import { applyUnlockDelta, type UnlockDelta } from '@/lib/patientTree';
 
 export type UnlockableChild = {
   childId: string;
@@ -301,9 +302,11 @@ function PatientTreeNode({ node, expandedNodes, onToggleExpand, onNodeClick, onU
 
 type PatientTreeViewProps = {
   treeStructure: PatientNode[];
+  symptomLabels?: Record<string, string>; // symptom key -> label, used when patching unlock state
 };
 
-export function PatientTreeView({ treeStructure }: PatientTreeViewProps) {
+export function PatientTreeView({ treeStructure: initialTreeStructure, symptomLabels = {} }: PatientTreeViewProps) {
+  const [treeStructure, setTreeStructure] = useState<PatientNode[]>(initialTreeStructure);
   const [expandedNodes, setExpandedNodes] = useState<Set<string>>(
     new Set(treeStructure.map(node => node.id)) // Start with root expanded
   );
@@ -346,8 +349,9 @@ export function PatientTreeView({ treeStructure }: PatientTreeViewProps) {
       });
 
       if (response.ok) {
-        // Refresh the page to show updated state
-        window.location.reload();
+        // Patch the tree in place from the unlock delta instead of reloading the page
+        const delta = (await response.json()) as UnlockDelta;
+        setTreeStructure(prev => applyUnlockDelta(prev, delta, symptomLabels));
       } else {
         const errorData = await response.json();
         console.error('Failed to unlock node:', errorData.error);
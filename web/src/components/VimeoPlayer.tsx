@@ -1,7 +1,26 @@
 "use client";
 
-import { useState } from 'react';
-import { extractVimeoId, getVimeoEmbedUrl, isVimeoUrl } from '@/lib/vimeoUtils';
+import { createContext, useContext, useEffect, useRef, useState, type ReactNode } from 'react';
+import { preconnect } from 'react-dom';
+import { Play } from 'lucide-react';
+import {
+  extractVimeoId,
+  getVimeoEmbedUrl,
+  isVimeoUrl,
+  VIMEO_PLAYER_ORIGINS,
+  type VimeoPoster,
+} from '@/lib/vimeoUtils';
+
+const VimeoPosterContext = createContext<Record<string, VimeoPoster>>({});
+
+/**
+ * Supplies server-resolved poster metadata (keyed by Vimeo ID) to every VimeoPlayer below it.
+ * Nested providers add to the posters of the enclosing one.
+ */
+export function VimeoPosterProvider({ posters, children }: { posters: Record<string, VimeoPoster>; children: ReactNode }) {
+  const parent = useContext(VimeoPosterContext);
+  return <VimeoPosterContext.Provider value={{ ...parent, ...posters }}>{children}</VimeoPosterContext.Provider>;
+}
 
 interface VimeoPlayerProps {
   videoUrl: string;
@@ -14,6 +33,12 @@ interface VimeoPlayerProps {
   showTitle?: boolean;
   showByline?: boolean;
   showPortrait?: boolean;
+  /**
+   * Render a lightweight poster until the player is needed:
+   * 'interaction' (default) waits for a click, 'visible' for the poster to scroll into view,
+   * false mounts the iframe immediately.
+   */
+  facade?: 'interaction' | 'visible' | false;
 }
 
 export function VimeoPlayer({
@@ -26,13 +51,40 @@ export function VimeoPlayer({
   muted = false,
   showTitle = false,
   showByline = false,
-  showPortrait = false
+  showPortrait = false,
+  facade = 'interaction'
 }: VimeoPlayerProps) {
   const [isLoading, setIsLoading] = useState(true);
   const [hasError, setHasError] = useState(false);
+  const [isActivated, setIsActivated] = useState(facade === false);
+  const [wasClicked, setWasClicked] = useState(false);
+  const warmedUp = useRef(false);
+  const facadeRef = useRef<HTMLButtonElement>(null);
+  const posters = useContext(VimeoPosterContext);
 
   // Extract Vimeo ID from the URL
   const vimeoId = extractVimeoId(videoUrl);
+  const poster = vimeoId ? posters[vimeoId] : undefined;
+
+  // Warm up the player's origins once the user shows intent (hover, focus or press), not on every mount
+  const warmUp = () => {
+    if (warmedUp.current) return;
+    warmedUp.current = true;
+    VIMEO_PLAYER_ORIGINS.forEach((origin) => preconnect(origin));
+  };
+
+  // 'visible' facades swap in the player once they scroll into view
+  useEffect(() => {
+    if (isActivated || facade !== 'visible' || !facadeRef.current) return;
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        setIsActivated(true);
+        observer.disconnect();
+      }
+    }, { rootMargin: '200px' });
+    observer.observe(facadeRef.current);
+    return () => observer.disconnect();
+  }, [facade, isActivated]);
 
   // If it's not a Vimeo URL, show fallback
   if (!isVimeoUrl(videoUrl) || !vimeoId) {
@@ -51,8 +103,48 @@ export function VimeoPlayer({
     );
   }
 
+  if (!isActivated) {
+    const posterTitle = poster?.title || title;
+    return (
+      <button
+        ref={facadeRef}
+        type="button"
+        onPointerEnter={warmUp}
+        onPointerDown={warmUp}
+        onFocus={warmUp}
+        onClick={() => {
+          setWasClicked(true);
+          setIsActivated(true);
+        }}
+        aria-label={`Play ${posterTitle}`}
+        className={`group relative block overflow-hidden rounded-lg bg-gray-900 shadow-sm ${className}`}
+        style={{ width, height }}
+      >
+        {poster?.thumbnail_url && (
+          // eslint-disable-next-line @next/next/no-img-element
+          <img
+            src={poster.thumbnail_url}
+            alt=""
+            loading="lazy"
+            decoding="async"
+            className="absolute inset-0 h-full w-full object-cover opacity-90 transition-opacity group-hover:opacity-100"
+          />
+        )}
+        <span className="absolute inset-0 flex items-center justify-center">
+          <span className="flex h-14 w-14 items-center justify-center rounded-full bg-black/70 transition-colors group-hover:bg-blue-700">
+            <Play className="h-6 w-6 translate-x-0.5 fill-white text-white" />
+          </span>
+        </span>
+        <span className="absolute inset-x-0 bottom-0 truncate bg-gradient-to-t from-black/70 to-transparent px-3 py-2 text-left text-sm text-white">
+          {posterTitle}
+        </span>
+      </button>
+    );
+  }
+
   const embedUrl = getVimeoEmbedUrl(vimeoId, {
-    autoplay,
+    // A click on the facade is the user asking to play, so start right away; a 'visible' swap is not
+    autoplay: autoplay || wasClicked,
     muted,
     title: showTitle,
     byline: showByline,
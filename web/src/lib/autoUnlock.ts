@@ -2,20 +2,29 @@ import {
   listUnlocksByUser,
   getNodeByKey,
   insertUnlocks,
-  getEdgesByUnlockType,
+  listFrontierByUser,
+  type FrontierEntry,
 } from './lambdaDataClient';
 
+/** Whether a user's overlay still has work for ensureUserHasBasicUnlocks (no root yet, or 'always' edges pending). */
+export function needsBasicUnlocks(overlay: { unlocks: unknown[]; frontier: FrontierEntry[] }): boolean {
+  return overlay.unlocks.length === 0 || overlay.frontier.some((entry) => entry.unlock_type === 'always');
+}
+
 /**
  * Auto-unlock system for new users:
  * 1. Ensures root node is unlocked
- * 2. Recursively unlocks all nodes with 'always' unlock_type edges
+ * 2. Repeatedly unlocks every 'always' edge on the user's unlock frontier
+ * Returns the ids of the nodes it unlocked (in unlock order) and the user's frontier afterwards.
  */
-export async function ensureUserHasBasicUnlocks(userId: string): Promise<void> {
+export async function ensureUserHasBasicUnlocks(
+  userId: string
+): Promise<{ unlocked: string[]; frontier: FrontierEntry[] }> {
+  const unlockedNow: string[] = [];
   const currentUnlocks = await listUnlocksByUser(userId);
-  const unlockedIds = new Set(currentUnlocks.map((r) => r.node_id));
 
   // If user has no unlocks, start with root (key='root')
-  if (unlockedIds.size === 0) {
+  if (currentUnlocks.length === 0) {
     const rootNode = await getNodeByKey('root');
     if (rootNode && rootNode.id) {
       await insertUnlocks([
@@ -26,39 +35,34 @@ export async function ensureUserHasBasicUnlocks(userId: string): Promise<void> {
           source: 'auto_root',
         },
       ]);
-      unlockedIds.add(rootNode.id as string);
+      unlockedNow.push(rootNode.id as string);
     }
   }
 
-  // Recursively unlock all 'always' edges
-  let foundNewUnlocks = true;
+  // Each insert advances the frontier, so keep unlocking until no 'always' edges remain on it
   let iterations = 0;
   const maxIterations = 20;
+  let frontier = await listFrontierByUser(userId);
 
-  while (foundNewUnlocks && iterations < maxIterations) {
+  while (iterations < maxIterations) {
     iterations++;
-    foundNewUnlocks = false;
 
-    const edges = await getEdgesByUnlockType('always');
-    const toUnlock: string[] = [];
-
-    for (const edge of edges) {
-      if (!unlockedIds.has(edge.parent_id)) continue;
-      if (unlockedIds.has(edge.child_id)) continue;
-      toUnlock.push(edge.child_id);
-    }
+    const toUnlock = Array.from(
+      new Set(frontier.filter((entry) => entry.unlock_type === 'always').map((entry) => entry.node_id))
+    );
+    if (toUnlock.length === 0) break;
 
-    if (toUnlock.length > 0) {
-      await insertUnlocks(
-        toUnlock.map((nodeId) => ({
-          user_id: userId,
-          node_id: nodeId,
-          unlocked_by: 'system' as const,
-          source: 'auto_always',
-        }))
-      );
-      toUnlock.forEach((id) => unlockedIds.add(id));
-      foundNewUnlocks = true;
-    }
+    await insertUnlocks(
+      toUnlock.map((nodeId) => ({
+        user_id: userId,
+        node_id: nodeId,
+        unlocked_by: 'system' as const,
+        source: 'auto_always',
+      }))
+    );
+    unlockedNow.push(...toUnlock);
+    frontier = await listFrontierByUser(userId);
   }
+
+  return { unlocked: unlockedNow, frontier };
 }
@@ -0,0 +1,52 @@
+/**
+ * Client-side cache for the admin GET endpoints, which answer If-None-Match with 304.
+ * Each URL's last body and ETag live for the browser session, so remounting a view revalidates
+ * instead of re-downloading, and concurrent callers share one request.
+ * Every caller gets its own copy of the body, so sorting or editing it cannot touch the cache.
+ * Call invalidateCached after writing to a URL so the next read cannot be served from before the write.
+ */
+
+type Entry = { etag: string; data: unknown };
+
+const responses = new Map<string, Entry>();
+const inflight = new Map<string, Promise<unknown>>();
+// Bumped by invalidateCached; a response from an older generation is handed to its callers but not cached
+const generations = new Map<string, number>();
+
+async function revalidate(url: string): Promise<unknown> {
+  const generation = generations.get(url) ?? 0;
+  const cached = responses.get(url);
+  // The ETag is handled here, so keep the browser's HTTP cache out of the way
+  const response = await fetch(url, {
+    cache: 'no-store',
+    headers: cached ? { 'If-None-Match': cached.etag } : undefined,
+  });
+  if (response.status === 304 && cached) return cached.data;
+  if (!response.ok) throw new Error(`GET ${url} failed with ${response.status}`);
+
+  const data = await response.json();
+  if ((generations.get(url) ?? 0) !== generation) return data;
+  const etag = response.headers.get('ETag');
+  if (etag) responses.set(url, { etag, data });
+  else responses.delete(url);
+  return data;
+}
+
+export function fetchJsonCached<T>(url: string): Promise<T> {
+  let pending = inflight.get(url);
+  if (!pending) {
+    const request: Promise<unknown> = revalidate(url).finally(() => {
+      if (inflight.get(url) === request) inflight.delete(url);
+    });
+    pending = request;
+    inflight.set(url, pending);
+  }
+  return pending.then((data) => structuredClone(data) as T);
+}
+
+/** Forget the cached body, ETag and any in-flight read for a URL after a request that changed it. */
+export function invalidateCached(url: string) {
+  generations.set(url, (generations.get(url) ?? 0) + 1);
+  responses.delete(url);
+  inflight.delete(url);
+}
@@ -0,0 +1,220 @@
+import 'server-only';
+import { unstable_cache, revalidateTag } from 'next/cache';
+import {
+  getTree,
+  listEdges,
+  listSymptoms,
+  listCategoryVideos,
+  listCategoryPositions,
+  listSymptomPositions,
+  listBonusContentVideos,
+  listBonusContentPositions,
+  getIntroTree,
+} from './lambdaDataClient';
+import { dataVersion } from './conditionalGet';
+
+/**
+ * Cached, user-independent data layer.
+ * The tree catalog and the introduction tree only change through admin routes, which call
+ * revalidateCatalog / revalidateIntroductionTree after writing; everything else reads from the cache.
+ * Vimeo posters are not part of either entry: they are cached per video (see vimeoPosters), so a
+ * failed lookup is retried on its own instead of being kept until the next catalog build.
+ */
+
+export const CATALOG_TAG = 'catalog';
+export const INTRODUCTION_TREE_TAG = 'introduction-tree';
+
+type Video = { id: string; video_url: string; title: string; order_index: number };
+type Position = { x: number; y: number; width: number; height: number };
+type BoxPosition = { pos_x: number; pos_y: number; width: number; height: number };
+
+export type CatalogNode = {
+  id: string;
+  key: string;
+  title: string;
+  summary: string | null;
+  is_root: boolean;
+  order_index: number;
+  categories: string[];
+  node_videos: Video[];
+  pos_x?: number | null;
+  pos_y?: number | null;
+  box_width?: number | null;
+  box_height?: number | null;
+};
+
+export type CatalogEdge = {
+  id: string;
+  parent_id: string;
+  child_id: string;
+  unlock_type: 'always' | 'manual' | 'symptom_match';
+  unlock_value: Record<string, unknown> | null;
+  description?: string | null;
+  weight?: number;
+};
+
+export type Catalog = {
+  nodes: CatalogNode[];
+  edges: CatalogEdge[]; // sorted by weight, heaviest first
+  symptoms: Array<{ key: string; label: string }>;
+  categoryVideos: Record<string, Video[]>;
+  categoryPositions: Record<string, BoxPosition>;
+  bonusContentVideos: Record<string, Video[]>;
+  bonusContentPositions: Record<string, BoxPosition>;
+  nodePositions: Record<string, Position>;
+  symptomPositions: Record<string, Position>;
+  version: string; // changes whenever any of the above does; used as the admin GET ETag
+};
+
+function groupVideosByCategory(videos: Array<Video & { category: string }>) {
+  const grouped: Record<string, Video[]> = {};
+  videos.forEach((video) => {
+    if (!grouped[video.category]) grouped[video.category] = [];
+    grouped[video.category].push({
+      id: video.id,
+      video_url: video.video_url,
+      title: video.title,
+      order_index: video.order_index,
+    });
+  });
+  return grouped;
+}
+
+function boxPositionsByCategory(positions: Array<BoxPosition & { category: string }>) {
+  const mapped: Record<string, BoxPosition> = {};
+  positions.forEach((pos) => {
+    mapped[pos.category] = {
+      pos_x: Number(pos.pos_x),
+      pos_y: Number(pos.pos_y),
+      width: Number(pos.width),
+      height: Number(pos.height),
+    };
+  });
+  return mapped;
+}
+
+async function loadCatalog(): Promise<Catalog> {
+  const [treeNodes, edgesRaw, symptomsRaw, categoryVideosRaw, categoryPositionsRaw, symptomPositionsRaw, bonusVideosRaw, bonusPositionsRaw] =
+    await Promise.all([
+      getTree(),
+      listEdges(),
+      listSymptoms(),
+      listCategoryVideos(),
+      listCategoryPositions(),
+      listSymptomPositions(),
+      listBonusContentVideos(),
+      listBonusContentPositions(),
+    ]);
+
+  const nodes: CatalogNode[] = treeNodes.map((node) => ({
+    id: node.id,
+    key: (node as { key: string }).key,
+    title: (node as { title: string }).title,
+    summary: (node as { summary?: string | null }).summary ?? null,
+    is_root: (node as { is_root?: boolean }).is_root ?? false,
+    order_index: (node as { order_index?: number }).order_index ?? 0,
+    pos_x: (node as { pos_x?: number | null }).pos_x,
+    pos_y: (node as { pos_y?: number | null }).pos_y,
+    box_width: (node as { box_width?: number | null }).box_width,
+    box_height: (node as { box_height?: number | null }).box_height,
+    categories: node.categories,
+    node_videos: node.videos.map((v) => ({
+      id: v.id,
+      video_url: v.video_url,
+      title: v.title,
+      order_index: v.order_index,
+    })),
+  }));
+
+  const nodePositions: Record<string, Position> = {};
+  nodes.forEach((node) => {
+    if (node.pos_x != null && node.pos_y != null) {
+      nodePositions[node.key] = {
+        x: Number(node.pos_x),
+        y: Number(node.pos_y),
+        width: Number(node.box_width ?? 10),
+        height: Number(node.box_height ?? 5),
+      };
+    }
+  });
+
+  const symptomPositions: Record<string, Position> = {};
+  symptomPositionsRaw.forEach((pos) => {
+    symptomPositions[pos.position_key] = {
+      x: Number(pos.pos_x),
+      y: Number(pos.pos_y),
+      width: Number(pos.width),
+      height: Number(pos.height),
+    };
+  });
+
+  const catalog = {
+    nodes,
+    edges: edgesRaw.sort((a, b) => (b.weight ?? 0) - (a.weight ?? 0)) as CatalogEdge[],
+    symptoms: symptomsRaw.map((s) => ({ key: s.key, label: s.label })),
+    categoryVideos: groupVideosByCategory(categoryVideosRaw),
+    categoryPositions: boxPositionsByCategory(categoryPositionsRaw),
+    bonusContentVideos: groupVideosByCategory(bonusVideosRaw),
+    bonusContentPositions: boxPositionsByCategory(bonusPositionsRaw),
+    nodePositions,
+    symptomPositions,
+  };
+  return { ...catalog, version: dataVersion(catalog) };
+}
+
+export const getCatalog = unstable_cache(loadCatalog, ['catalog'], { tags: [CATALOG_TAG] });
+
+/** Every video URL the patient view can play, for resolveVimeoPosters. */
+export function catalogVideoUrls(catalog: Catalog): string[] {
+  return [
+    ...catalog.nodes.flatMap((node) => node.node_videos.map((v) => v.video_url)),
+    ...Object.values(catalog.categoryVideos).flat().map((v) => v.video_url),
+    ...Object.values(catalog.bonusContentVideos).flat().map((v) => v.video_url),
+  ];
+}
+
+export type IntroductionTreeNode = {
+  id: string;
+  node_key: string;
+  title: string;
+  pos_x: number;
+  pos_y: number;
+  width: number;
+  height: number;
+  videos: Array<Video & { node_id: string }>;
+};
+
+export type IntroductionTree = {
+  nodes: IntroductionTreeNode[];
+  version: string;
+};
+
+async function loadIntroductionTree(): Promise<IntroductionTree> {
+  const formattedNodes = (await getIntroTree()).map((node) => ({
+    id: node.id,
+    node_key: node.node_key,
+    title: node.title,
+    pos_x: node.pos_x,
+    pos_y: node.pos_y,
+    width: node.width,
+    height: node.height,
+    videos: node.videos,
+  }));
+  const tree = {
+    nodes: formattedNodes.sort((a, b) => a.title.localeCompare(b.title)),
+  };
+  return { ...tree, version: dataVersion(tree) };
+}
+
+export const getIntroductionTree = unstable_cache(loadIntroductionTree, ['introduction-tree'], {
+  tags: [INTRODUCTION_TREE_TAG],
+});
+
+/** Expire the cached catalog immediately so the next patient view sees the admin's write. */
+export function revalidateCatalog() {
+  revalidateTag(CATALOG_TAG, { expire: 0 });
+}
+
+export function revalidateIntroductionTree() {
+  revalidateTag(INTRODUCTION_TREE_TAG, { expire: 0 });
+}
@@ -0,0 +1,37 @@
+import 'server-only';
+import { createHash } from 'crypto';
+import { NextRequest, NextResponse } from 'next/server';
+
+/**
+ * Conditional GET support for admin read endpoints.
+ * Responses carry an ETag derived from the cached data version; the browser may keep them
+ * (privately, since they sit behind the admin session) but must revalidate, which costs a 304
+ * instead of the full payload while nothing has changed.
+ */
+
+const CACHE_HEADERS = {
+  'Cache-Control': 'private, no-cache',
+  Vary: 'Cookie',
+};
+
+/** Short, stable version string for a JSON-serializable value. */
+export function dataVersion(value: unknown): string {
+  return createHash('sha1').update(JSON.stringify(value)).digest('base64url').slice(0, 22);
+}
+
+function matchesETag(ifNoneMatch: string | null, etag: string) {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch
+    .split(',')
+    .map((tag) => tag.trim().replace(/^W\//, ''))
+    .some((tag) => tag === '*' || tag === etag);
+}
+
+export function conditionalJson(req: NextRequest, version: string, body: () => unknown) {
+  const etag = `"${version}"`;
+  const headers = { ...CACHE_HEADERS, ETag: etag };
+  if (matchesETag(req.headers.get('if-none-match'), etag)) {
+    return new NextResponse(null, { status: 304, headers });
+  }
+  return NextResponse.json(body(), { headers });
+}
@@ -31,6 +31,54 @@ async function invoke<T>(action: string, params: Record<string, unknown> = {}):
   return json.data as T;
 }
 
+/**
+ * Stream a list action as newline-delimited JSON, yielding rows as the Lambda writes them so callers
+ * can aggregate large tables with bounded memory. Only actions in the Lambda's STREAMS map accept this.
+ */
+async function* invokeStream<T>(action: string, params: Record<string, unknown> = {}): AsyncGenerator<T> {
+  if (!LAMBDA_URL?.trim()) {
+    throw new Error('LAMBDA_DATA_API_URL is not set');
+  }
+  const res = await fetch(LAMBDA_URL, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ action, params, stream: true }),
+  });
+  if (!res.ok || !res.body) {
+    const text = await res.text();
+    console.error(`[Lambda] ${action} stream failed (${res.status}):`, text.slice(0, 500));
+    throw new Error(`Lambda returned ${res.status}`);
+  }
+
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffered = '';
+  let done = false;
+  try {
+    while (!done) {
+      const chunk = await reader.read();
+      buffered += chunk.value ?? '';
+      const lines = buffered.split('\n');
+      buffered = chunk.done ? '' : lines.pop()!;
+      for (const line of lines) {
+        if (!line.trim()) continue;
+        const row = JSON.parse(line) as T & { $done?: boolean; $error?: string };
+        if (row.$error) {
+          console.error(`[Lambda] ${action} stream error:`, row.$error);
+          throw new Error(row.$error);
+        }
+        if (row.$done) return;
+        yield row;
+      }
+      done = chunk.done;
+    }
+  } finally {
+    // Also stops the download when the caller breaks out early
+    reader.cancel().catch(() => {});
+  }
+  // No trailer means the connection dropped before the scan finished
+  throw new Error(`Lambda stream ${action} ended early`);
+}
+
 // ---------- Users ----------
 export async function getUserByEmail(email: string) {
   return invoke<{ id: string; email: string; name: string | null; created_at: string; is_admin?: boolean } | null>(
@@ -56,11 +104,27 @@ export async function listUsers() {
   );
 }
 
+/** Same rows as listUsers, unsorted. */
+export function streamUsers() {
+  return invokeStream<{ id: string; email: string; name: string | null; created_at: string; is_admin?: boolean }>(
+    'ListUsers'
+  );
+}
+
 export async function deleteUser(id: string) {
   return invoke<void>('DeleteUser', { id });
 }
 
 // ---------- Nodes ----------
+type TreeVideo = { id: string; node_id: string; video_url: string; title: string; order_index: number };
+
+/** The whole main tree in one query: every node with its categories and videos (by order_index). */
+export async function getTree() {
+  return invoke<Array<Record<string, unknown> & { id: string; categories: string[]; videos: TreeVideo[] }>>(
+    'GetTree'
+  );
+}
+
 export async function getNodeByKey(key: string) {
   return invoke<Record<string, unknown> | null>('GetNodeByKey', { key });
 }
@@ -73,6 +137,10 @@ export async function listNodes() {
   return invoke<Record<string, unknown>[]>('ListNodes');
 }
 
+export function streamNodes() {
+  return invokeStream<Record<string, unknown>>('ListNodes');
+}
+
 export async function putNode(node: {
   id?: string;
   key: string;
@@ -88,6 +156,11 @@ export async function putNode(node: {
   return invoke<Record<string, unknown>>('PutNode', node);
 }
 
+/** Deletes the node's videos, categories and edges along with it. */
+export async function deleteNode(nodeId: string) {
+  return invoke<void>('DeleteNode', { nodeId });
+}
+
 // ---------- Node categories & videos ----------
 export async function listCategoriesByNode(nodeId: string) {
   return invoke<Array<{ node_id: string; category: string; created_at?: string }>>('ListCategoriesByNode', {
@@ -100,10 +173,7 @@ export async function setNodeCategories(nodeId: string, categories: string[]) {
 }
 
 export async function listNodeVideos(nodeId: string) {
-  return invoke<Array<{ id: string; node_id: string; video_url: string; title: string; order_index: number }>>(
-    'ListNodeVideos',
-    { nodeId }
-  );
+  return invoke<TreeVideo[]>('ListNodeVideos', { nodeId });
 }
 
 export async function putNodeVideo(
@@ -131,6 +201,19 @@ export async function listEdges() {
   }>>('ListEdges');
 }
 
+export function streamEdges() {
+  return invokeStream<{
+    id: string;
+    parent_id: string;
+    child_id: string;
+    unlock_type: string;
+    unlock_value: unknown;
+    description?: string | null;
+    weight?: number;
+    created_at?: string;
+  }>('ListEdges');
+}
+
 export async function getEdgesByChild(childId: string) {
   return invoke<Array<{ parent_id: string; child_id: string; unlock_type: string; unlock_value: unknown }>>(
     'GetEdgesByChild',
@@ -138,6 +221,13 @@ export async function getEdgesByChild(childId: string) {
   );
 }
 
+export async function getEdgesByParent(parentId: string) {
+  return invoke<Array<{ id: string; parent_id: string; child_id: string; unlock_type: string; unlock_value: unknown }>>(
+    'GetEdgesByParent',
+    { parentId }
+  );
+}
+
 export async function getEdgesByUnlockType(unlockType: string) {
   return invoke<Array<{ parent_id: string; child_id: string; unlock_type: string }>>('GetEdgesByUnlockType', {
     unlockType,
@@ -203,6 +293,12 @@ export async function listAllUnlocks() {
   );
 }
 
+export function streamAllUnlocks() {
+  return invokeStream<{ user_id: string; node_id: string; unlocked_at?: string; unlocked_by?: string; source?: string | null }>(
+    'ListAllUnlocks'
+  );
+}
+
 export async function deleteAllUnlocks() {
   return invoke<void>('DeleteAllUnlocks');
 }
@@ -211,6 +307,50 @@ export async function deleteAllUserEvents() {
   return invoke<void>('DeleteAllUserEvents');
 }
 
+// ---------- Unlock frontier ----------
+/** An edge from one of the user's unlocked nodes to a node they have not unlocked yet. */
+export type FrontierEntry = {
+  node_id: string;
+  parent_id: string;
+  edge_id: string;
+  unlock_type: 'always' | 'manual' | 'symptom_match';
+  unlock_value: Record<string, unknown> | null;
+  description: string | null;
+  weight: number;
+};
+
+export async function listFrontierByUser(userId: string) {
+  return invoke<FrontierEntry[]>('ListFrontierByUser', { userId });
+}
+
+export async function getFrontierForNode(userId: string, nodeId: string) {
+  return invoke<FrontierEntry[]>('GetFrontierForNode', { userId, nodeId });
+}
+
+export async function getUserOverlay(userId: string) {
+  return invoke<{
+    unlocks: Array<{ node_id: string; unlocked_at?: string; unlocked_by?: string; source?: string | null }>;
+    frontier: FrontierEntry[];
+  }>('GetUserOverlay', { userId });
+}
+
+/**
+ * Gate-check and unlock one node, cascading through 'always' edges, in a single Lambda call.
+ * Idempotent: repeating it for an unlocked node returns 'already_unlocked' and writes nothing.
+ */
+export async function unlockNode(
+  userId: string,
+  nodeId: string,
+  options: { unlockedBy?: string; source?: string } = {}
+) {
+  return invoke<{
+    status: 'unlocked' | 'already_unlocked' | 'not_unlockable';
+    unlocked: string[];
+    cascaded: string[];
+    frontier: FrontierEntry[];
+  }>('UnlockNode', { userId, nodeId, ...options });
+}
+
 // ---------- Events ----------
 export async function insertUserEvent(userId: string, type: string, metadata?: unknown) {
   return invoke<{ id: string; created_at: string }>('InsertUserEvent', { userId, type, metadata });
@@ -313,6 +453,20 @@ export async function listBonusContentPositions() {
 }
 
 // ---------- Introduction tree ----------
+/** The whole introduction tree in one query, each node with its videos (by order_index). */
+export async function getIntroTree() {
+  return invoke<Array<{
+    id: string;
+    node_key: string;
+    title: string;
+    pos_x: number;
+    pos_y: number;
+    width: number;
+    height: number;
+    videos: TreeVideo[];
+  }>>('GetIntroTree');
+}
+
 export async function listIntroTreeNodes() {
   return invoke<Array<{ id: string; node_key: string; title: string; pos_x: number; pos_y: number; width: number; height: number }>>(
     'ListIntroTreeNodes'
@@ -340,10 +494,7 @@ export async function deleteIntroTreeNode(nodeId: string) {
 }
 
 export async function listIntroTreeNodeVideos(nodeId: string) {
-  return invoke<Array<{ id: string; node_id: string; video_url: string; title: string; order_index: number }>>(
-    'ListIntroTreeNodeVideos',
-    { nodeId }
-  );
+  return invoke<TreeVideo[]>('ListIntroTreeNodeVideos', { nodeId });
 }
 
 export async function putIntroTreeNodeVideo(
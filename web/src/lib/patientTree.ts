@@ -0,0 +1,168 @@
+import type { PatientNode, UnlockableChild } from '@/components/PatientTreeView';
+import type { CatalogNode, CatalogEdge } from './catalog';
+import type { FrontierEntry } from './lambdaDataClient';
+
+/**
+ * Patient tree derivation shared by the /me server render and the client components.
+ * The catalog gives the tree's shape; the user's unlocked set and frontier give its unlock state,
+ * so an unlock response (UnlockDelta) can be applied in place without re-rendering the page.
+ */
+
+/** Returned by /api/unlock-node and /api/unlock-by-symptoms after a successful unlock. */
+export type UnlockDelta = {
+  unlocked: string[]; // nodes unlocked directly by the request
+  cascaded: string[]; // nodes unlocked afterwards through 'always' edges
+  frontier: FrontierEntry[]; // the user's complete frontier after both
+};
+
+type FrontierIndex = {
+  immediatelyUnlockable: Set<string>;
+  unlockDescriptions: Map<string, { description: string; type: string; value: unknown }>;
+  unlockableChildrenMap: Map<string, UnlockableChild[]>;
+};
+
+function indexFrontier(
+  frontier: FrontierEntry[],
+  nodeTitles: Map<string, string>,
+  symptomLabels: Record<string, string>
+): FrontierIndex {
+  const immediatelyUnlockable = new Set<string>();
+  const unlockDescriptions = new Map<string, { description: string; type: string; value: unknown }>();
+  const unlockableChildrenMap = new Map<string, UnlockableChild[]>();
+
+  [...frontier].sort((a, b) => b.weight - a.weight).forEach(entry => {
+    const childTitle = nodeTitles.get(entry.node_id);
+    immediatelyUnlockable.add(entry.node_id);
+    unlockDescriptions.set(entry.node_id, {
+      description: entry.description || 'This step can be unlocked now',
+      type: entry.unlock_type,
+      value: entry.unlock_value
+    });
+    if (childTitle === undefined) return;
+
+    // Extract symptoms from unlock_value
+    const symptoms: string[] = [];
+    if (entry.unlock_type === 'symptom_match' && entry.unlock_value) {
+      const rule = entry.unlock_value as { any?: string[]; all?: string[] };
+      symptoms.push(...(rule.any || []), ...(rule.all || []));
+    }
+
+    // Convert symptom keys to labels
+    const symptomNames = symptoms
+      .map(key => symptomLabels[key] || key)
+      .filter(Boolean);
+
+    if (!unlockableChildrenMap.has(entry.parent_id)) {
+      unlockableChildrenMap.set(entry.parent_id, []);
+    }
+    unlockableChildrenMap.get(entry.parent_id)!.push({
+      childId: entry.node_id,
+      childTitle,
+      symptoms: symptomNames,
+      unlockDescription: entry.description || `Unlock ${childTitle}`,
+      edge: {
+        id: entry.edge_id,
+        unlock_type: entry.unlock_type,
+        unlock_value: entry.unlock_value
+      }
+    });
+  });
+
+  return { immediatelyUnlockable, unlockDescriptions, unlockableChildrenMap };
+}
+
+function unlockState(nodeId: string, unlockedIds: Set<string>, index: FrontierIndex) {
+  const unlockInfo = index.unlockDescriptions.get(nodeId);
+  return {
+    isUnlocked: unlockedIds.has(nodeId),
+    isImmediatelyUnlockable: index.immediatelyUnlockable.has(nodeId),
+    unlockDescription: unlockInfo?.description || null,
+    unlockType: (unlockInfo?.type as 'always' | 'manual' | 'symptom_match') || null,
+    unlockValue: (unlockInfo?.value as Record<string, unknown>) || null,
+    unlockableChildren: index.unlockableChildrenMap.get(nodeId) || []
+  };
+}
+
+export function buildPatientTreeStructure(
+  nodes: CatalogNode[],
+  edges: CatalogEdge[],
+  unlockedIds: Set<string>,
+  frontier: FrontierEntry[],
+  symptomLabels: Record<string, string>
+): PatientNode[] {
+  const nodeMap = new Map(nodes.map(n => [n.id, n]));
+  const childrenMap = new Map<string, { node: CatalogNode; edge: CatalogEdge }[]>();
+
+  // Group edges by parent
+  edges.forEach(edge => {
+    const childNode = nodeMap.get(edge.child_id);
+    if (childNode) {
+      if (!childrenMap.has(edge.parent_id)) {
+        childrenMap.set(edge.parent_id, []);
+      }
+      childrenMap.get(edge.parent_id)!.push({ node: childNode, edge });
+    }
+  });
+
+  // Unlock state comes straight from the user's stored frontier
+  const index = indexFrontier(frontier, new Map(nodes.map(n => [n.id, n.title])), symptomLabels);
+
+  const rootNodes = nodes.filter(n => n.is_root);
+
+  function buildPatientNode(nodeId: string, depth: number = 0): PatientNode | null {
+    const node = nodeMap.get(nodeId);
+    if (!node) return null;
+
+    const nodeChildren = childrenMap.get(nodeId) || [];
+    nodeChildren.sort((a, b) => {
+      const weightA = a.edge.weight ?? 0;
+      const weightB = b.edge.weight ?? 0;
+      if (weightA !== weightB) return weightA - weightB;
+      return a.node.title.localeCompare(b.node.title);
+    });
+
+    const childNodes = nodeChildren
+      .map(({ node: childNode }) => buildPatientNode(childNode.id, depth + 1))
+      .filter((node): node is PatientNode => node !== null);
+
+    return {
+      id: node.id,
+      key: node.key,
+      title: node.title,
+      summary: node.summary,
+      is_root: node.is_root,
+      node_videos: node.node_videos || [],
+      node_categories: node.categories?.map(cat => ({ category: cat })) || [],
+      depth,
+      children: childNodes,
+      hasChildren: childNodes.length > 0,
+      ...unlockState(node.id, unlockedIds, index)
+    };
+  }
+
+  return rootNodes.map(root => buildPatientNode(root.id, 0)).filter((node): node is PatientNode => node !== null);
+}
+
+/** Re-derive the unlock fields of an already built tree from an unlock response. */
+export function applyUnlockDelta(
+  tree: PatientNode[],
+  delta: UnlockDelta,
+  symptomLabels: Record<string, string>
+): PatientNode[] {
+  const nodeTitles = new Map<string, string>();
+  const unlockedIds = new Set<string>([...delta.unlocked, ...delta.cascaded]);
+  const collect = (node: PatientNode) => {
+    nodeTitles.set(node.id, node.title);
+    if (node.isUnlocked) unlockedIds.add(node.id);
+    node.children.forEach(collect);
+  };
+  tree.forEach(collect);
+
+  const index = indexFrontier(delta.frontier, nodeTitles, symptomLabels);
+  const patch = (node: PatientNode): PatientNode => ({
+    ...node,
+    children: node.children.map(patch),
+    ...unlockState(node.id, unlockedIds, index)
+  });
+  return tree.map(patch);
+}
@@ -0,0 +1,57 @@
+import 'server-only';
+import { unstable_cache } from 'next/cache';
+import { extractVimeoId, getVimeoOEmbedUrl, type VimeoPoster } from './vimeoUtils';
+
+// Each lookup is bounded, and only a few run at once, so a large catalog cannot flood Vimeo into 429s
+const OEMBED_TIMEOUT_MS = 2000;
+const OEMBED_CONCURRENCY = 4;
+// Posters rarely change; found ones (and videos Vimeo says are gone) are kept this long per video
+const POSTER_REVALIDATE_SECONDS = 24 * 60 * 60;
+
+/**
+ * Look up one video's poster. Returns null when Vimeo has no poster for it (unknown or private video);
+ * throws on timeouts, rate limits and server errors so that the miss is not cached.
+ */
+async function fetchVimeoPoster(videoId: string): Promise<VimeoPoster | null> {
+  const res = await fetch(getVimeoOEmbedUrl(videoId), { signal: AbortSignal.timeout(OEMBED_TIMEOUT_MS) });
+  if (res.status === 403 || res.status === 404) return null;
+  if (!res.ok) throw new Error(`oEmbed returned ${res.status}`);
+  const data = (await res.json()) as { title?: string; thumbnail_url?: string; width?: number; height?: number };
+  return {
+    title: data.title ?? null,
+    thumbnail_url: data.thumbnail_url ?? null,
+    width: data.width ?? null,
+    height: data.height ?? null,
+  };
+}
+
+// Cached per video ID (the argument is part of the cache key); a thrown lookup is never stored
+const getVimeoPoster = unstable_cache(fetchVimeoPoster, ['vimeo-poster'], {
+  revalidate: POSTER_REVALIDATE_SECONDS,
+});
+
+/**
+ * Resolve poster metadata for every Vimeo video in the list, keyed by Vimeo ID.
+ * Videos that are not on Vimeo or whose lookup fails or times out are left out; the player facade
+ * falls back to a plain placeholder for those, and the next call looks them up again.
+ */
+export async function resolveVimeoPosters(videoUrls: string[]): Promise<Record<string, VimeoPoster>> {
+  const ids = Array.from(
+    new Set(videoUrls.map((url) => extractVimeoId(url)).filter((id): id is string => id !== null))
+  );
+  const posters: Record<string, VimeoPoster> = {};
+  let next = 0;
+  const worker = async () => {
+    while (next < ids.length) {
+      const id = ids[next++];
+      try {
+        const poster = await getVimeoPoster(id);
+        if (poster) posters[id] = poster;
+      } catch (err) {
+        console.warn(`[Vimeo] poster lookup failed for ${id}:`, err);
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(OEMBED_CONCURRENCY, ids.length) }, worker));
+  return posters;
+}
@@ -65,3 +65,33 @@ export function getVimeoEmbedUrl(videoId: string, options: {
   const queryString = params.toString();
   return `https://player.vimeo.com/video/${videoId}${queryString ? `?${queryString}` : ''}`;
 }
+
+/**
+ * Poster metadata for a Vimeo video, as resolved from Vimeo's oEmbed endpoint
+ */
+export type VimeoPoster = {
+  title: string | null;
+  thumbnail_url: string | null;
+  width: number | null;
+  height: number | null;
+};
+
+/**
+ * Generates the oEmbed metadata URL for a Vimeo video
+ */
+export function getVimeoOEmbedUrl(videoId: string, thumbnailWidth: number = 640): string {
+  const params = new URLSearchParams({
+    url: `https://vimeo.com/${videoId}`,
+    width: String(thumbnailWidth),
+  });
+  return `https://vimeo.com/api/oembed.json?${params.toString()}`;
+}
+
+/**
+ * Origins the embedded player talks to; worth preconnecting to just before a player is shown
+ */
+export const VIMEO_PLAYER_ORIGINS = [
+  'https://player.vimeo.com',
+  'https://i.vimeocdn.com',
+  'https://f.vimeocdn.com',
+] as const;